@@ -0,0 +1,2 @@
+# Racine du projet dans sys.path : les tests importent le paquet msrcpsp
+# sans installation (python -m pytest depuis la racine)
@@ -8,6 +8,9 @@
 #include <set>
 #include <map>
 #include <optional>
+#include <chrono>
+#include <fstream>
+#include <sstream>
 
 using namespace std;
 
@@ -149,7 +152,10 @@ vector<ScheduledTask> scheduleParallel(function<int(const string&)> prio) {
                         }));
             time = next;
         } else if (!remaining.empty()) {
-            time++;
+            // Rien en cours et rien n'a pu démarrer : l'état ne changera plus
+            cerr << "Aucune affectation possible pour les " << remaining.size()
+                 << " tâches restantes à t=" << time << endl;
+            break;
         }
     }
     return schedule;
@@ -219,8 +225,95 @@ void verifyAssignments(const vector<ScheduledTask>& schedule) {
     cout << "✔ Vérification terminée.\n";
 }
 
+// ----------- LECTURE D'UNE INSTANCE CSV -------------
+// Même format que msrcpsp (writers.write_csv / loaders.load_csv) : tâches
+// "name,duration,skills,predecessors,importance" (listes séparées par ';',
+// compétences "dev:2") et employés "name,skills" dans <nom>_employees.csv
+
+vector<string> splitCsvLine(const string& line) {
+    vector<string> fields;
+    string field;
+    bool quoted = false;
+    for (size_t i = 0; i < line.size(); ++i) {
+        char c = line[i];
+        if (quoted) {
+            if (c == '"' && i + 1 < line.size() && line[i + 1] == '"') field += line[++i];
+            else if (c == '"') quoted = false;
+            else field += c;
+        } else if (c == '"') quoted = true;
+        else if (c == ',') { fields.push_back(field); field.clear(); }
+        else if (c != '\r') field += c;
+    }
+    fields.push_back(field);
+    return fields;
+}
+
+vector<string> splitList(const string& text) {
+    vector<string> items;
+    stringstream ss(text);
+    string item;
+    while (getline(ss, item, ';'))
+        if (!item.empty()) items.push_back(item);
+    return items;
+}
+
+// Lignes du fichier sous forme colonne -> valeur ; faux si illisible
+bool readCsv(const string& path, vector<unordered_map<string, string>>& rows) {
+    ifstream f(path);
+    string line;
+    if (!f || !getline(f, line)) return false;
+    vector<string> header = splitCsvLine(line);
+    while (getline(f, line)) {
+        if (line.empty() || line == "\r") continue;
+        vector<string> fields = splitCsvLine(line);
+        unordered_map<string, string> row;
+        for (size_t k = 0; k < header.size() && k < fields.size(); ++k) row[header[k]] = fields[k];
+        rows.push_back(row);
+    }
+    return true;
+}
+
+bool loadCsv(const string& path) {
+    vector<unordered_map<string, string>> taskRows, employeeRows;
+    string stem = path.substr(0, path.rfind('.'));
+    if (!readCsv(path, taskRows) || !readCsv(stem + "_employees.csv", employeeRows)) return false;
+    tasks.clear();
+    employees.clear();
+    for (auto& row : taskRows) {
+        Task t{row["name"], stoi(row["duration"]), {}, splitList(row["predecessors"]),
+               row["importance"].empty() ? 0 : stoi(row["importance"])};
+        for (const auto& item : splitList(row["skills"])) {
+            size_t colon = item.find(':');
+            if (colon == string::npos) t.requiredSkills[item] = 1;
+            else t.requiredSkills[item.substr(0, colon)] = stoi(item.substr(colon + 1));
+        }
+        tasks[t.name] = t;
+    }
+    for (auto& row : employeeRows) {
+        Employee e{row["name"], {}};
+        for (const auto& skill : splitList(row["skills"])) e.skills.insert(skill);
+        employees[e.name] = e;
+    }
+    return true;
+}
+
+// Pic de mémoire résidente du processus (Kio, Linux), -1 si inconnu
+long peakRssKb() {
+    ifstream f("/proc/self/status");
+    string line;
+    while (getline(f, line))
+        if (line.rfind("VmHWM:", 0) == 0) return stol(line.substr(6));
+    return -1;
+}
+
 // Main
-int main() {
+// Sans argument : données intégrées, quatre priorités, deux algorithmes.
+// Avec un fichier : ./main instance.csv [--algo parallel|series]
+//   [--prio shortest|longest|importance|successors] [--quiet]
+// La dernière ligne donne le résultat et la durée de l'ordonnancement
+// (lecture du fichier non comprise) :
+//   RESULT tasks=<tâches planifiées> makespan=<makespan> seconds=<durée> peak_kb=<pic RSS>
+int main(int argc, char** argv) {
     vector<pair<string, function<int(const string&)>>> modes = {
         {"Durée la plus courte", prio_shortest},
         {"Durée la plus longue", prio_longest},
@@ -228,6 +321,43 @@ int main() {
         {"Successeurs", prio_successors}
     };
 
+    if (argc > 1) {
+        string algo = "parallel", prio = "shortest";
+        bool quiet = false;
+        for (int k = 2; k < argc; ++k) {
+            string arg = argv[k];
+            if (arg == "--algo" && k + 1 < argc) algo = argv[++k];
+            else if (arg == "--prio" && k + 1 < argc) prio = argv[++k];
+            else if (arg == "--quiet") quiet = true;
+        }
+        unordered_map<string, function<int(const string&)>> prios = {
+            {"shortest", prio_shortest}, {"longest", prio_longest},
+            {"importance", prio_importance}, {"successors", prio_successors}
+        };
+        if (!prios.count(prio) || (algo != "parallel" && algo != "series")) {
+            cerr << "Algorithme ou priorité inconnus : " << algo << " / " << prio << endl;
+            return 2;
+        }
+        if (!loadCsv(argv[1])) {
+            cerr << "Instance illisible : " << argv[1] << endl;
+            return 2;
+        }
+        auto t0 = chrono::steady_clock::now();
+        auto res = algo == "parallel" ? scheduleParallel(prios[prio]) : scheduleSeries(prios[prio]);
+        double seconds = chrono::duration<double>(chrono::steady_clock::now() - t0).count();
+        int makespan = 0;
+        for (const auto& s : res) makespan = max(makespan, s.end);
+        if (!quiet) {
+            printSchedule(res);
+            verifyAssignments(res);
+        }
+        cout << "RESULT tasks=" << res.size() << " makespan=" << makespan << " seconds=" << seconds;
+        long peak = peakRssKb();
+        if (peak >= 0) cout << " peak_kb=" << peak;
+        cout << endl;
+        return res.size() == tasks.size() ? 0 : 1;
+    }
+
     for (const auto& [label, f] : modes) {
         cout << "\n===============================\n" << endl;
         cout << "Ordonnancement PARALLÈLE : " << label << endl;
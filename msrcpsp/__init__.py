@@ -0,0 +1 @@
+# Paquet d'ordonnancement MS-RCPSP (moteur, affectation, instances).
@@ -0,0 +1,86 @@
+# ----------- AFFECTATION DES EMPLOYÉS (couplage biparti) -------------
+# Une tâche demande `n` employés par compétence et un employé ne couvre
+# qu'une compétence par tâche. On cherche un couplage entre les créneaux
+# (compétence, k) et les employés libres : une passe gloutonne remplit la
+# plupart des créneaux, puis des chemins augmentants (Kuhn) réaffectent
+# les employés quand le premier choix bloque une autre compétence.
+
+
+def iter_bits(mask):
+    # Indices des bits à 1 d'un entier, du plus faible au plus fort
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def match_skills(demand, candidates):
+    # demand     : [(compétence, nombre d'employés demandés), ...]
+    # candidates : masques (entiers) des employés libres possédant chaque
+    #              compétence demandée, dans le même ordre ; bit i = employé i
+    # Renvoie la liste alignée des indices d'employés retenus, ou None
+    slots = []
+    for j, (_, needed) in enumerate(demand):
+        if candidates[j].bit_count() < needed:
+            return None
+        slots.extend([j] * needed)
+
+    owner = {}              # employé -> indice du créneau occupé
+    filled = [None] * len(slots)
+    used = 0
+    unfilled = []
+    for k, j in enumerate(slots):
+        avail = candidates[j] & ~used
+        if avail:
+            low = avail & -avail
+            e = low.bit_length() - 1
+            used |= low
+            owner[e] = k
+            filled[k] = e
+        else:
+            unfilled.append(k)
+
+    seen = 0
+
+    def augment(k):
+        nonlocal seen
+        m = candidates[slots[k]] & ~seen
+        while m:
+            low = m & -m
+            seen |= low
+            e = low.bit_length() - 1
+            if e not in owner or augment(owner[e]):
+                owner[e] = k
+                filled[k] = e
+                return True
+            m &= ~seen
+        return False
+
+    for k in unfilled:
+        seen = 0
+        if not augment(k):
+            return None
+
+    assigned = [[] for _ in demand]
+    for k, j in enumerate(slots):
+        assigned[j].append(filled[k])
+    return assigned
+
+
+def assign_employees_greedy(task_skills, busy_emps, employees):
+    # Ancienne affectation "premier trouvé", gardée pour le banc d'essai :
+    # elle peut échouer alors qu'une affectation existe
+    assigned = {}
+    available = [e for e in employees if e['name'] not in busy_emps]
+
+    for skill, needed in task_skills.items():
+        assigned[skill] = []
+        candidates = [e for e in available if skill in e['skills']]
+        for c in candidates:
+            # Vérifie que cet employé n'est pas déjà affecté à une compétence dans cette tâche
+            if len(assigned[skill]) < needed and c['name'] not in sum(assigned.values(), []):
+                assigned[skill].append(c['name'])
+
+    if all(len(assigned[s]) >= task_skills[s] for s in task_skills):
+        return assigned
+    return None  # Pas assez d'employés disponibles
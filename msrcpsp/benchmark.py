@@ -0,0 +1,273 @@
+# ----------- BANC D'ESSAI -------------
+# Lancement :
+#   python -m msrcpsp.benchmark assignment          # glouton vs couplage
+#   python -m msrcpsp.benchmark rules [instances]   # algorithme x priorité
+#   python -m msrcpsp.benchmark scaling             # durée selon la taille
+#   python -m msrcpsp.benchmark scaling --generate --sizes 1000 10000 100000
+#   python -m msrcpsp.benchmark native [instances]  # Python vs C++ : parité, accélération
+#   python -m msrcpsp.benchmark native --generate --sizes 1000 10000
+#
+# Les mesures utilisent time.perf_counter_ns, avec tours d'échauffement et
+# répétitions, ramasse-miettes coupé pendant la mesure (comme timeit) ; on
+# rapporte minimum, médiane et écart interquartile.
+
+import argparse
+import csv
+import functools
+import gc
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+from msrcpsp.assignment import assign_employees_greedy
+from msrcpsp.generator import generate
+from msrcpsp.instance import InstanceBuilder
+from msrcpsp.loaders import load_instance
+from msrcpsp.pool import EmployeePool
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms
+
+DEFAULT_INSTANCE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'instances', 'assurance.json')
+
+# ----------- MESURE -------------
+
+
+def measure(func, repeats=20, warmup=3):
+    # Renvoie les durées (ns) des `repeats` appels après `warmup` appels à vide
+    for _ in range(warmup):
+        func()
+    samples = []
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            t0 = time.perf_counter_ns()
+            func()
+            samples.append(time.perf_counter_ns() - t0)
+    finally:
+        gc.enable()
+    return samples
+
+
+def summarize(samples):
+    if len(samples) > 1:
+        q1, median, q3 = statistics.quantiles(samples, n=4)
+    else:
+        q1 = median = q3 = samples[0]
+    return {
+        'min_ns': min(samples),
+        'median_ns': median,
+        'iqr_ns': q3 - q1,
+        'repeats': len(samples),
+    }
+
+
+# ----------- AFFECTATION : GLOUTON VS COUPLAGE -------------
+
+
+def random_staff(n_employees, n_skills, skills_per_employee, seed=0):
+    rng = random.Random(seed)
+    skills = [f"s{k}" for k in range(n_skills)]
+    return [
+        {'name': f"e{i}", 'skills': rng.sample(skills, skills_per_employee)}
+        for i in range(n_employees)
+    ], skills
+
+
+def bench_assignment(n_employees=2000, n_skills=20, skills_per_employee=3,
+                     n_queries=500, busy_ratio=0.5, max_demand=4, seed=0):
+    # Compare l'affectation gloutonne historique et le couplage biparti du
+    # réservoir sur les mêmes demandes (compétences demandées, employés
+    # occupés tirés au hasard)
+    employees, skills = random_staff(n_employees, n_skills, skills_per_employee, seed)
+    pool = EmployeePool(employees)
+    rng = random.Random(seed + 1)
+    names = [e['name'] for e in employees]
+    queries = []
+    for _ in range(n_queries):
+        demand = {s: rng.randint(1, max_demand) for s in rng.sample(skills, rng.randint(1, 3))}
+        busy = set(rng.sample(names, int(busy_ratio * n_employees)))
+        queries.append((demand, busy, pool.mask_of(pool.bit[n] for n in names if n not in busy)))
+
+    results = {}
+    for label, func in [
+        ('greedy', lambda d, b, free: assign_employees_greedy(d, b, employees)),
+        ('matching', lambda d, b, free: pool.assign(pool.demand_of(d), free)),
+    ]:
+        gc.disable()
+        try:
+            t0 = time.perf_counter_ns()
+            answers = [func(d, b, free) for d, b, free in queries]
+            elapsed = (time.perf_counter_ns() - t0) / 1e9
+        finally:
+            gc.enable()
+        results[label] = (elapsed, answers)
+        found = sum(a is not None for a in answers)
+        print(f"[{label}] {n_queries} affectations, {found} réussies, "
+              f"{1e3 * elapsed / n_queries:.3f} ms/appel")
+
+    missed = sum(g is None and m is not None
+                 for g, m in zip(results['greedy'][1], results['matching'][1]))
+    print(f"Affectations possibles manquées par la version gloutonne : {missed}")
+    return results
+
+# ----------- ALGORITHMES x PRIORITÉS -------------
+
+
+def bench_rules(instances, algos=None, prios=None, repeats=20, warmup=3):
+    rows = []
+    for inst in instances:
+        for algo in (algos or list(algorithms)):
+            for prio in (prios or list(priorities)):
+                run = functools.partial(algorithms[algo], inst, priorities[prio])
+                makespan = run()[1]
+                stats = summarize(measure(run, repeats, warmup))
+                rows.append({'instance': inst.name, 'n_tasks': len(inst), 'algo': algo,
+                             'priority': prio, 'makespan': makespan, **stats})
+                print(f"[{inst.name} - {algo} - {prio}] n={len(inst)} "
+                      f"médiane {stats['median_ns'] / 1e6:.3f} ms, "
+                      f"IQR {stats['iqr_ns'] / 1e6:.3f} ms, min {stats['min_ns'] / 1e6:.3f} ms")
+    return rows
+
+# ----------- PASSAGE À L'ÉCHELLE -------------
+
+
+def replicate(inst, copies):
+    # `copies` exemplaires indépendants du projet et de l'équipe : la taille
+    # grandit, la structure du problème reste la même
+    builder = InstanceBuilder(f"{inst.name}x{copies}")
+    for c in range(copies):
+        for i, name in enumerate(inst.names):
+            builder.add_task(f"{name}#{c}", inst.durations[i], inst.skills(i),
+                             [f"{inst.names[p]}#{c}" for p in inst.predecessors(i)],
+                             inst.importance[i])
+        for emp in inst.employees:
+            builder.add_employee(f"{emp['name']}#{c}", emp['skills'])
+    return builder.build()
+
+
+def growth_exponent(rows):
+    # Pente log(durée médiane) / log(n) entre la plus petite et la plus
+    # grande taille, par couple algorithme / priorité : ~1 linéaire,
+    # ~2 quadratique
+    exponents = {}
+    for key in dict.fromkeys((r['algo'], r['priority']) for r in rows):
+        pts = sorted((r['n_tasks'], r['median_ns']) for r in rows if (r['algo'], r['priority']) == key)
+        (n0, t0), (n1, t1) = pts[0], pts[-1]
+        if n1 > n0 and t0 > 0:
+            exponents[key] = math.log(t1 / t0) / math.log(n1 / n0)
+    return exponents
+
+
+def bench_scaling(base=None, sizes=(1, 4, 16, 64, 256), algos=None, prios=None,
+                  repeats=5, warmup=1, generated=False, seed=0):
+    # generated=False : `sizes` = nombre de copies de l'instance de base
+    # generated=True  : `sizes` = nombre de tâches d'instances générées
+    if generated:
+        instances = [generate(n, seed=seed) for n in sizes]
+    else:
+        base = base or load_instance(DEFAULT_INSTANCE)
+        instances = [replicate(base, k) for k in sizes]
+    rows = bench_rules(instances, algos, prios, repeats, warmup)
+    for (algo, prio), exp in growth_exponent(rows).items():
+        print(f"[{algo} - {prio}] durée ~ n^{exp:.2f}")
+    return rows
+
+
+# ----------- MOTEUR PYTHON VS MOTEUR NATIF -------------
+
+
+def bench_native(instances, algos=('parallel', 'series'), prios=None, repeats=5, warmup=1):
+    # Parité : mêmes plannings (tâches, dates, employés) et mêmes makespans
+    # pour le moteur Python et le moteur C++ (msrcpsp.native), sur chaque
+    # couple algorithme / priorité ; accélération = médiane Python / médiane
+    # native, conversion des résultats en planning comprise
+    from msrcpsp import native
+
+    rows = []
+    for inst in instances:
+        for algo in algos:
+            for prio in (prios or list(priorities)):
+                python_run = functools.partial(algorithms[algo], inst, priorities[prio])
+                native_run = functools.partial(native.algorithms[f"native_{algo}"], inst, priorities[prio])
+                sched, makespan = python_run()
+                native_sched, native_makespan = native_run()
+                identical = sched == native_sched and makespan == native_makespan
+                python_ns = statistics.median(measure(python_run, repeats, warmup))
+                native_ns = statistics.median(measure(native_run, repeats, warmup))
+                rows.append({'instance': inst.name, 'n_tasks': len(inst), 'algo': algo, 'priority': prio,
+                             'makespan': makespan, 'native_makespan': native_makespan,
+                             'identical': identical, 'python_median_ns': python_ns,
+                             'native_median_ns': native_ns, 'speedup': python_ns / native_ns})
+                print(f"[{inst.name} - {algo} - {prio}] n={len(inst)} "
+                      f"{'identiques' if identical else 'DIFFÉRENTS'}, makespan {makespan} / {native_makespan}, "
+                      f"Python {python_ns / 1e6:.3f} ms, natif {native_ns / 1e6:.3f} ms, "
+                      f"x{python_ns / native_ns:.1f}")
+    different = [r for r in rows if not r['identical']]
+    print(f"Parité : {len(rows) - len(different)}/{len(rows)} plannings identiques")
+    return rows
+
+
+def write_rows(rows, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+# ----------- LANCEMENT -------------
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banc d'essai MS-RCPSP")
+    sub = parser.add_subparsers(dest='mode')
+    sub.add_parser('assignment', help="affectation gloutonne vs couplage biparti")
+    rules = sub.add_parser('rules', help="durée de chaque couple algorithme / priorité")
+    rules.add_argument('instances', nargs='*', default=[DEFAULT_INSTANCE])
+    scaling = sub.add_parser('scaling', help="durée selon la taille de l'instance")
+    scaling.add_argument('--sizes', type=int, nargs='+', default=None,
+                         help="nombre de copies de l'instance de base, ou de tâches avec --generate")
+    scaling.add_argument('--generate', action='store_true',
+                         help="instances générées (msrcpsp.generator) au lieu de copies")
+    scaling.add_argument('--seed', type=int, default=0)
+    native = sub.add_parser('native', help="moteur Python vs C++ : parité et accélération")
+    native.add_argument('instances', nargs='*', default=[DEFAULT_INSTANCE])
+    native.add_argument('--generate', action='store_true',
+                        help="instances générées de --sizes tâches au lieu des fichiers")
+    native.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    native.add_argument('--seed', type=int, default=0)
+    for p in (rules, scaling, native):
+        p.add_argument('--algo', nargs='+', default=None, choices=list(algorithms))
+        p.add_argument('--priority', nargs='+', default=None, choices=list(priorities))
+        p.add_argument('--repeats', type=int, default=None)
+        p.add_argument('--warmup', type=int, default=None)
+        p.add_argument('--csv', default=None, help="fichier CSV des mesures")
+    args = parser.parse_args()
+
+    if args.mode in (None, 'assignment'):
+        bench_assignment()
+    else:
+        failed = False
+        options = {k: v for k, v in [('repeats', args.repeats), ('warmup', args.warmup)] if v is not None}
+        if args.mode == 'rules':
+            rows = bench_rules([load_instance(p) for p in args.instances],
+                               args.algo, args.priority, **options)
+        elif args.mode == 'native':
+            if args.generate:
+                instances = [generate(n, seed=args.seed) for n in args.sizes]
+            else:
+                instances = [load_instance(p) for p in args.instances]
+            rows = bench_native(instances, args.algo or list(algorithms), args.priority, **options)
+            if not all(r['identical'] for r in rows):
+                failed = True
+        else:
+            sizes = args.sizes or ([100, 1000, 10000] if args.generate else [1, 4, 16, 64, 256])
+            rows = bench_scaling(sizes=sizes, algos=args.algo, prios=args.priority,
+                                 generated=args.generate, seed=args.seed, **options)
+        if args.csv:
+            write_rows(rows, args.csv)
+        if failed:
+            # Plannings différents entre les moteurs Python et C++ : échec
+            sys.exit(1)
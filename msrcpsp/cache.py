@@ -0,0 +1,126 @@
+# ----------- CACHE DES PLANNINGS -------------
+# Un planning ne dépend que du contenu de l'instance, de l'algorithme et de
+# la règle de priorité : la clé est l'empreinte de l'instance
+# (Instance.fingerprint) suivie de l'algorithme et de la règle. Modifier
+# une tâche, une précédence ou un employé change l'empreinte, donc la clé :
+# rien à invalider à la main.
+#
+# Deux niveaux :
+#   - en mémoire : les `memory_items` derniers plannings (LRU) ;
+#   - sur disque (SQLite, facultatif) : partagé entre processus et entre
+#     lancements, borné en octets ; au-delà de `max_bytes`, les entrées les
+#     moins récemment lues sont supprimées. La taille totale est tenue à
+#     jour dans la table meta, dans la même transaction que chaque écriture.
+# Une valeur est le triplet (planning, makespan, durée du calcul d'origine).
+
+import os
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+
+CACHE_VERSION = 2    # à incrémenter quand un algorithme change de résultat
+
+
+def schedule_key(inst, algo, prio):
+    return f"v{CACHE_VERSION}:{inst.fingerprint}:{algo}:{prio}"
+
+
+class ScheduleCache:
+
+    def __init__(self, path=None, memory_items=256, max_bytes=256 * 2 ** 20):
+        # path : fichier SQLite du niveau disque (None = mémoire seule)
+        self.path = path
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        self.hits = self.misses = 0
+        self.db = None
+        if path is not None:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS schedules ("
+                            "key TEXT PRIMARY KEY, value BLOB, size INTEGER, used REAL)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS schedules_used ON schedules (used)")
+            # Taille totale des entrées ; calculée une fois pour une base
+            # créée avant la table meta
+            self.db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+            self.db.execute("INSERT OR IGNORE INTO meta "
+                            "SELECT 'bytes', COALESCE(SUM(size), 0) FROM schedules")
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return value
+        if self.db is not None:
+            row = self.db.execute("SELECT value FROM schedules WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.db.execute("UPDATE schedules SET used = ? WHERE key = ?", (time.time(), key))
+                value = pickle.loads(row[0])
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.db is not None:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.db.execute("SELECT size FROM schedules WHERE key = ?", (key,)).fetchone()
+                self.db.execute("INSERT OR REPLACE INTO schedules VALUES (?, ?, ?, ?)",
+                                (key, blob, len(blob), time.time()))
+                total = self._add_bytes(len(blob) - (row[0] if row else 0))
+                if total > self.max_bytes:
+                    self._evict(total)
+                self.db.execute("COMMIT")
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def _add_bytes(self, delta):
+        self.db.execute("UPDATE meta SET value = value + ? WHERE name = 'bytes'", (delta,))
+        return self.db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+    def _evict(self, total):
+        # Supprime les entrées les moins récemment lues jusqu'à repasser
+        # sous max_bytes (dans la transaction de put)
+        doomed = []
+        freed = 0
+        for key, size in self.db.execute("SELECT key, size FROM schedules ORDER BY used"):
+            doomed.append((key,))
+            freed += size
+            if total - freed <= self.max_bytes:
+                break
+        self.db.executemany("DELETE FROM schedules WHERE key = ?", doomed)
+        self._add_bytes(-freed)
+
+    def schedule(self, inst, algo, prio, compute):
+        # Planning en cache, sinon compute() -> (planning, makespan), mesuré
+        # et rangé ; renvoie (planning, makespan, durée du calcul, trouvé ?)
+        key = schedule_key(inst, algo, prio)
+        value = self.get(key)
+        if value is not None:
+            return (*value, True)
+        start_time = time.perf_counter()
+        sched, makespan = compute()
+        value = (sched, makespan, time.perf_counter() - start_time)
+        self.put(key, value)
+        return (*value, False)
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
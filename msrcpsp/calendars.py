@@ -0,0 +1,154 @@
+# ----------- CALENDRIERS DES EMPLOYÉS -------------
+# Chaque employé peut avoir des plages de disponibilité (équipes, congés,
+# temps partiel) : liste d'intervalles [début, fin), fin None = sans fin.
+# Un employé sans calendrier est toujours disponible.
+#
+# Les plages d'un employé sont fusionnées et gardées triées : « couvre-t-il
+# [t, t + d) ? » se résout par une recherche dichotomique en O(log k),
+# k = nombre de plages, au lieu de parcourir son calendrier. Les instants
+# où une disponibilité change (débuts et fins de toutes les plages) sont
+# rangés dans un seul tableau trié : le moteur y trouve le prochain réveil
+# (voir run_parallel, paramètre `wake`).
+#
+# L'horloge du moteur ne reculant pas, Calendar.sweep() balaie les plages
+# dans l'ordre de leurs débuts : les employés présents sont regroupés par
+# fin de leur plage courante, avec le masque cumulé des fins >= f, si bien
+# que « quels employés couvrent [t, t + d) ? » devient une recherche
+# dichotomique sur ces fins, quel que soit le nombre d'employés.
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from msrcpsp.assignment import iter_bits
+
+FOREVER = 2 ** 62     # fin d'une plage sans fin
+
+
+class Availability:
+    # Plages disjointes et triées d'un employé
+
+    def __init__(self, intervals):
+        self.starts = array('q')
+        self.ends = array('q')
+        for start, end in sorted((s, FOREVER if e is None else e) for s, e in intervals):
+            if end <= start:
+                continue
+            if self.ends and start <= self.ends[-1]:
+                # Plages qui se touchent ou se chevauchent : on fusionne
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def covers(self, start, end):
+        # Disponible sur tout [start, end) ?
+        j = bisect_right(self.starts, start) - 1
+        return j >= 0 and self.ends[j] >= end
+
+    def gaps(self):
+        # Complément des plages sur [0, FOREVER) : périodes d'absence
+        t = 0
+        for start, end in zip(self.starts, self.ends):
+            if start > t:
+                yield t, start
+            t = end
+        if t < FOREVER:
+            yield t, FOREVER
+
+
+class Calendar:
+    # Calendriers d'une équipe, alignés sur les bits du réservoir d'employés
+
+    def __init__(self, windows):
+        # windows : une Availability par employé, ou None (toujours disponible)
+        self.windows = windows
+        self.always = 0
+        changes = set()
+        for e, w in enumerate(windows):
+            if w is None:
+                self.always |= 1 << e
+            else:
+                changes.update(w.starts)
+                changes.update(t for t in w.ends if t < FOREVER)
+        self.changes = array('q', sorted(changes))
+        self._plan = None
+
+    @classmethod
+    def from_employees(cls, employees):
+        # None si personne n'a de calendrier (cas historique)
+        if not any(emp.get('availability') is not None for emp in employees):
+            return None
+        return cls([None if emp.get('availability') is None else Availability(emp['availability'])
+                    for emp in employees])
+
+    def permuted(self, order):
+        # Même permutation des employés que EmployeePool.permuted
+        return Calendar([self.windows[e] for e in order])
+
+    def available(self, candidates, start, end):
+        # Masque des employés de `candidates` disponibles sur tout [start, end) :
+        # une recherche dichotomique par employé à calendrier
+        mask = candidates & self.always
+        windows = self.windows
+        for e in iter_bits(candidates & ~self.always):
+            if windows[e].covers(start, end):
+                mask |= 1 << e
+        return mask
+
+    def next_change(self, time):
+        # Prochain instant > time où une disponibilité commence ou finit
+        j = bisect_right(self.changes, time)
+        return self.changes[j] if j < len(self.changes) else None
+
+    def sweep(self):
+        # Index à instants croissants pour le moteur ; toutes les plages,
+        # triées par début, ne sont rangées qu'une fois par calendrier
+        if self._plan is None:
+            self._plan = sorted((start, end, e) for e, w in enumerate(self.windows) if w is not None
+                                for start, end in zip(w.starts, w.ends))
+        return Sweep(self, self._plan)
+
+
+class Sweep:
+    # Employés présents à l'instant courant, regroupés par fin de plage
+
+    def __init__(self, calendar, plan):
+        self.always = calendar.always
+        self.plan = plan
+        self.next = 0           # prochaine plage à ouvrir
+        self.time = None
+        self.by_end = {}        # fin de plage -> masque des employés présents
+        self.ends = []          # fins triées
+        self.covering = []      # covering[k] : employés dont la fin >= ends[k]
+
+    def _advance(self, time):
+        plan, k = self.plan, self.next
+        changed = False
+        while k < len(plan) and plan[k][0] <= time:
+            _, end, e = plan[k]
+            if end > time:
+                self.by_end[end] = self.by_end.get(end, 0) | 1 << e
+                changed = True
+            k += 1
+        self.next = k
+        if changed or self.ends and self.ends[0] < time:
+            self.by_end = {end: m for end, m in self.by_end.items() if end >= time}
+            self.ends = sorted(self.by_end)
+            covering = [0] * len(self.ends)
+            mask = 0
+            for j in range(len(self.ends) - 1, -1, -1):
+                mask |= self.by_end[self.ends[j]]
+                covering[j] = mask
+            self.covering = covering
+        self.time = time
+
+    def available(self, candidates, start, end):
+        # Masque des employés de `candidates` disponibles sur tout
+        # [start, end) ; `start` ne décroît pas d'un appel à l'autre
+        if start != self.time:
+            self._advance(start)
+        j = bisect_left(self.ends, end)
+        mask = self.always
+        if j < len(self.ends):
+            mask |= self.covering[j]
+        return candidates & mask
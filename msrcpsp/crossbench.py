@@ -0,0 +1,274 @@
+# ----------- BANC D'ESSAI PYTHON VS C++ -------------
+# Mêmes instances générées (msrcpsp.generator), de taille croissante,
+# écrites une fois au format CSV commun (msrcpsp.writers.write_csv, lu par
+# main.cpp et par msrcpsp.loaders), puis planifiées par chaque
+# implémentation dans un processus séparé :
+#   - python : msrcpsp.schedulers (schedule_parallel / schedule_series) ;
+#   - native : les mêmes algorithmes en C++ par ctypes (msrcpsp.native) ;
+#   - cpp    : l'ancien programme main.cpp (scheduleParallel / scheduleSeries),
+#              compilé avec g++ -O2.
+# Pour chaque lancement : durée totale du processus (lecture comprise),
+# durée de l'ordonnancement seul (mesurée par le programme), pic de
+# mémoire résidente (ru_maxrss du processus fils) et makespan. Une
+# implémentation qui dépasse le délai ou échoue n'est plus lancée sur les
+# tailles suivantes : le rapport indique où chacune décroche.
+#
+# Lancement :
+#   python -m msrcpsp.crossbench --sizes 100 1000 5000 20000 --timeout 300 \
+#       --csv figures/cross_scaling.csv --report figures/cross_scaling.md
+
+import argparse
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from msrcpsp.benchmark import write_rows
+from msrcpsp.generator import generate
+from msrcpsp.writers import write_csv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_CPP = os.path.join(ROOT, 'main.cpp')
+IMPLEMENTATIONS = ('python', 'native', 'cpp')
+# Règles de priorité communes : nom Python -> nom dans main.cpp
+PRIORITIES = {
+    'shortest': 'shortest',
+    'longest': 'longest',
+    'important': 'importance',
+    'most_successors': 'successors',
+}
+
+# ----------- PROCESSUS FILS -------------
+
+
+def peak_rss_kb():
+    # Pic de mémoire résidente de ce processus depuis son exec (VmHWM,
+    # Linux), None ailleurs ; ru_maxrss compterait aussi la mémoire du
+    # processus parent avant l'exec
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def child(path, impl, algo, prio):
+    # Planifie une instance dans ce processus et écrit la même ligne de
+    # résultat que main.cpp
+    from msrcpsp.loaders import load_instance
+    from msrcpsp.priorities import priorities
+    from msrcpsp.runner import algorithm
+
+    inst = load_instance(path)
+    func = algorithm(algo if impl == 'python' else f"native_{algo}")
+    start_time = time.perf_counter()
+    sched, makespan = func(inst, priorities[prio])
+    seconds = time.perf_counter() - start_time
+    peak = peak_rss_kb()
+    print(f"RESULT tasks={len(sched)} makespan={makespan} seconds={seconds}"
+          + ('' if peak is None else f" peak_kb={peak}"))
+
+
+def build_cpp(out_dir):
+    binary = os.path.join(out_dir, 'main_bench')
+    subprocess.run([os.environ.get('CXX', 'g++'), '-O2', '-std=c++17', MAIN_CPP, '-o', binary],
+                   check=True, capture_output=True, text=True)
+    return binary
+
+
+def command(impl, path, algo, prio, binary=None):
+    if impl == 'cpp':
+        return [binary, path, '--algo', algo, '--prio', PRIORITIES[prio], '--quiet']
+    return [sys.executable, '-m', 'msrcpsp.crossbench', 'child', path,
+            '--impl', impl, '--algo', algo, '--priority', prio]
+
+
+def run_process(cmd, timeout):
+    # Lance `cmd`, tué au bout de `timeout` secondes ; renvoie statut, durée
+    # totale, pic de mémoire (Mo : celui que rapporte le programme, sinon
+    # ru_maxrss du fils) et ligne RESULT décodée
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    killed = threading.Event()
+
+    def kill():
+        killed.set()
+        proc.kill()
+
+    start_time = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        out = proc.stdout.read()
+        if hasattr(os, 'wait4'):
+            # Ressources de ce seul fils (ru_maxrss en Kio sous Linux)
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            peak_mb = usage.ru_maxrss / 1024
+        else:
+            proc.wait()
+            peak_mb = None
+        wall = time.perf_counter() - start_time
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    result = {}
+    for line in out.splitlines():
+        if line.startswith('RESULT '):
+            result = dict(item.split('=', 1) for item in line.split()[1:])
+    if 'peak_kb' in result:
+        peak_mb = int(result['peak_kb']) / 1024
+    if killed.is_set():
+        status = 'timeout'
+    elif proc.returncode != 0 and not result:
+        status = 'error'
+        print(out.strip()[-500:], file=sys.stderr)
+    else:
+        status = 'ok'
+    return status, wall, peak_mb, result
+
+# ----------- MESURES -------------
+
+
+def bench_cross(sizes=(100, 1000, 5000), impls=IMPLEMENTATIONS, algo='parallel', prio='shortest',
+                repeats=3, timeout=300, seed=0, work_dir=None):
+    # Renvoie une ligne par (taille, implémentation) : médianes des durées,
+    # pic de mémoire maximal, makespan et statut (ok, timeout, error,
+    # skipped après un décrochage)
+    work_dir = work_dir or tempfile.mkdtemp(prefix='msrcpsp_cross_')
+    os.makedirs(work_dir, exist_ok=True)
+    binary = build_cpp(work_dir) if 'cpp' in impls else None
+    if 'native' in impls:
+        from msrcpsp.native import load
+        load()      # compilation éventuelle hors mesure
+    broken = {}
+    rows = []
+    for n in sizes:
+        path = os.path.join(work_dir, f"gen_{n}_s{seed}.csv")
+        inst = generate(n, seed=seed)
+        write_csv(inst, path)
+        for impl in impls:
+            row = {'n_tasks': len(inst), 'impl': impl, 'algo': algo, 'priority': prio,
+                   'status': 'skipped', 'scheduled': None, 'makespan': None, 'wall_sec': None,
+                   'schedule_sec': None, 'peak_rss_mb': None}
+            if impl in broken:
+                rows.append(row)
+                continue
+            walls, scheds, peaks = [], [], []
+            for _ in range(repeats):
+                status, wall, peak_mb, result = run_process(command(impl, path, algo, prio, binary), timeout)
+                if status != 'ok':
+                    break
+                walls.append(wall)
+                scheds.append(float(result['seconds']))
+                peaks.append(peak_mb)
+                row['scheduled'] = int(result['tasks'])
+                row['makespan'] = int(result['makespan'])
+            row['status'] = status
+            if walls:
+                row['wall_sec'] = statistics.median(walls)
+                row['schedule_sec'] = statistics.median(scheds)
+                row['peak_rss_mb'] = None if peaks[0] is None else max(peaks)
+            if status != 'ok':
+                broken[impl] = n
+            elif row['scheduled'] != len(inst):
+                # main.cpp s'arrête si son affectation « premier trouvé » bloque
+                row['status'] = 'incomplete'
+            print(f"[n={len(inst)} - {impl}] {row['status']}, "
+                  + ('' if row['wall_sec'] is None else
+                     f"total {row['wall_sec']:.3f} s, ordonnancement {row['schedule_sec']:.3f} s, "
+                     f"makespan {row['makespan']}, ")
+                  + ('' if row['peak_rss_mb'] is None else f"pic RSS {row['peak_rss_mb']:.1f} Mo"))
+            rows.append(row)
+    return rows
+
+# ----------- RAPPORT -------------
+
+
+def _exponent(n0, t0, n1, t1):
+    if n1 > n0 and t0 and t1:
+        return math.log(t1 / t0) / math.log(n1 / n0)
+    return None
+
+
+def _cell(value, fmt):
+    return '—' if value is None else format(value, fmt)
+
+
+def scaling_report(rows):
+    # Rapport Markdown : un tableau par implémentation (durées, mémoire,
+    # makespan, exposant apparent entre deux tailles successives), écart de
+    # makespan à la version Python et taille où chaque implémentation décroche
+    lines = [f"# Passage à l'échelle : {', '.join(dict.fromkeys(r['impl'] for r in rows))}", '']
+    reference = {r['n_tasks']: r['makespan'] for r in rows if r['impl'] == 'python' and r['status'] == 'ok'}
+    for impl in dict.fromkeys(r['impl'] for r in rows):
+        mine = [r for r in rows if r['impl'] == impl]
+        lines += [f"## {impl} ({mine[0]['algo']}, {mine[0]['priority']})", '',
+                  "| tâches | statut | total (s) | ordonnancement (s) | exposant | pic RSS (Mo) "
+                  "| makespan | écart / python |",
+                  "|---:|:---|---:|---:|---:|---:|---:|---:|"]
+        previous = None
+        for r in mine:
+            exponent = None
+            if previous is not None and r['schedule_sec'] is not None:
+                exponent = _exponent(previous['n_tasks'], previous['schedule_sec'],
+                                     r['n_tasks'], r['schedule_sec'])
+            gap = None
+            if r['makespan'] is not None and reference.get(r['n_tasks']):
+                gap = 100 * (r['makespan'] - reference[r['n_tasks']]) / reference[r['n_tasks']]
+            lines.append(f"| {r['n_tasks']} | {r['status']} | {_cell(r['wall_sec'], '.3f')} "
+                         f"| {_cell(r['schedule_sec'], '.4f')} | {_cell(exponent, '.2f')} "
+                         f"| {_cell(r['peak_rss_mb'], '.1f')} | {_cell(r['makespan'], 'd')} "
+                         f"| {_cell(gap, '+.1f')}{'' if gap is None else ' %'} |")
+            if r['schedule_sec'] is not None:
+                previous = r
+        failed = next((r for r in mine if r['status'] not in ('ok', 'skipped')), None)
+        lines.append('')
+        lines.append(f"Décroche à n={failed['n_tasks']} ({failed['status']})." if failed
+                     else "Toutes les tailles passent.")
+        lines.append('')
+    return '\n'.join(lines)
+
+# ----------- LANCEMENT -------------
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banc d'essai MS-RCPSP : Python vs C++")
+    sub = parser.add_subparsers(dest='mode')
+    run = sub.add_parser('child', help="(interne) une mesure dans ce processus")
+    run.add_argument('path')
+    run.add_argument('--impl', choices=['python', 'native'], default='python')
+    run.add_argument('--algo', choices=['parallel', 'series'], default='parallel')
+    run.add_argument('--priority', choices=list(PRIORITIES), default='shortest')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--impl', nargs='+', choices=IMPLEMENTATIONS, default=list(IMPLEMENTATIONS))
+    parser.add_argument('--algo', choices=['parallel', 'series'], default='parallel')
+    parser.add_argument('--priority', choices=list(PRIORITIES), default='shortest',
+                        help="règle commune aux deux implémentations")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=300, help="délai par lancement (s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dir', default=None, help="dossier des instances CSV et du binaire")
+    parser.add_argument('--csv', default=None, help="fichier CSV des mesures")
+    parser.add_argument('--report', default=None, help="rapport Markdown")
+    args = parser.parse_args()
+
+    if args.mode == 'child':
+        child(args.path, args.impl, args.algo, args.priority)
+    else:
+        rows = bench_cross(args.sizes, args.impl, args.algo, args.priority, args.repeats,
+                           args.timeout, args.seed, args.dir)
+        report = scaling_report(rows)
+        print(report)
+        if args.csv:
+            write_rows(rows, args.csv)
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                f.write(report + '\n')
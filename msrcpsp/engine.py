@@ -0,0 +1,152 @@
+# ----------- MOTEUR ÉVÉNEMENTIEL (ordonnancement parallèle) -------------
+# Les tâches en cours sont gardées dans un tas trié par date de fin et
+# chaque tâche garde un compteur de prédécesseurs non terminés : la fin
+# d'une tâche ne touche que ses successeurs directs.
+#
+# Les tâches prêtes sont rangées par clé de ressources (par défaut leur
+# demande), un tas par rang dans chaque groupe, et un tas des têtes de
+# groupes donne la prochaine tâche à essayer. Pendant un événement les
+# employés libres ne font que diminuer : une tâche qui ne peut démarrer
+# bloque tout son groupe jusqu'à l'événement suivant, sans réessayer ses
+# autres tâches. Quand plus aucun employé n'est libre, on s'arrête. Les
+# tâches sans demande (jalons) démarrent dès qu'elles sont prêtes. Les
+# démarrages restent dans l'ordre des rangs, comme un parcours complet de
+# la liste triée des tâches prêtes.
+
+import heapq
+from array import array
+
+
+def run_parallel(inst, rank, acquire, release, trace=None, wake=None, key=None, saturated=None):
+    # inst      : instance compilée (msrcpsp.instance.Instance)
+    # rank      : rang de priorité de chaque tâche (voir Instance.priority_rank)
+    # acquire   : acquire(i, instant) -> jeton (affectation) ou None si impossible
+    # release   : release(jeton) libère les ressources d'une tâche terminée
+    # trace     : journal d'événements optionnel (voir msrcpsp.trace)
+    # wake      : wake(instant) -> prochain instant où les ressources changent
+    #             hors fins de tâches (disponibilités), ou None
+    # key       : key(i) -> clé de ressources ; à un même instant, deux tâches
+    #             de même clé peuvent démarrer ou non avec les mêmes employés
+    #             libres (par défaut le numéro de demande, Instance.demand_kinds)
+    # saturated : saturated() -> True quand plus aucune tâche avec une
+    #             demande ne peut démarrer (aucun employé libre), ou None
+    # Renvoie (ordre de démarrage, débuts, fins, jetons), indexés par tâche
+    n = len(inst)
+    durations = inst.durations
+    succ_ptr, succ_idx = inst.succ_ptr, inst.succ_idx
+    demand_ptr = inst.demand_ptr
+    indegree = inst.indegrees()
+    starts = array('q', bytes(8 * n))
+    ends = array('q', bytes(8 * n))
+    tokens = [None] * n
+    order = array('i')
+
+    # Groupe de chaque tâche avec une demande (-1 pour un jalon)
+    if key is None:
+        key = inst.demand_kinds[1].__getitem__
+    keys = {}
+    group = array('i', [keys.setdefault(key(i), len(keys)) if demand_ptr[i + 1] > demand_ptr[i] else -1
+                        for i in range(n)])
+    queues = [[] for _ in keys]         # par groupe : tas de (rang, tâche)
+    head = [None] * len(keys)           # rang de la tête inscrite dans `heads`
+    version = [0] * len(keys)           # entrée valide de chaque groupe dans `heads`
+    heads = []      # tas de (rang, version, groupe) ; entrées périmées ignorées
+    milestones = []     # tas de (rang, tâche) des jalons prêts
+    queued = 0          # tâches avec une demande en attente
+
+    def push_ready(i):
+        g = group[i]
+        if g < 0:
+            heapq.heappush(milestones, (rank[i], i))
+            return
+        heapq.heappush(queues[g], (rank[i], i))
+        if head[g] is None or rank[i] < head[g]:
+            head[g] = rank[i]
+            version[g] += 1
+            heapq.heappush(heads, (rank[i], version[g], g))
+
+    for i, d in enumerate(indegree):
+        if d == 0:
+            push_ready(i)
+            queued += group[i] >= 0
+
+    time_now = 0
+    running = []    # tas de (fin, rang, tâche)
+    remaining = n
+
+    while remaining or running:
+        # Libération des tâches terminées et mise à jour de leurs successeurs
+        while running and running[0][0] <= time_now:
+            end, _, i = heapq.heappop(running)
+            release(tokens[i])
+            if trace is not None:
+                trace.finish(end, i)
+            for k in range(succ_ptr[i], succ_ptr[i + 1]):
+                s = succ_idx[k]
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    push_ready(s)
+                    queued += group[s] >= 0
+
+        # Têtes de groupes par rang croissant ; un groupe qui échoue est mis
+        # de côté jusqu'au prochain événement
+        started = []
+        blocked = []
+        while heads and (saturated is None or not saturated()):
+            r, v, g = heads[0]
+            if v != version[g]:
+                heapq.heappop(heads)
+                continue
+            queue = queues[g]
+            i = queue[0][1]
+            token = acquire(i, time_now)
+            if token is None:
+                blocked.append(heapq.heappop(heads))
+                continue
+            heapq.heappop(queue)
+            started.append((r, i, token))
+            version[g] += 1
+            if queue:
+                head[g] = queue[0][0]
+                heapq.heapreplace(heads, (head[g], version[g], g))
+            else:
+                head[g] = None
+                heapq.heappop(heads)
+        for entry in blocked:
+            heapq.heappush(heads, entry)
+        queued -= len(started)
+        while milestones:
+            r, i = heapq.heappop(milestones)
+            started.append((r, i, acquire(i, time_now)))
+        if len(started) > 1:
+            started.sort()
+
+        for r, i, token in started:
+            end = time_now + durations[i]
+            starts[i] = time_now
+            ends[i] = end
+            tokens[i] = token
+            order.append(i)
+            heapq.heappush(running, (end, r, i))
+            if trace is not None:
+                trace.start(time_now, i, token)
+        remaining -= len(started)
+
+        # Avancer l'horloge au prochain événement : fin de tâche ou
+        # changement de disponibilité ; sans événement à venir, les tâches
+        # prêtes ne démarreront jamais
+        next_time = wake(time_now) if wake is not None and queued else None
+        if running:
+            if next_time is not None and time_now < next_time < running[0][0]:
+                time_now = next_time
+            else:
+                time_now = running[0][0]
+        elif remaining:
+            if next_time is None or next_time <= time_now:
+                waiting = sorted(item for queue in queues for item in queue)
+                names = [inst.names[i] for _, i in waiting[:10]]
+                raise RuntimeError(f"Aucune tâche ne peut démarrer à t={time_now} "
+                                   f"et aucun événement à venir ; tâches bloquées : {names}")
+            time_now = next_time
+
+    return order, starts, ends, tokens
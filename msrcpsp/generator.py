@@ -0,0 +1,135 @@
+# ----------- GÉNÉRATEUR D'INSTANCES -------------
+# Graphes orientés sans cycle en couches, tirés avec une graine : même
+# graine et mêmes paramètres -> même instance. Les tâches sont numérotées
+# couche par couche, si bien que l'ordre des numéros est déjà un ordre
+# topologique. Les colonnes sont remplies directement (pas de dictionnaire
+# par tâche), ce qui permet d'aller jusqu'à quelques millions de tâches.
+#
+# Lancement :
+#   python -m msrcpsp.generator 100000 --seed 1 -o instances/gen_100k.msrb
+#   python -m msrcpsp.generator 200 --skills 4 -o instances/gen_200.json
+#   python -m msrcpsp.generator 5000 --employees 2000 --shifts 8 16 300 -o instances/gen_shifts.msrb
+
+import argparse
+import math
+import random
+from array import array
+
+from msrcpsp.instance import InstanceBuilder, NameTable
+
+
+def generate(n_tasks, n_layers=None, avg_preds=2.0, span=1, n_skills=10,
+             skills_per_task=(1, 2), max_demand=2, n_employees=None,
+             skills_per_employee=2, durations=(1, 10), seed=0, name=None, shifts=None):
+    # n_tasks             : nombre de tâches
+    # n_layers            : nombre de couches (par défaut ~ racine de n_tasks)
+    # avg_preds           : nombre moyen de prédécesseurs (densité des arcs)
+    # span                : prédécesseurs tirés dans les `span` couches précédentes
+    # n_skills            : nombre de compétences
+    # skills_per_task     : (min, max) compétences distinctes demandées par tâche
+    # max_demand          : employés demandés par compétence, entre 1 et max_demand
+    # n_employees         : taille de l'équipe (par défaut 2 * n_skills * max_demand)
+    # skills_per_employee : compétences de chaque employé (couverture)
+    # durations           : (min, max) des durées
+    # shifts              : (travail, repos, nombre) : chaque employé reçoit
+    #                       `nombre` plages de `travail` séparées par `repos`,
+    #                       décalées au hasard, puis une dernière plage sans fin
+    rng = random.Random(seed)
+    if n_layers is None:
+        n_layers = max(1, round(math.sqrt(n_tasks)))
+    n_layers = max(1, min(n_layers, n_tasks))
+    if n_employees is None:
+        n_employees = 2 * n_skills * max_demand
+    skills_per_task = (min(skills_per_task[0], n_skills), min(skills_per_task[1], n_skills))
+
+    # Bornes des couches : couche L = tâches [first[L], first[L + 1])
+    first = [L * n_tasks // n_layers for L in range(n_layers + 1)]
+
+    task_durations = array('i', bytes(4 * n_tasks))
+    task_importance = array('i', bytes(4 * n_tasks))
+    edges_src, edges_dst = array('i'), array('i')
+    demand_task, demand_skill, demand_count = array('i'), array('i'), array('i')
+    whole, frac = int(avg_preds), avg_preds - int(avg_preds)
+    skill_ids = range(n_skills)
+
+    for L in range(n_layers):
+        # Prédécesseurs possibles : les `span` couches précédentes
+        lo, hi = first[max(0, L - span)], first[L]
+        for i in range(first[L], first[L + 1]):
+            task_durations[i] = rng.randint(*durations)
+            task_importance[i] = rng.randint(0, 10)
+            if hi > lo:
+                # Au moins un prédécesseur : chaque couche dépend de la précédente
+                k = min(hi - lo, max(1, whole + (rng.random() < frac)))
+                for p in rng.sample(range(lo, hi), k):
+                    edges_src.append(p)
+                    edges_dst.append(i)
+            for s in rng.sample(skill_ids, rng.randint(*skills_per_task)):
+                demand_task.append(i)
+                demand_skill.append(s)
+                demand_count.append(rng.randint(1, max_demand))
+
+    # Chaque employé a une compétence principale attribuée à tour de rôle,
+    # plus des compétences tirées au hasard : dès que
+    # n_employees >= n_skills * max_demand, toute tâche trouve des employés
+    # distincts pour chacune de ses compétences
+    per_employee = max(1, min(skills_per_employee, n_skills))
+    employees = []
+    for e in range(n_employees):
+        skills = {e % n_skills}
+        while len(skills) < per_employee:
+            skills.add(rng.randrange(n_skills))
+        employees.append({'name': f"E{e}", 'skills': [f"S{s}" for s in sorted(skills)]})
+        if shifts is not None:
+            on, off, count = shifts
+            t = rng.randrange(on + off)
+            windows = []
+            for _ in range(count):
+                windows.append([t, t + on])
+                t += on + off
+            windows.append([t, None])
+            employees[-1]['availability'] = windows
+
+    builder = InstanceBuilder.from_arrays(
+        name or f"gen_{n_tasks}_s{seed}",
+        NameTable(f"T{i}" for i in range(n_tasks)),
+        task_durations, task_importance,
+        (edges_src, edges_dst),
+        (demand_task, demand_skill, demand_count),
+        [f"S{s}" for s in range(n_skills)],
+        employees,
+    )
+    return builder.build()
+
+# ----------- LANCEMENT -------------
+
+
+if __name__ == "__main__":
+    from msrcpsp.writers import write_instance
+
+    parser = argparse.ArgumentParser(description="Générateur d'instances MS-RCPSP")
+    parser.add_argument('tasks', type=int, help="nombre de tâches")
+    parser.add_argument('-o', '--output', required=True,
+                        help="fichier de sortie (.json, .csv ou .msrb binaire)")
+    parser.add_argument('--layers', type=int, default=None)
+    parser.add_argument('--preds', type=float, default=2.0, help="prédécesseurs par tâche (moyenne)")
+    parser.add_argument('--span', type=int, default=1)
+    parser.add_argument('--skills', type=int, default=10)
+    parser.add_argument('--skills-per-task', type=int, nargs=2, default=(1, 2))
+    parser.add_argument('--max-demand', type=int, default=2)
+    parser.add_argument('--employees', type=int, default=None)
+    parser.add_argument('--skills-per-employee', type=int, default=2)
+    parser.add_argument('--durations', type=int, nargs=2, default=(1, 10))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--name', default=None)
+    parser.add_argument('--shifts', type=int, nargs=3, default=None, metavar=('TRAVAIL', 'REPOS', 'NOMBRE'),
+                        help="calendrier d'équipes de chaque employé")
+    args = parser.parse_args()
+
+    inst = generate(args.tasks, args.layers, args.preds, args.span, args.skills,
+                    tuple(args.skills_per_task), args.max_demand, args.employees,
+                    args.skills_per_employee, tuple(args.durations), args.seed, args.name,
+                    args.shifts and tuple(args.shifts))
+    write_instance(inst, args.output)
+    print(f"{inst.name} : {len(inst)} tâches, {len(inst.pred_idx)} précédences, "
+          f"{len(inst.employees)} employés -> {args.output}")
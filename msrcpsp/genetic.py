@@ -0,0 +1,222 @@
+# ----------- ALGORITHME GÉNÉTIQUE -------------
+# Un individu est un couple de génomes :
+#   - une liste d'activités (tâches dans un ordre compatible avec les
+#     précédences), décodée par l'algorithme parallèle ou série
+#     (msrcpsp.schedulers.decoders), la position servant de rang ;
+#   - un ordre de préférence des employés, utilisé par l'affectation
+#     (EmployeePool.permuted).
+# Croisement à un point sur chaque génome (le début chez le père, la suite
+# dans l'ordre de la mère : la liste reste compatible avec les
+# précédences), mutation par échange de deux tâches voisines indépendantes
+# ou de deux employés, sélection par tournoi et remplacement élitiste.
+#
+# La population de départ contient les listes des règles de priorité et
+# des listes tirées par échantillonnage biaisé. Chaque génération est
+# évaluée par lots sur un pool de processus (instance envoyée une fois par
+# processus). La recherche s'arrête au budget (durée ou évaluations) ou à
+# la borne du chemin critique.
+#
+# Lancement :
+#   python -m msrcpsp.genetic instances/assurance.json --time-limit 30 --csv figures/comparison_ms_rcpsp.csv
+
+import argparse
+import heapq
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from msrcpsp.loaders import load_instance
+from msrcpsp.priorities import priorities
+from msrcpsp.runner import append_rows
+from msrcpsp.sampling import sample_activity_list
+from msrcpsp.schedulers import decoders, makespan_of
+
+# ----------- DÉCODAGE -------------
+
+
+def decode(inst, genome, algo='parallel'):
+    # Renvoie (ordre, débuts, fins, affectations) ; les affectations sont
+    # ramenées aux numéros d'employés de l'instance
+    tasks, employees = genome
+    rank = array('i', bytes(4 * len(tasks)))
+    for p, i in enumerate(tasks):
+        rank[i] = p
+    order, starts, ends, assignments = decoders[algo](inst, rank, pool=inst.pool.permuted(employees))
+    assignments = [[[employees[e] for e in emps] for emps in matched] for matched in assignments]
+    return order, starts, ends, assignments
+
+
+_instance = None
+
+
+def _init_worker(inst):
+    global _instance
+    _instance = inst
+
+
+def _evaluate(args):
+    algo, genomes = args
+    return [makespan_of(decode(_instance, g, algo)[2]) for g in genomes]
+
+
+def evaluate(inst, genomes, algo, executor=None, workers=1):
+    # Makespans d'une population, par lots (un lot par processus)
+    if executor is None:
+        return [makespan_of(decode(inst, g, algo)[2]) for g in genomes]
+    size = -(-len(genomes) // workers)
+    batches = [(algo, genomes[k:k + size]) for k in range(0, len(genomes), size)]
+    return [m for batch in executor.map(_evaluate, batches) for m in batch]
+
+# ----------- OPÉRATEURS -------------
+
+
+def crossover(father, mother, rng):
+    # Début du père jusqu'à un point tiré au hasard, puis les éléments
+    # manquants dans l'ordre de la mère
+    q = rng.randrange(len(father) + 1)
+    head = father[:q]
+    taken = set(head)
+    return head + [x for x in mother if x not in taken]
+
+
+def mutate_tasks(inst, tasks, rate, rng):
+    # Échange de deux tâches voisines si la seconde ne dépend pas de la première
+    tasks = list(tasks)
+    for p in range(len(tasks) - 1):
+        if rng.random() < rate and tasks[p] not in inst.predecessors(tasks[p + 1]):
+            tasks[p], tasks[p + 1] = tasks[p + 1], tasks[p]
+    return tasks
+
+
+def mutate_employees(employees, rate, rng):
+    employees = list(employees)
+    for p in range(len(employees)):
+        if rng.random() < rate:
+            q = rng.randrange(len(employees))
+            employees[p], employees[q] = employees[q], employees[p]
+    return employees
+
+
+def rule_list(inst, rank):
+    # Liste d'activités d'une règle : à chaque pas, la tâche éligible de
+    # meilleur rang (l'ordre de l'algorithme série). Trier toutes les tâches
+    # par rang ne respecterait pas les précédences, dont dépendent le
+    # croisement et la mutation
+    indegree = inst.indegrees()
+    eligible = [(rank[i], i) for i, d in enumerate(indegree) if d == 0]
+    heapq.heapify(eligible)
+    tasks = []
+    while eligible:
+        _, i = heapq.heappop(eligible)
+        tasks.append(i)
+        for s in inst.successors(i):
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                heapq.heappush(eligible, (rank[s], s))
+    return tasks
+
+
+def initial_population(inst, size, rng):
+    # Une liste par règle de priorité (employés dans l'ordre de l'instance),
+    # puis des listes tirées par échantillonnage biaisé
+    n_emp = len(inst.employees)
+    rules = list(priorities.values())
+    population = []
+    for rule in rules[:size]:
+        population.append((rule_list(inst, inst.priority_rank(rule)), list(range(n_emp))))
+    while len(population) < size:
+        rank = inst.priority_rank(rng.choice(rules))
+        position = sample_activity_list(inst, rank, rng)
+        employees = list(range(n_emp))
+        rng.shuffle(employees)
+        population.append((sorted(range(len(inst)), key=position.__getitem__), employees))
+    return population
+
+# ----------- RECHERCHE -------------
+
+
+def evolve(inst, algo='parallel', population_size=40, generations=None, max_evaluations=None,
+           time_limit=60.0, mutation_rate=0.05, workers=None, seed=0):
+    # Budget : `generations`, `max_evaluations` et/ou `time_limit` (secondes)
+    # Renvoie un dict : planning, makespan, borne, générations, évaluations, durée
+    if workers is None:
+        workers = os.cpu_count() or 1
+    rng = random.Random(seed)
+    bound = inst.critical_path_length
+    start_time = time.perf_counter()
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(inst,))
+
+    def exhausted():
+        return ((generations is not None and generation >= generations)
+                or (max_evaluations is not None and n_evaluations >= max_evaluations)
+                or (time_limit is not None and time.perf_counter() - start_time > time_limit)
+                or scored[0][0] <= bound)
+
+    try:
+        population = initial_population(inst, population_size, rng)
+        scored = sorted(zip(evaluate(inst, population, algo, executor, workers), range(len(population)),
+                            population))
+        n_evaluations = len(population)
+        generation = 0
+        while not exhausted():
+            children = []
+            for _ in range(population_size):
+                father = min(rng.sample(scored, 2))[2]
+                mother = min(rng.sample(scored, 2))[2]
+                tasks = mutate_tasks(inst, crossover(father[0], mother[0], rng), mutation_rate, rng)
+                employees = mutate_employees(crossover(father[1], mother[1], rng), mutation_rate, rng)
+                children.append((tasks, employees))
+            makespans = evaluate(inst, children, algo, executor, workers)
+            n_evaluations += len(children)
+            generation += 1
+            # Les meilleurs parmi parents et enfants (l'indice départage)
+            offset = generation * population_size
+            scored = sorted(scored + list(zip(makespans, range(offset, offset + len(children)), children)))
+            scored = scored[:population_size]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start_time
+
+    best_makespan, _, best = scored[0]
+    order, starts, ends, assignments = decode(inst, best, algo)
+    return {
+        'schedule': inst.to_schedule(order, starts, ends, assignments),
+        'makespan': best_makespan,
+        'lower_bound': bound,
+        'generations': generation,
+        'evaluations': n_evaluations,
+        'duration_sec': elapsed,
+    }
+
+# ----------- LANCEMENT -------------
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Algorithme génétique MS-RCPSP")
+    parser.add_argument('instance', help="fichier d'instance")
+    parser.add_argument('--algo', default='parallel', choices=list(decoders), help="décodeur")
+    parser.add_argument('--population', type=int, default=40)
+    parser.add_argument('--generations', type=int, default=None)
+    parser.add_argument('--evaluations', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=60.0, help="secondes")
+    parser.add_argument('--mutation', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--csv', default=None, help="ajouter le résultat à ce CSV (format comparison_ms_rcpsp)")
+    args = parser.parse_args()
+
+    inst = load_instance(args.instance)
+    result = evolve(inst, args.algo, args.population, args.generations, args.evaluations,
+                    args.time_limit, args.mutation, args.workers, args.seed)
+    print(f"[{inst.name} - ga_{args.algo}] meilleur makespan {result['makespan']} "
+          f"(borne {result['lower_bound']}), {result['generations']} générations, "
+          f"{result['evaluations']} évaluations en {result['duration_sec']:.2f}s")
+    if args.csv:
+        append_rows(args.csv, [{'instance': inst.name, 'algo': f"ga_{args.algo}", 'priority': 'ga',
+                                'seed': args.seed, 'makespan': result['makespan'],
+                                'duration_sec': result['duration_sec']}])
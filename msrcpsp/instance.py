@@ -0,0 +1,442 @@
+# ----------- INSTANCE COMPILÉE -------------
+# Tâches et compétences sont numérotées (entiers denses) ; les durées,
+# importances et demandes en compétences sont rangées dans des colonnes
+# `array` et les précédences au format CSR (pointeurs + indices). Les noms
+# ne servent plus qu'en sortie (Gantt, CSV). Les clés de priorité sont
+# calculées une seule fois : les règles ne parcourent plus les tâches à
+# chaque comparaison.
+
+import copy
+import hashlib
+import json
+from array import array
+
+from msrcpsp.pool import EmployeePool
+
+
+def _csr(n, rows, cols, *values):
+    # Regroupe les couples (ligne, colonne) par ligne (tri par comptage qui
+    # garde l'ordre d'insertion) ; renvoie pointeurs, colonnes et valeurs
+    ptr = array('q', bytes(8 * (n + 1)))
+    for r in rows:
+        ptr[r + 1] += 1
+    for r in range(n):
+        ptr[r + 1] += ptr[r]
+    fill = array('q', ptr)
+    idx = array('i', bytes(4 * len(rows)))
+    vals = [array('i', bytes(4 * len(rows))) for _ in values]
+    for k, r in enumerate(rows):
+        pos = fill[r]
+        fill[r] = pos + 1
+        idx[pos] = cols[k]
+        for v, src in zip(vals, values):
+            v[pos] = src[k]
+    return (ptr, idx, *vals)
+
+
+def ranks_of(keys):
+    # Rang de chaque élément selon sa clé (plus petite = rang 0), l'indice
+    # départageant les égalités
+    rank = array('i', bytes(4 * len(keys)))
+    for r, i in enumerate(sorted(range(len(keys)), key=lambda i: (keys[i], i))):
+        rank[i] = r
+    return rank
+
+
+class NameTable:
+    # Noms stockés bout à bout (UTF-8) avec leurs décalages : une dizaine
+    # d'octets par tâche au lieu d'un objet str par nom
+
+    def __init__(self, names):
+        self.offsets = array('q', [0])
+        chunks = []
+        pos = 0
+        for name in names:
+            data = name.encode('utf-8')
+            chunks.append(data)
+            pos += len(data)
+            self.offsets.append(pos)
+        self.data = b''.join(chunks)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].decode('utf-8')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class InstanceBuilder:
+    # Construction au fil de la lecture d'un fichier : un nom reçoit son
+    # numéro à sa première apparition, y compris comme prédécesseur
+
+    def __init__(self, name='instance'):
+        self.name = name
+        self.names = []
+        self.index = {}
+        self.defined = bytearray()
+        self.durations = array('i')
+        self.importance = array('i')
+        self.edges_src = array('i')
+        self.edges_dst = array('i')
+        self.skill_names = []
+        self.skill_index = {}
+        self.demand_task = array('i')
+        self.demand_skill = array('i')
+        self.demand_count = array('i')
+        self.employees = []
+
+    def task_id(self, name):
+        i = self.index.get(name)
+        if i is None:
+            i = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.defined.append(0)
+            self.durations.append(0)
+            self.importance.append(0)
+        return i
+
+    def skill_id(self, skill):
+        k = self.skill_index.get(skill)
+        if k is None:
+            k = self.skill_index[skill] = len(self.skill_names)
+            self.skill_names.append(skill)
+        return k
+
+    def add_task(self, name, duration, skills, predecessors=(), importance=0):
+        i = self.task_id(name)
+        if self.defined[i]:
+            raise ValueError(f"Tâche définie deux fois : {name}")
+        self.defined[i] = 1
+        self.durations[i] = duration
+        self.importance[i] = importance
+        for skill, count in skills.items():
+            self.demand_task.append(i)
+            self.demand_skill.append(self.skill_id(skill))
+            self.demand_count.append(count)
+        for p in predecessors:
+            self.add_precedence(p, name)
+
+    def add_precedence(self, pred, succ):
+        self.edges_src.append(self.task_id(pred))
+        self.edges_dst.append(self.task_id(succ))
+
+    def add_employee(self, name, skills, availability=None):
+        # availability : plages [début, fin) de disponibilité (fin None = sans
+        # fin), voir msrcpsp.calendars ; None = toujours disponible
+        for skill in skills:
+            self.skill_id(skill)
+        emp = {'name': name, 'skills': list(skills)}
+        if availability is not None:
+            emp['availability'] = [list(w) for w in availability]
+        self.employees.append(emp)
+
+    @classmethod
+    def from_arrays(cls, name, names, durations, importance, edges, demand, skill_names, employees):
+        # Construction en bloc (générateur, format binaire) sans passer par
+        # le dictionnaire nom -> numéro : les tâches sont déjà numérotées
+        #   names  : liste de noms ou NameTable
+        #   edges  : (prédécesseurs, successeurs), colonnes 'i'
+        #   demand : (tâches, compétences, nombres d'employés), colonnes 'i'
+        builder = cls(name)
+        builder.names = names
+        builder.defined = bytearray(b'\x01') * len(names)
+        builder.durations, builder.importance = durations, importance
+        builder.edges_src, builder.edges_dst = edges
+        builder.demand_task, builder.demand_skill, builder.demand_count = demand
+        builder.skill_names = list(skill_names)
+        builder.skill_index = {s: k for k, s in enumerate(builder.skill_names)}
+        for emp in employees:
+            builder.add_employee(emp['name'], emp['skills'], emp.get('availability'))
+        return builder
+
+    def build(self):
+        if 0 in self.defined:
+            missing = [t for t, d in zip(self.names, self.defined) if not d]
+            raise ValueError(f"Prédécesseurs non définis : {missing[:10]}")
+        inst = Instance.__new__(Instance)
+        inst._compile(self)
+        return inst
+
+
+class Instance:
+
+    def __init__(self, tasks, employees, name='instance'):
+        # tasks     : dict nom -> (durée, compétences, prédécesseurs, importance)
+        # employees : liste de {'name': ..., 'skills': [...]}, plus
+        #             'availability': [[début, fin], ...] en option
+        builder = InstanceBuilder(name)
+        for t, (duration, skills, preds, importance) in tasks.items():
+            builder.add_task(t, duration, skills, preds, importance)
+        for emp in employees:
+            builder.add_employee(emp['name'], emp['skills'], emp.get('availability'))
+        self._compile(builder)
+
+    def _compile(self, b):
+        n = len(b.names)
+        self.name = b.name
+        self.names = b.names if isinstance(b.names, NameTable) else NameTable(b.names)
+        self.durations = b.durations
+        self.importance = b.importance
+        self.pred_ptr, self.pred_idx = _csr(n, b.edges_dst, b.edges_src)
+        self.succ_ptr, self.succ_idx = _csr(n, b.edges_src, b.edges_dst)
+        self.demand_ptr, self.demand_skill, self.demand_count = _csr(
+            n, b.demand_task, b.demand_skill, b.demand_count)
+        self.skill_names = b.skill_names
+
+        self.employees = b.employees
+        self.resources = {}
+        for emp in self.employees:
+            for skill in emp['skills']:
+                self.resources[skill] = self.resources.get(skill, 0) + 1
+        self.pool = EmployeePool(self.employees, b.skill_index)
+
+        self.topo_order = self._topological_order()
+        self._index = None
+        self._n_total_successors = None
+        self._feasible = False
+        self._cpm = None
+        self._demand_kinds = None
+        self._keys = {}
+        self._fingerprint = None
+
+    def __len__(self):
+        return len(self.names)
+
+    # ----------- ACCÈS PAR NUMÉRO DE TÂCHE -------------
+
+    @property
+    def index(self):
+        # nom -> numéro, reconstruit seulement si on en a besoin
+        if self._index is None:
+            self._index = {t: i for i, t in enumerate(self.names)}
+        return self._index
+
+    def predecessors(self, i):
+        return self.pred_idx[self.pred_ptr[i]:self.pred_ptr[i + 1]]
+
+    def successors(self, i):
+        return self.succ_idx[self.succ_ptr[i]:self.succ_ptr[i + 1]]
+
+    def indegrees(self):
+        ptr = self.pred_ptr
+        return array('i', [ptr[i + 1] - ptr[i] for i in range(len(self.names))])
+
+    @property
+    def n_successors(self):
+        ptr = self.succ_ptr
+        return array('i', [ptr[i + 1] - ptr[i] for i in range(len(self.names))])
+
+    def demand(self, i):
+        # [(numéro de compétence, nombre d'employés), ...]
+        lo, hi = self.demand_ptr[i], self.demand_ptr[i + 1]
+        return list(zip(self.demand_skill[lo:hi], self.demand_count[lo:hi]))
+
+    @property
+    def demand_kinds(self):
+        # (demandes distinctes, numéro de demande de chaque tâche) : les
+        # décodeurs relisent la demande à chaque tentative de démarrage ;
+        # une seule copie par demande distincte et 4 octets par tâche,
+        # construits une fois
+        if self._demand_kinds is None:
+            ptr, skill, count = self.demand_ptr, self.demand_skill, self.demand_count
+            kinds = {}
+            kind = array('i', bytes(4 * len(self.names)))
+            for i in range(len(self.names)):
+                lo, hi = ptr[i], ptr[i + 1]
+                kind[i] = kinds.setdefault(tuple(zip(skill[lo:hi], count[lo:hi])), len(kinds))
+            self._demand_kinds = (list(kinds), kind)
+        return self._demand_kinds
+
+    # ----------- SORTIE (retour aux noms) -------------
+
+    def skills(self, i):
+        return {self.skill_names[s]: c for s, c in self.demand(i)}
+
+    def assigned_names(self, i, matched):
+        # Affectation interne (indices d'employés alignés sur la demande)
+        # -> dict compétence -> noms des employés
+        lo = self.demand_ptr[i]
+        return {
+            self.skill_names[self.demand_skill[lo + k]]: [self.pool.names[e] for e in emps]
+            for k, emps in enumerate(matched)
+        }
+
+    def to_schedule(self, order, starts, ends, assignments):
+        # Planning au format historique : (nom, début, fin, affectation)
+        return [(self.names[i], starts[i], ends[i], self.assigned_names(i, assignments[i]))
+                for i in order]
+
+    @property
+    def fingerprint(self):
+        # Empreinte du contenu (tâches, précédences, demandes, employés et
+        # leurs calendriers, modèle de ressources), indépendante du nom et
+        # du format d'origine : une tâche modifiée change l'empreinte
+        # (msrcpsp.cache)
+        if self._fingerprint is None:
+            # Les numéros de compétences dépendent de l'ordre de lecture :
+            # on les remplace par leur rang dans l'ordre alphabétique
+            by_name = sorted(self.skill_names)
+            canonical = [by_name.index(s) for s in self.skill_names]
+            skills = array('i', [canonical[s] for s in self.demand_skill])
+            h = hashlib.sha256()
+            for column in (self.names.offsets, self.durations, self.importance,
+                           self.pred_ptr, self.pred_idx, self.demand_ptr,
+                           skills, self.demand_count):
+                h.update(len(column).to_bytes(8, 'little'))
+                h.update(column.tobytes())
+            h.update(self.names.data)
+            h.update(json.dumps([by_name, self.employees, self.pool.model], sort_keys=True).encode('utf-8'))
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    # ----------- FAISABILITÉ -------------
+
+    def infeasible_tasks(self):
+        # Tâches dont la demande ne peut pas être satisfaite même avec toute
+        # l'équipe libre : [(numéro, {compétence: (demandés, disponibles)})].
+        # Le couplage est calculé une fois par demande distincte.
+        pool = self.pool
+        verdicts = {}
+        bad = []
+        for i in range(len(self.names)):
+            demand = tuple(self.demand(i))
+            if demand not in verdicts:
+                verdicts[demand] = pool.assign(list(demand), pool.all) is not None
+            if not verdicts[demand]:
+                bad.append((i, {self.skill_names[s]: (c, self.resources.get(self.skill_names[s], 0))
+                                for s, c in demand}))
+        return bad
+
+    def check_feasibility(self):
+        # Rejette tout de suite une instance impossible, avec un rapport,
+        # au lieu de laisser l'ordonnancement attendre indéfiniment
+        if self._feasible:
+            return
+        bad = self.infeasible_tasks()
+        if bad:
+            lines = []
+            for i, needs in bad[:20]:
+                short = [f"{s} {c} demandé(s) / {a} disponible(s)" for s, (c, a) in needs.items() if c > a]
+                lines.append(f"  - {self.names[i]} : " + (
+                    ', '.join(short) if short else
+                    "pas assez d'employés distincts pour "
+                    + ', '.join(f"{s}:{c}" for s, (c, _) in needs.items())))
+            more = f"\n  ... et {len(bad) - 20} autre(s)" if len(bad) > 20 else ""
+            raise ValueError(f"Instance {self.name} impossible : {len(bad)} tâche(s) "
+                             f"sans équipe suffisante\n" + '\n'.join(lines) + more)
+        self._feasible = True
+
+    # ----------- GRAPHE -------------
+
+    def reversed(self):
+        # Même instance, précédences inversées : ordonnancer ce graphe en
+        # partant de la fin revient à caler les tâches au plus tard
+        rev = copy.copy(self)
+        rev.pred_ptr, rev.pred_idx = self.succ_ptr, self.succ_idx
+        rev.succ_ptr, rev.succ_idx = self.pred_ptr, self.pred_idx
+        rev.topo_order = array('i', reversed(self.topo_order))
+        rev._n_total_successors = None
+        rev._cpm = None
+        rev._keys = {}
+        rev._fingerprint = None
+        return rev
+
+    def _topological_order(self):
+        # Tri topologique de Kahn ; un cycle laisse des tâches non visitées
+        indegree = self.indegrees()
+        succ_ptr, succ_idx = self.succ_ptr, self.succ_idx
+        order = array('i', [i for i, d in enumerate(indegree) if d == 0])
+        k = 0
+        while k < len(order):
+            i = order[k]
+            k += 1
+            for j in range(succ_ptr[i], succ_ptr[i + 1]):
+                s = succ_idx[j]
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    order.append(s)
+        if len(order) != len(self.names):
+            blocked = [self.names[i] for i, d in enumerate(indegree) if d > 0]
+            raise RuntimeError(f"Cycle détecté dans les précédences : {blocked[:10]}")
+        return order
+
+    @property
+    def n_total_successors(self):
+        # Successeurs directs et indirects comptés en un parcours topologique
+        # inverse, O(V + E) : chaque tâche ajoute ses successeurs directs et
+        # leurs propres comptes. Un successeur atteint par plusieurs chemins
+        # compte une fois par chemin (majorant du nombre exact, égal sur un
+        # arbre) ; le compte est plafonné au nombre de tâches. Le nombre
+        # exact demanderait l'ensemble des successeurs de chaque tâche,
+        # O(n²) en mémoire.
+        if self._n_total_successors is None:
+            n = len(self.names)
+            counts = array('q', bytes(8 * n))
+            succ_ptr, succ_idx = self.succ_ptr, self.succ_idx
+            for i in reversed(self.topo_order):
+                total = 0
+                for j in range(succ_ptr[i], succ_ptr[i + 1]):
+                    total += 1 + counts[succ_idx[j]]
+                counts[i] = min(total, n)
+            self._n_total_successors = counts
+        return self._n_total_successors
+
+    @property
+    def cpm(self):
+        # Méthode du chemin critique, en un passage avant et un passage
+        # arrière sur l'ordre topologique, O(V + E), sans tenir compte des
+        # employés : (début au plus tôt, fin au plus tôt, début au plus tard,
+        # fin au plus tard), l'horizon étant la durée du chemin critique
+        if self._cpm is None:
+            n = len(self.names)
+            durations = self.durations
+            pred_ptr, pred_idx = self.pred_ptr, self.pred_idx
+            succ_ptr, succ_idx = self.succ_ptr, self.succ_idx
+            es = array('q', bytes(8 * n))
+            ef = array('q', bytes(8 * n))
+            for i in self.topo_order:
+                t = 0
+                for k in range(pred_ptr[i], pred_ptr[i + 1]):
+                    if ef[pred_idx[k]] > t:
+                        t = ef[pred_idx[k]]
+                es[i] = t
+                ef[i] = t + durations[i]
+            horizon = max(ef) if n else 0
+            ls = array('q', bytes(8 * n))
+            lf = array('q', bytes(8 * n))
+            for i in reversed(self.topo_order):
+                t = horizon
+                for k in range(succ_ptr[i], succ_ptr[i + 1]):
+                    if ls[succ_idx[k]] < t:
+                        t = ls[succ_idx[k]]
+                lf[i] = t
+                ls[i] = t - durations[i]
+            self._cpm = (es, ef, ls, lf)
+        return self._cpm
+
+    @property
+    def critical_path_length(self):
+        # Borne inférieure du makespan (précédences seules)
+        ef = self.cpm[1]
+        return max(ef) if len(ef) else 0
+
+    # ----------- PRIORITÉS -------------
+
+    def priority_key(self, rule):
+        # Clé de priorité de chaque tâche (plus petite = plus prioritaire),
+        # calculée une fois par règle puis réutilisée
+        if rule not in self._keys:
+            self._keys[rule] = rule(self)
+        return self._keys[rule]
+
+    def priority_rank(self, rule):
+        # Rang de chaque tâche selon la règle ; le numéro de tâche (ordre de
+        # déclaration) départage les égalités
+        name = ('rank', rule)
+        if name not in self._keys:
+            self._keys[name] = ranks_of(self.priority_key(rule))
+        return self._keys[name]
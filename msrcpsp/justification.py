@@ -0,0 +1,59 @@
+# ----------- AMÉLIORATION AVANT / ARRIÈRE (double justification) -------------
+# Post-traitement applicable à n'importe quel planning :
+#   1. justification à droite : les tâches, prises par date de fin
+#      décroissante, sont recalées au plus tard (SGS série sur le graphe
+#      inversé, profils d'occupation des employés) ;
+#   2. justification à gauche : les tâches, prises par date de début
+#      croissante dans ce planning, sont recalées au plus tôt.
+# Précédences, compétences et disponibilité des employés restent
+# respectées (les affectations sont recalculées à chaque placement). On
+# répète tant que le makespan diminue ; le planning d'origine est gardé
+# s'il n'est pas amélioré.
+
+from array import array
+
+from msrcpsp.instance import ranks_of
+from msrcpsp.schedulers import makespan_of, serial_sgs
+
+
+def justify(inst, starts, ends, max_passes=5):
+    # starts, ends : dates indexées par tâche ; renvoie
+    # (ordre, débuts, fins, affectations) du meilleur planning justifié,
+    # ou None si aucun n'améliore le makespan de départ.
+    # Les calendriers des employés ne se retournent pas avec le temps : un
+    # planning avec calendriers est gardé tel quel.
+    if inst.pool.calendar is not None:
+        return None
+    best_makespan = makespan_of(ends)
+    best = None
+    rev = inst.reversed()
+    n = len(inst)
+    for _ in range(max_passes):
+        # À droite : dernière fin d'abord ; dates renversées t -> horizon - t
+        _, rstarts, rends, _ = serial_sgs(rev, ranks_of([(-ends[i], -starts[i]) for i in range(n)]))
+        horizon = makespan_of(rends)
+        right_starts = [horizon - rends[i] for i in range(n)]
+        # À gauche : premier début d'abord
+        result = serial_sgs(inst, ranks_of(right_starts))
+        makespan = makespan_of(result[2])
+        if makespan >= best_makespan:
+            break
+        best_makespan, best = makespan, result
+        starts, ends = result[1], result[2]
+    return best
+
+
+def justify_schedule(inst, schedule):
+    # Planning au format historique (nom, début, fin, affectation)
+    # -> (planning, makespan), amélioré si possible
+    index = inst.index
+    starts = array('q', bytes(8 * len(inst)))
+    ends = array('q', bytes(8 * len(inst)))
+    for t, start, end, _ in schedule:
+        starts[index[t]] = start
+        ends[index[t]] = end
+    best = justify(inst, starts, ends)
+    if best is None:
+        return schedule, makespan_of(ends)
+    order, starts, ends, assignments = best
+    return inst.to_schedule(order, starts, ends, assignments), makespan_of(ends)
@@ -0,0 +1,221 @@
+# ----------- CHARGEMENT DES INSTANCES -------------
+# Lecture ligne à ligne des formats usuels ; chaque ligne alimente
+# directement l'instance compacte (InstanceBuilder) :
+#   - iMOPSE MS-RCPSP (.def) : une compétence Qk de niveau L par tâche ;
+#     un employé de niveau m sur Qk reçoit les compétences "Qk:0" ... "Qk:m"
+#     et la tâche demande "Qk:L", ce qui respecte la règle niveau >= L
+#   - PSPLIB mono-mode (.sm) : chaque ressource renouvelable "Rk" de
+#     capacité c devient c employés mono-compétence "Rk_1" ... "Rk_c"
+#   - JSON : {"name", "tasks": {nom: {duration, skills, predecessors,
+#     importance}}, "employees": [{name, skills, availability}]}
+#   - CSV : tâches (name, duration, skills "dev:2;test:1", predecessors
+#     "a;b", importance) et employés dans "<nom>_employees.csv"
+#     (name, skills "dev;test", availability "0-8;24-32" facultative)
+#   Les plages de disponibilité (availability) sont facultatives : voir
+#   msrcpsp.calendars
+#   - binaire (.msrb) : colonnes de l'instance compilée, écrites par
+#     msrcpsp.writers (voir ce module pour la disposition du fichier)
+
+import csv
+import json
+import os
+import sys
+from array import array
+
+from msrcpsp.instance import InstanceBuilder, NameTable
+
+
+def _stem(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def load_imopse(path):
+    builder = InstanceBuilder(_stem(path))
+    section = None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('='):
+                continue
+            if line.startswith('ResourceID'):
+                section = 'resources'
+                continue
+            if line.startswith('TaskID'):
+                section = 'tasks'
+                continue
+            if section is None:
+                continue    # en-tête du fichier (nom, nombre de tâches, ...)
+
+            tokens = line.replace(':', ': ').split()
+            if section == 'resources':
+                # ID  salaire  Qk: niveau  Qk: niveau ...
+                skills = []
+                for k in range(2, len(tokens) - 1, 2):
+                    q, level = tokens[k].rstrip(':'), int(tokens[k + 1])
+                    skills.extend(f"{q}:{lvl}" for lvl in range(level + 1))
+                builder.add_employee(f"R{tokens[0]}", skills)
+            else:
+                # ID  durée  Qk: niveau  prédécesseurs...
+                q, level = tokens[2].rstrip(':'), int(tokens[3])
+                builder.add_task(tokens[0], int(tokens[1]), {f"{q}:{level}": 1}, tokens[4:])
+    return builder.build()
+
+
+def load_psplib(path):
+    builder = InstanceBuilder(_stem(path))
+    capacities = []
+    n_renewable = 0
+    section = None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('*'):
+                section = None
+                continue
+            if line.startswith('- renewable'):
+                n_renewable = int(line.split(':')[1].split()[0])
+            elif line.startswith('PRECEDENCE RELATIONS'):
+                section = 'precedence'
+            elif line.startswith('REQUESTS/DURATIONS'):
+                section = 'requests'
+            elif line.startswith('RESOURCEAVAILABILITIES'):
+                section = 'availabilities'
+            if section is None:
+                continue
+
+            tokens = line.split()
+            if not tokens or not tokens[0].isdigit():
+                continue    # titres des colonnes, séparateurs
+            if section == 'precedence':
+                # jobnr  #modes  #successeurs  successeurs...
+                for s in tokens[3:3 + int(tokens[2])]:
+                    builder.add_precedence(tokens[0], s)
+            elif section == 'requests':
+                # jobnr  mode  durée  R1 R2 ... N1 ...
+                # seules les ressources renouvelables (R), placées avant les
+                # non renouvelables, sont prises en compte
+                demand = tokens[3:3 + n_renewable]
+                builder.add_task(tokens[0], int(tokens[2]),
+                                 {f"R{k + 1}": int(q) for k, q in enumerate(demand) if int(q) > 0})
+            else:
+                capacities = [int(c) for c in tokens]
+
+    for k, c in enumerate(capacities[:n_renewable]):
+        for m in range(c):
+            builder.add_employee(f"R{k + 1}_{m + 1}", [f"R{k + 1}"])
+    return builder.build()
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    builder = InstanceBuilder(data.get('name', _stem(path)))
+    for t, d in data['tasks'].items():
+        builder.add_task(t, d['duration'], d.get('skills', {}),
+                         d.get('predecessors', []), d.get('importance', 0))
+    for emp in data['employees']:
+        builder.add_employee(emp['name'], emp['skills'], emp.get('availability'))
+    return builder.build()
+
+
+def _split(field):
+    return [x for x in field.split(';') if x] if field else []
+
+
+def _windows(field):
+    # "0-8;24-32;40-" -> [[0, 8], [24, 32], [40, None]] ; vide -> None
+    if not field:
+        return None
+    windows = []
+    for item in _split(field):
+        start, _, end = item.partition('-')
+        windows.append([int(start), int(end) if end else None])
+    return windows
+
+
+def load_csv(path, employees_path=None):
+    if employees_path is None:
+        employees_path = os.path.splitext(path)[0] + '_employees.csv'
+    builder = InstanceBuilder(_stem(path))
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            skills = {}
+            for item in _split(row['skills']):
+                skill, _, count = item.partition(':')
+                skills[skill] = int(count or 1)
+            builder.add_task(row['name'], int(row['duration']), skills,
+                             _split(row['predecessors']), int(row.get('importance') or 0))
+    with open(employees_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            builder.add_employee(row['name'], _split(row['skills']), _windows(row.get('availability')))
+    return builder.build()
+
+
+def _get(f, typecode, count):
+    values = array(typecode)
+    values.fromfile(f, count)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _get_names(f, count):
+    table = NameTable(())
+    table.offsets = _get(f, 'q', count + 1)
+    table.data = f.read(table.offsets[-1])
+    return table
+
+
+def load_binary(path):
+    from msrcpsp.writers import MAGIC
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Fichier binaire d'instance invalide : {path}")
+        n, n_edges, n_demand, n_skills, n_employees, n_emp_skills, name_len = _get(f, 'q', 7)
+        name = f.read(name_len).decode('utf-8')
+        durations = _get(f, 'i', n)
+        importance = _get(f, 'i', n)
+        edges = (_get(f, 'i', n_edges), _get(f, 'i', n_edges))
+        demand = (_get(f, 'i', n_demand), _get(f, 'i', n_demand), _get(f, 'i', n_demand))
+        names = _get_names(f, n)
+        skill_names = list(_get_names(f, n_skills))
+        emp_names = _get_names(f, n_employees)
+        emp_ptr = _get(f, 'q', n_employees + 1)
+        emp_skills = _get(f, 'i', n_emp_skills)
+        calendars = f.read(8)
+        if calendars:
+            n_windows = array('q', calendars)
+            if sys.byteorder == 'big':
+                n_windows.byteswap()
+            flags = _get(f, 'b', n_employees)
+            win_ptr = _get(f, 'q', n_employees + 1)
+            win_starts = _get(f, 'q', n_windows[0])
+            win_ends = _get(f, 'q', n_windows[0])
+    employees = [
+        {'name': emp_names[e], 'skills': [skill_names[s] for s in emp_skills[emp_ptr[e]:emp_ptr[e + 1]]]}
+        for e in range(n_employees)
+    ]
+    if calendars:
+        for e, emp in enumerate(employees):
+            if flags[e]:
+                emp['availability'] = [[win_starts[k], None if win_ends[k] < 0 else win_ends[k]]
+                                       for k in range(win_ptr[e], win_ptr[e + 1])]
+    return InstanceBuilder.from_arrays(name, names, durations, importance, edges, demand,
+                                       skill_names, employees).build()
+
+
+loaders = {
+    '.def': load_imopse,
+    '.sm': load_psplib,
+    '.json': load_json,
+    '.csv': load_csv,
+    '.msrb': load_binary,
+}
+
+
+def load_instance(path):
+    # Choix du format selon l'extension du fichier
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in loaders:
+        raise ValueError(f"Format d'instance inconnu : {path} (attendu : {', '.join(loaders)})")
+    return loaders[ext](path)
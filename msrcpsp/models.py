@@ -0,0 +1,71 @@
+# ----------- MODÈLES DE RESSOURCES -------------
+# Un seul moteur (algorithmes parallèle et série, justification, recherche
+# génétique, replanification, solveur exact) pour les trois façons de
+# modéliser la demande en compétences des anciennes versions
+# (algorithms/python) :
+#   - exclusive : employés nommés, un employé ne couvre qu'une compétence
+#                 par tâche (couplage biparti) ; modèle par défaut ;
+#   - shared    : employés nommés, un employé multi-compétences peut couvrir
+#                 plusieurs compétences d'une même tâche ;
+#   - pooled    : capacités anonymes par compétence (ancien
+#                 baseline_scheduler) : chaque compétence est un réservoir
+#                 d'unités interchangeables ("dev_1", "dev_2", ...), sans
+#                 employés ni calendriers.
+# Un modèle ne remplace que le réservoir d'employés de l'instance (masques
+# de compétences et règle d'affectation `match`) : tout ce qui travaille
+# sur les masques (tas, index, profils, cache) sert aux trois modèles.
+
+import copy
+
+from msrcpsp.pool import EmployeePool
+
+MODELS = ('exclusive', 'shared', 'pooled')
+
+
+def match_each_skill(demand, candidates):
+    # Chaque compétence est servie indépendamment : les employés de plus
+    # faible indice parmi ses candidats, un même employé pouvant servir
+    # plusieurs compétences de la tâche
+    assigned = []
+    for (_, needed), mask in zip(demand, candidates):
+        if mask.bit_count() < needed:
+            return None
+        emps = []
+        while len(emps) < needed:
+            low = mask & -mask
+            emps.append(low.bit_length() - 1)
+            mask ^= low
+        assigned.append(emps)
+    return assigned
+
+
+def capacity_employees(capacities):
+    # {'dev': 2, 'test': 1} -> unités mono-compétence dev_1, dev_2, test_1
+    return [{'name': f"{skill}_{k + 1}", 'skills': [skill]}
+            for skill, capacity in capacities.items() for k in range(capacity)]
+
+
+def with_model(inst, model, capacities=None):
+    # Même instance sous un autre modèle de ressources ; capacities
+    # (compétence -> nombre d'unités, modèle pooled) vaut par défaut le
+    # nombre d'employés possédant chaque compétence
+    if model not in MODELS:
+        raise ValueError(f"Modèle de ressources inconnu : {model} (attendu : {', '.join(MODELS)})")
+    if model == inst.pool.model:
+        return inst
+    clone = copy.copy(inst)
+    if model == 'pooled':
+        capacities = inst.resources if capacities is None else capacities
+        clone.employees = capacity_employees(capacities)
+        clone.resources = dict(capacities)
+        pool = EmployeePool(clone.employees, inst.pool.skill_index)
+    else:
+        pool = EmployeePool(inst.employees, inst.pool.skill_index)
+    pool.model = model
+    if model != 'exclusive':
+        pool.match = match_each_skill
+    clone.pool = pool
+    clone._feasible = False
+    clone._fingerprint = None
+    clone._keys = {}        # certaines règles dépendent des effectifs
+    return clone
@@ -0,0 +1,348 @@
+// ----------- MOTEUR NATIF (C++) -------------
+// Portage en C++ des décodeurs de msrcpsp (schedulers.parallel_sgs et
+// serial_sgs), appelé depuis Python par ctypes (voir msrcpsp/native.py).
+// Mêmes données que l'instance compilée : durées, précédences CSR,
+// demandes CSR, un masque d'employés par compétence (mots de 64 bits) et un
+// rang par tâche. Mêmes règles de départage que la version Python (bits
+// faibles d'abord, passe gloutonne puis chemins augmentants, tas triés par
+// (fin, rang, tâche) et (rang, tâche)) : les plannings sont identiques.
+//
+// Compilation (faite automatiquement au premier appel) :
+//   g++ -O2 -std=c++17 -shared -fPIC msrcpsp/native.cpp -o _msrcpsp_native.so
+
+#include <algorithm>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <queue>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+namespace {
+
+typedef std::vector<uint64_t> Mask;
+
+// ----------- MASQUES D'EMPLOYÉS -------------
+
+int popcount(const uint64_t* m, int words) {
+    int c = 0;
+    for (int w = 0; w < words; ++w) c += __builtin_popcountll(m[w]);
+    return c;
+}
+
+// Plus petit employé de m privé de `minus` (nullptr : aucun), -1 si vide
+int lowest(const uint64_t* m, const uint64_t* minus, int words) {
+    for (int w = 0; w < words; ++w) {
+        uint64_t v = minus ? m[w] & ~minus[w] : m[w];
+        if (v) return w * 64 + __builtin_ctzll(v);
+    }
+    return -1;
+}
+
+inline void set_bit(uint64_t* m, int e) { m[e >> 6] |= uint64_t(1) << (e & 63); }
+inline void clear_bit(uint64_t* m, int e) { m[e >> 6] &= ~(uint64_t(1) << (e & 63)); }
+
+bool any(const uint64_t* m, int words) {
+    for (int w = 0; w < words; ++w)
+        if (m[w]) return true;
+    return false;
+}
+
+// ----------- AFFECTATION (assignment.match_skills, models.match_each_skill) -------------
+
+struct Matcher {
+    int words;
+    bool shared;                    // modèle shared / pooled : compétences indépendantes
+    std::vector<Mask> candidates;   // un masque par compétence demandée
+    std::vector<int> slots, filled, unfilled;
+    std::vector<int> owner;         // employé -> créneau occupé (-1 : aucun)
+    std::vector<int> touched;
+    Mask used, seen;
+
+    Matcher(int n_employees, int words_, bool shared_)
+        : words(words_), shared(shared_), owner(n_employees, -1), used(words_), seen(words_) {}
+
+    bool augment(int k) {
+        const uint64_t* cand = candidates[slots[k]].data();
+        int e;
+        while ((e = lowest(cand, seen.data(), words)) >= 0) {
+            set_bit(seen.data(), e);
+            if (owner[e] < 0 || augment(owner[e])) {
+                if (owner[e] < 0) touched.push_back(e);
+                owner[e] = k;
+                filled[k] = e;
+                return true;
+            }
+        }
+        return false;
+    }
+
+    // Remplit `out` (employés, créneau par créneau, dans l'ordre de la
+    // demande) ; faux si la demande ne peut être couverte
+    bool match(const int32_t* counts, int n_demand, std::vector<int>& out) {
+        out.clear();
+        for (int j = 0; j < n_demand; ++j)
+            if (popcount(candidates[j].data(), words) < counts[j]) return false;
+        if (shared) {
+            for (int j = 0; j < n_demand; ++j) {
+                Mask& m = candidates[j];
+                for (int c = 0; c < counts[j]; ++c) {
+                    int e = lowest(m.data(), nullptr, words);
+                    out.push_back(e);
+                    clear_bit(m.data(), e);
+                }
+            }
+            return true;
+        }
+        slots.clear();
+        unfilled.clear();
+        for (int j = 0; j < n_demand; ++j)
+            for (int c = 0; c < counts[j]; ++c) slots.push_back(j);
+        filled.assign(slots.size(), -1);
+        std::fill(used.begin(), used.end(), 0);
+        for (size_t k = 0; k < slots.size(); ++k) {
+            int e = lowest(candidates[slots[k]].data(), used.data(), words);
+            if (e >= 0) {
+                set_bit(used.data(), e);
+                owner[e] = int(k);
+                touched.push_back(e);
+                filled[k] = e;
+            } else {
+                unfilled.push_back(int(k));
+            }
+        }
+        bool ok = true;
+        for (int k : unfilled) {
+            std::fill(seen.begin(), seen.end(), 0);
+            if (!augment(k)) {
+                ok = false;
+                break;
+            }
+        }
+        for (int e : touched) owner[e] = -1;
+        touched.clear();
+        if (ok) out.assign(filled.begin(), filled.end());
+        return ok;
+    }
+};
+
+// ----------- DONNÉES D'UN APPEL -------------
+
+struct Problem {
+    int64_t n;
+    const int32_t* durations;
+    const int64_t* pred_ptr;
+    const int64_t* succ_ptr;
+    const int32_t* succ_idx;
+    const int64_t* demand_ptr;
+    const int32_t* demand_skill;
+    const int32_t* demand_count;
+    int words;
+    const uint64_t* skill_masks;    // n_skills * words
+    const int32_t* rank;
+
+    const uint64_t* mask(int s) const { return skill_masks + int64_t(s) * words; }
+
+    // Masques candidats de la tâche i : `free` & compétence (vide si
+    // compétence inconnue)
+    void candidates(int64_t i, const uint64_t* free, Matcher& m) const {
+        int64_t lo = demand_ptr[i], hi = demand_ptr[i + 1];
+        if (m.candidates.size() < size_t(hi - lo)) m.candidates.resize(hi - lo, Mask(words));
+        for (int64_t k = lo; k < hi; ++k) {
+            Mask& c = m.candidates[k - lo];
+            int s = demand_skill[k];
+            for (int w = 0; w < words; ++w) c[w] = s >= 0 ? free[w] & mask(s)[w] : 0;
+        }
+    }
+
+    std::vector<int32_t> indegrees() const {
+        std::vector<int32_t> d(n);
+        for (int64_t i = 0; i < n; ++i) d[i] = int32_t(pred_ptr[i + 1] - pred_ptr[i]);
+        return d;
+    }
+};
+
+// Position de la tâche i dans le tableau des affectations (créneaux
+// concaténés, dans l'ordre des demandes)
+std::vector<int64_t> slot_offsets(const Problem& p) {
+    std::vector<int64_t> off(p.n + 1, 0);
+    for (int64_t i = 0; i < p.n; ++i) {
+        int64_t c = 0;
+        for (int64_t k = p.demand_ptr[i]; k < p.demand_ptr[i + 1]; ++k) c += p.demand_count[k];
+        off[i + 1] = off[i] + c;
+    }
+    return off;
+}
+
+// ----------- ALGO PARALLÈLE (engine.run_parallel) -------------
+
+int parallel(const Problem& p, int n_employees, bool shared, int32_t* order, int64_t* starts,
+             int64_t* ends, int32_t* assigned) {
+    const int words = p.words;
+    Matcher matcher(n_employees, words, shared);
+    std::vector<int64_t> off = slot_offsets(p);
+    std::vector<int32_t> indegree = p.indegrees();
+    Mask free(words, 0);
+    for (int e = 0; e < n_employees; ++e) set_bit(free.data(), e);
+
+    typedef std::tuple<int64_t, int32_t, int64_t> Running;     // (fin, rang, tâche)
+    std::priority_queue<Running, std::vector<Running>, std::greater<Running>> running;
+    std::vector<int64_t> ready, waiting;
+    for (int64_t i = 0; i < p.n; ++i)
+        if (indegree[i] == 0) ready.push_back(i);
+    std::vector<int> emps;
+    int64_t time_now = 0, remaining = p.n, n_order = 0;
+    const int32_t* rank = p.rank;
+
+    while (remaining || !running.empty()) {
+        while (!running.empty() && std::get<0>(running.top()) <= time_now) {
+            int64_t i = std::get<2>(running.top());
+            running.pop();
+            for (int64_t k = off[i]; k < off[i + 1]; ++k) set_bit(free.data(), assigned[k]);
+            for (int64_t k = p.succ_ptr[i]; k < p.succ_ptr[i + 1]; ++k) {
+                int32_t s = p.succ_idx[k];
+                if (--indegree[s] == 0) ready.push_back(s);
+            }
+        }
+
+        std::stable_sort(ready.begin(), ready.end(),
+                         [rank](int64_t a, int64_t b) { return rank[a] < rank[b]; });
+        waiting.clear();
+        for (int64_t i : ready) {
+            // Sans employé libre, seule une tâche sans demande (jalon) démarre
+            if (p.demand_ptr[i + 1] > p.demand_ptr[i] && !any(free.data(), words)) {
+                waiting.push_back(i);
+                continue;
+            }
+            p.candidates(i, free.data(), matcher);
+            int64_t lo = p.demand_ptr[i];
+            if (!matcher.match(p.demand_count + lo, int(p.demand_ptr[i + 1] - lo), emps)) {
+                waiting.push_back(i);
+                continue;
+            }
+            for (size_t k = 0; k < emps.size(); ++k) {
+                clear_bit(free.data(), emps[k]);
+                assigned[off[i] + k] = emps[k];
+            }
+            starts[i] = time_now;
+            ends[i] = time_now + p.durations[i];
+            order[n_order++] = int32_t(i);
+            running.emplace(ends[i], rank[i], i);
+            --remaining;
+        }
+        ready.swap(waiting);
+
+        if (!running.empty())
+            time_now = std::get<0>(running.top());
+        else if (remaining)
+            return 1;   // aucune tâche ne peut démarrer
+    }
+    return 0;
+}
+
+// ----------- ALGO SÉRIE (profils d'occupation, profile.StaffProfile) -------------
+
+int serial(const Problem& p, int n_employees, bool shared, int32_t* order, int64_t* starts,
+           int64_t* ends, int32_t* assigned) {
+    const int words = p.words;
+    Matcher matcher(n_employees, words, shared);
+    std::vector<int64_t> off = slot_offsets(p);
+    std::vector<int32_t> indegree = p.indegrees();
+    // Occupation de chaque employé : début -> fin, intervalles disjoints
+    std::vector<std::map<int64_t, int64_t>> timelines(n_employees);
+    std::vector<int64_t> release_time(p.n, 0);
+
+    typedef std::pair<int32_t, int64_t> Eligible;               // (rang, tâche)
+    std::priority_queue<Eligible, std::vector<Eligible>, std::greater<Eligible>> eligible;
+    for (int64_t i = 0; i < p.n; ++i)
+        if (indegree[i] == 0) eligible.emplace(p.rank[i], i);
+    std::vector<int> emps, candidates;
+    Mask wanted(words), free(words);
+    int64_t n_order = 0;
+
+    while (!eligible.empty()) {
+        int64_t i = eligible.top().second;
+        eligible.pop();
+        int64_t lo = p.demand_ptr[i], hi = p.demand_ptr[i + 1];
+        int64_t duration = p.durations[i];
+
+        // Premier instant t >= release où la demande est couverte par des
+        // employés libres sur [t, t + durée) ; sinon saut à la première fin
+        // d'intervalle bloquant
+        std::fill(wanted.begin(), wanted.end(), 0);
+        for (int64_t k = lo; k < hi; ++k)
+            if (p.demand_skill[k] >= 0)
+                for (int w = 0; w < words; ++w) wanted[w] |= p.mask(p.demand_skill[k])[w];
+        candidates.clear();
+        for (int e = lowest(wanted.data(), nullptr, words); e >= 0;
+             e = lowest(wanted.data(), nullptr, words)) {
+            candidates.push_back(e);
+            clear_bit(wanted.data(), e);
+        }
+        int64_t t = release_time[i];
+        while (true) {
+            std::fill(free.begin(), free.end(), 0);
+            bool blocked = false;
+            int64_t next_time = 0;
+            for (int e : candidates) {
+                bool busy = false;
+                int64_t until = 0;
+                if (duration > 0) {
+                    const std::map<int64_t, int64_t>& tl = timelines[e];
+                    auto it = tl.lower_bound(t + duration);
+                    if (it != tl.begin() && (--it)->second > t) {
+                        busy = true;
+                        until = it->second;
+                    }
+                }
+                if (!busy)
+                    set_bit(free.data(), e);
+                else if (!blocked || until < next_time) {
+                    blocked = true;
+                    next_time = until;
+                }
+            }
+            p.candidates(i, free.data(), matcher);
+            if (matcher.match(p.demand_count + lo, int(hi - lo), emps)) break;
+            if (!blocked) return 2;     // aucun créneau
+            t = next_time;
+        }
+
+        int64_t end = t + duration;
+        for (size_t k = 0; k < emps.size(); ++k) {
+            if (end > t) timelines[emps[k]].emplace(t, end);
+            assigned[off[i] + k] = emps[k];
+        }
+        starts[i] = t;
+        ends[i] = end;
+        order[n_order++] = int32_t(i);
+        for (int64_t k = p.succ_ptr[i]; k < p.succ_ptr[i + 1]; ++k) {
+            int32_t s = p.succ_idx[k];
+            if (end > release_time[s]) release_time[s] = end;
+            if (--indegree[s] == 0) eligible.emplace(p.rank[s], s);
+        }
+    }
+    return 0;
+}
+
+}  // namespace
+
+// ----------- INTERFACE C (ctypes) -------------
+// algo : 0 parallèle, 1 série ; shared : 0 modèle exclusive, 1 shared / pooled
+// Sorties (tableaux alloués par l'appelant) : ordre de démarrage, débuts et
+// fins par tâche, employés de chaque créneau (demandes concaténées)
+// Renvoie 0, 1 (tâches bloquées, parallèle) ou 2 (aucun créneau, série)
+
+extern "C" int msrcpsp_schedule(int algo, int shared, int64_t n, const int32_t* durations,
+                                const int64_t* pred_ptr, const int64_t* succ_ptr,
+                                const int32_t* succ_idx, const int64_t* demand_ptr,
+                                const int32_t* demand_skill, const int32_t* demand_count,
+                                int n_employees, int words, const uint64_t* skill_masks,
+                                const int32_t* rank, int32_t* order, int64_t* starts,
+                                int64_t* ends, int32_t* assigned) {
+    Problem p{n, durations, pred_ptr, succ_ptr, succ_idx, demand_ptr, demand_skill,
+              demand_count, words, skill_masks, rank};
+    if (algo == 0) return parallel(p, n_employees, shared != 0, order, starts, ends, assigned);
+    return serial(p, n_employees, shared != 0, order, starts, ends, assigned);
+}
@@ -0,0 +1,188 @@
+# ----------- MOTEUR NATIF (C++ par ctypes) -------------
+# Les décodeurs parallèle et série portés en C++ (msrcpsp/native.cpp),
+# appelés sur les colonnes de l'instance compilée : même instance (celle de
+# main.py, d'un fichier, du générateur), même rang par tâche, même
+# planning que msrcpsp.schedulers, en plus rapide.
+#
+# La bibliothèque est compilée au premier appel (g++ ou $CXX) à côté de la
+# source, ou dans le dossier temporaire si le paquet est en lecture seule ;
+# son nom contient l'empreinte de la source, une modification la recompile.
+# Sans compilateur, load() lève ImportError.
+#
+# Le moteur natif couvre les modèles exclusive, shared et pooled, sans
+# calendriers : avec des calendriers (ou une règle d'affectation inconnue),
+# les décodeurs Python prennent le relais.
+
+import ctypes
+import functools
+import hashlib
+import os
+import subprocess
+import tempfile
+from array import array
+from itertools import accumulate
+
+from msrcpsp.assignment import match_skills
+from msrcpsp.models import match_each_skill
+from msrcpsp.schedulers import decoders, makespan_of
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'native.cpp')
+CXX_FLAGS = ['-O2', '-std=c++17', '-shared', '-fPIC']
+MODES = {match_skills: 0, match_each_skill: 1}     # règle d'affectation -> modèle natif
+POINTERS = {'i': ctypes.POINTER(ctypes.c_int32), 'q': ctypes.POINTER(ctypes.c_int64),
+            'Q': ctypes.POINTER(ctypes.c_uint64)}
+ERRORS = {
+    1: "Aucune tâche ne peut démarrer et aucun événement à venir (moteur natif)",
+    2: "Aucun créneau pour une tâche dans les profils des employés (moteur natif)",
+}
+
+
+def _build():
+    # Chemin de la bibliothèque compilée pour cette version de la source
+    with open(SOURCE, 'rb') as f:
+        tag = hashlib.sha256(f.read()).hexdigest()[:12]
+    name = f"_msrcpsp_native_{tag}.so"
+    folders = [os.path.dirname(SOURCE), tempfile.gettempdir()]
+    for folder in folders:
+        path = os.path.join(folder, name)
+        if os.path.exists(path):
+            return path
+    folder = next((d for d in folders if os.access(d, os.W_OK)), None)
+    if folder is None:
+        raise ImportError(f"Aucun dossier accessible en écriture pour compiler {SOURCE}")
+    path = os.path.join(folder, name)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    cxx = os.environ.get('CXX', 'g++')
+    try:
+        subprocess.run([cxx, *CXX_FLAGS, SOURCE, '-o', tmp], check=True, capture_output=True, text=True)
+    except FileNotFoundError:
+        raise ImportError(f"Compilateur C++ introuvable ({cxx}) : moteur natif indisponible") from None
+    except subprocess.CalledProcessError as e:
+        raise ImportError(f"Échec de la compilation de {SOURCE} :\n{e.stderr}") from None
+    os.replace(tmp, path)     # plusieurs processus peuvent compiler en même temps
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def load():
+    lib = ctypes.CDLL(_build())
+    i32, i64, u64 = POINTERS['i'], POINTERS['q'], POINTERS['Q']
+    lib.msrcpsp_schedule.restype = ctypes.c_int
+    lib.msrcpsp_schedule.argtypes = [
+        ctypes.c_int, ctypes.c_int, ctypes.c_int64, i32, i64, i64, i32, i64, i32, i32,
+        ctypes.c_int, ctypes.c_int, u64, i32, i32, i64, i64, i32,
+    ]
+    return lib
+
+
+def available():
+    try:
+        load()
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def _column(values, typecode):
+    # Colonne array du bon type, copiée seulement si besoin ; jamais vide,
+    # pour que son adresse soit valide
+    if not isinstance(values, array) or values.typecode != typecode:
+        values = array(typecode, values)
+    return values if values else array(typecode, [0])
+
+
+def _pointer(column):
+    return ctypes.cast(column.buffer_info()[0], POINTERS[column.typecode])
+
+
+def _masks(pool):
+    # Masques de compétences (entiers Python) -> mots de 64 bits, `words` par compétence
+    words = max(1, (len(pool.names) + 63) // 64)
+    data = array('Q')
+    data.frombytes(b''.join(m.to_bytes(8 * words, 'little') for m in pool.skill_masks))
+    return _column(data, 'Q'), words
+
+
+def _replay(trace, algo, rank, order, starts, ends, assignments):
+    # Journal reconstitué après coup, dans l'ordre où la version Python
+    # l'écrit : en parallèle, fins d'abord à chaque instant (par rang) puis
+    # démarrages ; en série, démarrage et fin de chaque tâche placée
+    if algo == 'series':
+        for i in order:
+            trace.start(starts[i], i, assignments[i])
+            trace.finish(ends[i], i)
+        return
+    events = [(starts[i], 1, k, i) for k, i in enumerate(order)]
+    events += [(ends[i], 0, rank[i], i) for i in order]
+    for time, kind, _, i in sorted(events):
+        if kind:
+            trace.start(time, i, assignments[i])
+        else:
+            trace.finish(time, i)
+
+
+def _decode(algo, inst, rank, trace=None, pool=None):
+    pool = pool or inst.pool
+    mode = MODES.get(pool.match)
+    if pool.calendar is not None or mode is None:
+        return decoders[algo](inst, rank, trace, pool)
+    inst.check_feasibility()
+    lib = load()
+    n = len(inst)
+    counts = inst.demand_count
+    slot_ptr = array('q', accumulate(counts, initial=0))   # créneaux avant chaque demande
+    columns = [_column(inst.durations, 'i'), _column(inst.pred_ptr, 'q'), _column(inst.succ_ptr, 'q'),
+               _column(inst.succ_idx, 'i'), _column(inst.demand_ptr, 'q'),
+               _column(inst.demand_skill, 'i'), _column(counts, 'i')]
+    masks, words = _masks(pool)
+    rank_column = _column(rank, 'i')
+    order = array('i', bytes(4 * max(n, 1)))
+    starts = array('q', bytes(8 * max(n, 1)))
+    ends = array('q', bytes(8 * max(n, 1)))
+    assigned = array('i', bytes(4 * max(slot_ptr[-1], 1)))
+    status = lib.msrcpsp_schedule(
+        0 if algo == 'parallel' else 1, mode, n, *map(_pointer, columns), len(pool.names), words,
+        _pointer(masks), _pointer(rank_column), *map(_pointer, (order, starts, ends, assigned)))
+    if status:
+        raise RuntimeError(f"{ERRORS[status]} : {inst.name}")
+    del order[n:], starts[n:], ends[n:]
+
+    # Affectations au format des décodeurs : par tâche, une liste
+    # d'employés par compétence demandée
+    flat = assigned.tolist()
+    chunks = [flat[a:b] for a, b in zip(slot_ptr, slot_ptr[1:])]
+    demand_ptr = inst.demand_ptr
+    assignments = [chunks[a:b] for a, b in zip(demand_ptr, demand_ptr[1:])]
+    if trace is not None:
+        _replay(trace, algo, rank, order, starts, ends, assignments)
+    return order, starts, ends, assignments
+
+
+def parallel_sgs(inst, rank, trace=None, pool=None):
+    return _decode('parallel', inst, rank, trace, pool)
+
+
+def serial_sgs(inst, rank, trace=None, pool=None):
+    return _decode('series', inst, rank, trace, pool)
+
+
+def schedule_parallel(inst, prio_func, trace=None):
+    order, starts, ends, assignments = parallel_sgs(inst, inst.priority_rank(prio_func), trace)
+    return inst.to_schedule(order, starts, ends, assignments), makespan_of(ends)
+
+
+def schedule_series(inst, prio_func, trace=None):
+    order, starts, ends, assignments = serial_sgs(inst, inst.priority_rank(prio_func), trace)
+    return inst.to_schedule(order, starts, ends, assignments), makespan_of(ends)
+
+
+native_decoders = {
+    'parallel': parallel_sgs,
+    'series': serial_sgs,
+}
+
+# Noms des algorithmes natifs dans les résultats (runner, main.py --backend)
+algorithms = {
+    'native_parallel': schedule_parallel,
+    'native_series': schedule_series,
+}
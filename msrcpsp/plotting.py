@@ -0,0 +1,129 @@
+# ----------- GRAPHIQUES (étape séparée, sans affichage) -------------
+# Les figures sont produites après l'ordonnancement, avec le moteur Agg
+# (aucune fenêtre, utilisable sur un serveur), et réparties sur plusieurs
+# processus : le rendu ne pèse plus sur les durées mesurées.
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+import pandas as pd  # noqa: E402
+import seaborn as sns  # noqa: E402
+
+# ----------- GRAPHIQUE GANTT -------------
+
+
+def plot_gantt(schedule, ax, title):
+    task_names = sorted(set(t for t, _, _, _ in schedule))
+    task_pos = {t: i for i, t in enumerate(task_names)}
+
+    for t, start, end, _ in schedule:
+        ax.barh(task_pos[t], end - start, left=start, height=0.4)
+        ax.text((start + end) / 2, task_pos[t], t, va='center', ha='center', color='white', fontsize=9)
+
+    ax.set_yticks(list(task_pos.values()))
+    ax.set_yticklabels(task_names)
+    ax.set_xlabel('Temps')
+    ax.set_title(title)
+    ax.invert_yaxis()
+
+# ----------- FIGURES -------------
+
+
+def save_summary(rows, out_dir):
+    # Graphiques comparatifs makespan / durée d'exécution
+    df = pd.DataFrame(rows)
+
+    plt.figure(figsize=(10, 6))
+    sns.barplot(data=df, x='priority', y='makespan', hue='algo')
+    plt.title("Makespan selon algorithme et priorité")
+    plt.savefig(os.path.join(out_dir, "makespan_comparison.png"))
+    plt.close()
+
+    plt.figure(figsize=(10, 6))
+    sns.barplot(data=df, x='priority', y='duration_sec', hue='algo')
+    plt.title("Durée d'exécution selon algorithme et priorité")
+    plt.savefig(os.path.join(out_dir, "duration_comparison.png"))
+    plt.close()
+
+
+def save_gantt_grid(panels, path):
+    # panels : [(planning, titre), ...], deux colonnes
+    nrows = max(1, math.ceil(len(panels) / 2))
+    fig, axs = plt.subplots(nrows, 2, figsize=(20, 4 * nrows), sharex=True, squeeze=False)
+    for ax, (sched, title) in zip(axs.flatten(), panels):
+        plot_gantt(sched, ax, title)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close(fig)
+
+
+def save_gantt(sched, title, path):
+    fig, ax = plt.subplots(figsize=(10, 4))
+    plot_gantt(sched, ax, title)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close(fig)
+
+
+# Numéros des figures Gantt individuelles d'avant l'ajout des autres règles
+GANTT_NUMBERS = {
+    ('parallel', 'shortest'): 1,
+    ('parallel', 'longest'): 2,
+    ('parallel', 'most_successors'): 3,
+    ('parallel', 'important'): 4,
+    ('series', 'shortest'): 5,
+    ('series', 'longest'): 6,
+    ('series', 'most_successors'): 7,
+    ('series', 'important'): 8,
+}
+
+
+def figure_jobs(runs, out_dir='figures'):
+    # runs : [(ligne de résultat, planning), ...] tels que renvoyés par
+    # msrcpsp.runner.run_batch ; renvoie la liste des (fonction, arguments)
+    jobs = [(save_summary, ([row for row, _ in runs], out_dir))]
+
+    names = list(dict.fromkeys(row['instance'] for row, _ in runs))
+    for name in names:
+        # Suffixe des fichiers seulement quand plusieurs instances sont comparées
+        suffix = f"_{name}" if len(names) > 1 else ""
+        panels = [(sched, f"{row['algo'].capitalize()} - {row['priority']}")
+                  for row, sched in runs if row['instance'] == name]
+        jobs.append((save_gantt_grid, (panels, os.path.join(out_dir, f"gantt_schedules{suffix}.png"))))
+
+        # Figure Gantt individuelle pour chaque couple algorithme / priorité ;
+        # les couples d'origine gardent leur numéro (1 à 8), les autres sont
+        # numérotés à la suite dans l'ordre des résultats
+        inst_rows = [row for row, _ in runs if row['instance'] == name]
+        taken = set()
+        next_index = len(GANTT_NUMBERS) + 1
+        for row, (sched, title) in zip(inst_rows, panels):
+            fig_index = GANTT_NUMBERS.get((row['algo'], row['priority']))
+            if fig_index is None or fig_index in taken:
+                fig_index = next_index
+                next_index += 1
+            taken.add(fig_index)
+            path = os.path.join(
+                out_dir, f"gantt_schedule{suffix}_{fig_index}_{row['algo']}_{row['priority']}.png")
+            jobs.append((save_gantt, (sched, title, path)))
+    return jobs
+
+
+def _render(job):
+    func, args = job
+    func(*args)
+
+
+def render_all(runs, out_dir='figures', workers=None):
+    # workers : nombre de processus de rendu (None = nombre de cœurs, 1 = sur place)
+    jobs = figure_jobs(runs, out_dir)
+    if workers == 1:
+        for job in jobs:
+            _render(job)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_render, jobs))
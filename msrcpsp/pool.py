@@ -0,0 +1,102 @@
+# ----------- RÉSERVOIR D'EMPLOYÉS (masques de bits) -------------
+# Chaque employé est un bit : un masque par compétence et un masque des
+# employés libres. Vérifier une tâche, réserver ou libérer ses employés se
+# fait en quelques opérations sur des entiers au lieu de parcourir la liste
+# des employés à chaque événement.
+#
+# Une demande est une liste [(numéro de compétence, nombre), ...] ; une
+# affectation est la liste alignée des indices d'employés retenus.
+# Les calendriers éventuels (msrcpsp.calendars) suivent les mêmes bits.
+# `match` est la règle d'affectation du modèle de ressources
+# (msrcpsp.models) : par défaut, un employé ne couvre qu'une compétence
+# par tâche.
+
+from msrcpsp.assignment import match_skills
+from msrcpsp.calendars import Calendar
+
+
+class EmployeePool:
+
+    def __init__(self, employees, skill_index=None):
+        # skill_index : compétence -> numéro (celui de l'instance) ; déduit
+        # des employés s'il n'est pas fourni
+        if skill_index is None:
+            skill_index = {}
+            for emp in employees:
+                for skill in emp['skills']:
+                    skill_index.setdefault(skill, len(skill_index))
+        self.skill_index = skill_index
+        self.names = [e['name'] for e in employees]
+        self.bit = {name: i for i, name in enumerate(self.names)}
+        self.skill_masks = [0] * len(skill_index)
+        for i, emp in enumerate(employees):
+            for skill in emp['skills']:
+                self.skill_masks[skill_index[skill]] |= 1 << i
+        self.all = (1 << len(self.names)) - 1
+        self.free = self.all
+        self.calendar = Calendar.from_employees(employees)
+        self.model = 'exclusive'
+        self.match = match_skills
+
+    def copy(self):
+        # Réservoir partageant les masques de compétences, tous employés libres
+        pool = EmployeePool.__new__(EmployeePool)
+        pool.skill_index = self.skill_index
+        pool.names = self.names
+        pool.bit = self.bit
+        pool.skill_masks = self.skill_masks
+        pool.all = self.all
+        pool.free = self.all
+        pool.calendar = self.calendar
+        pool.model = self.model
+        pool.match = self.match
+        return pool
+
+    def permuted(self, order):
+        # Réservoir où le bit k est l'employé order[k] : l'affectation
+        # préférant les bits faibles, `order` fixe l'ordre de préférence
+        # des employés (génome d'affectation, msrcpsp.genetic)
+        pool = self.copy()
+        pool.names = [self.names[e] for e in order]
+        pool.bit = {name: k for k, name in enumerate(pool.names)}
+        pool.skill_masks = []
+        for mask in self.skill_masks:
+            new = 0
+            for k, e in enumerate(order):
+                if mask >> e & 1:
+                    new |= 1 << k
+            pool.skill_masks.append(new)
+        if self.calendar is not None:
+            pool.calendar = self.calendar.permuted(order)
+        return pool
+
+    def demand_of(self, task_skills):
+        # dict compétence -> nombre (noms) -> demande numérotée
+        return [(self.skill_index[s], n) if s in self.skill_index else (-1, n)
+                for s, n in task_skills.items()]
+
+    def mask_of(self, employees):
+        mask = 0
+        for e in employees:
+            mask |= 1 << e
+        return mask
+
+    def assign(self, demand, free=None):
+        # Affectation parmi les employés libres (ou `free`), sans réserver
+        if free is None:
+            free = self.free
+        masks = self.skill_masks
+        return self.match(demand, [free & masks[s] if s >= 0 else 0 for s, _ in demand])
+
+    def claim(self, demand, free=None):
+        # Réserve les employés d'une tâche (parmi `free`, par défaut tous les
+        # libres) ; None si la tâche ne peut démarrer
+        matched = self.assign(demand, free)
+        if matched is not None:
+            for emps in matched:
+                self.free &= ~self.mask_of(emps)
+        return matched
+
+    def release(self, matched):
+        for emps in matched:
+            self.free |= self.mask_of(emps)
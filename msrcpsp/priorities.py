@@ -0,0 +1,116 @@
+# ----------- PRIORITÉS -------------
+# Chaque règle reçoit l'instance compilée et renvoie la clé de chaque tâche
+# (indexée par numéro de tâche) ; la plus petite clé passe en premier.
+
+
+def prio_shortest(inst):
+    # Durée la plus courte (SPT)
+    # Renvoie la durée de la tâche
+    # La tâche avec la durée la plus courte sera priorisée
+    # pour être exécutée en premier
+    # (tâche la plus courte en premier)
+    # (Shortest Processing Time)
+    # (SPT)
+    return inst.durations
+
+
+def prio_longest(inst):
+    # Durée la plus longue (LPT)
+    # Renvoie la durée de la tâche
+    # La tâche avec la durée la plus longue sera priorisée
+    # pour être exécutée en premier
+    # (tâche la plus longue en premier)
+    # (Longest Processing Time)
+    # (LPT)
+    return [-d for d in inst.durations]
+
+
+def prio_most_successors(inst):
+    # Nombre de successeurs directs, précalculé dans l'instance
+    # La tâche avec le plus de successeurs sera priorisée
+    # pour être exécutée en premier
+    # (tâche avec le plus de successeurs en premier)
+    # (Most Successors)
+    # (MS)
+    return [-c for c in inst.n_successors]
+
+
+def prio_most_important(inst):
+    # Renvoie l'importance de la tâche
+    # La tâche la plus importante sera priorisée
+    # pour être exécutée en premier
+    # (tâche la plus importante en premier)
+    # (Most Important)
+    # (MI)
+    return [-w for w in inst.importance]
+
+
+# ----------- RÈGLES DU CHEMIN CRITIQUE -------------
+# Calculées à partir d'un seul passage avant / arrière sur le graphe
+# (Instance.cpm), partagé par toutes les règles de l'instance.
+
+
+def prio_latest_finish(inst):
+    # Fin au plus tard la plus tôt
+    # La tâche qui doit finir le plus tôt pour ne pas
+    # retarder le projet sera priorisée
+    # (Latest Finish Time)
+    # (LFT)
+    return inst.cpm[3]
+
+
+def prio_latest_start(inst):
+    # Début au plus tard le plus tôt
+    # (Latest Start Time)
+    # (LST)
+    return inst.cpm[2]
+
+
+def prio_rank_positional_weight(inst):
+    # Poids positionnel : durée de la tâche plus celles de ses
+    # successeurs directs
+    # La tâche qui débloque le plus de travail sera priorisée
+    # (Greatest Rank Positional Weight)
+    # (GRPW)
+    durations = inst.durations
+    ptr, idx = inst.succ_ptr, inst.succ_idx
+    return [-(durations[i] + sum(durations[idx[k]] for k in range(ptr[i], ptr[i + 1])))
+            for i in range(len(inst))]
+
+
+def prio_total_successors(inst):
+    # Nombre de successeurs directs et indirects, compté par chemin
+    # (majorant en O(V + E), voir Instance.n_total_successors)
+    # (Most Total Successors)
+    # (MTS)
+    return [-c for c in inst.n_total_successors]
+
+
+def prio_weighted_slack(inst):
+    # Marge totale (début au plus tard - début au plus tôt) divisée par la
+    # part de l'équipe que la tâche mobilise : une tâche peu flexible qui
+    # demande des compétences rares sera priorisée
+    # (Resource-Weighted Slack)
+    # (RWS)
+    es, _, ls, _ = inst.cpm
+    staff = [inst.resources.get(s, 0) for s in inst.skill_names]
+    ptr, skill, count = inst.demand_ptr, inst.demand_skill, inst.demand_count
+    keys = []
+    for i in range(len(inst)):
+        weight = 1 + sum(count[k] / staff[skill[k]] for k in range(ptr[i], ptr[i + 1])
+                         if staff[skill[k]])
+        keys.append((ls[i] - es[i]) / weight)
+    return keys
+
+
+priorities = {
+    'shortest': prio_shortest,
+    'longest': prio_longest,
+    'most_successors': prio_most_successors,
+    'important': prio_most_important,
+    'latest_finish': prio_latest_finish,
+    'latest_start': prio_latest_start,
+    'rank_positional_weight': prio_rank_positional_weight,
+    'total_successors': prio_total_successors,
+    'weighted_slack': prio_weighted_slack,
+}
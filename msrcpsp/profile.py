@@ -0,0 +1,237 @@
+# ----------- PROFILS D'OCCUPATION -------------
+# Occupation de chaque employé dans le temps : intervalles [début, fin)
+# disjoints, gardés triés (points de rupture), si bien que « est-il libre
+# sur [t, t + d) ? » se résout par une recherche dichotomique en
+# O(log k), k = nombre d'intervalles de l'employé, quelle que soit la
+# longueur de l'horizon.
+#
+# Les intervalles sont dans des listes Python : réserver ou retirer un
+# intervalle trouve sa place en O(log k) mais décale la fin des listes,
+# soit O(k) (un memmove de pointeurs, rapide tant que k reste de l'ordre
+# de quelques milliers par employé). Seules les requêtes sont
+# logarithmiques ; un employé chargé de n tâches coûte O(n²) en
+# déplacements au total dans le pire cas.
+#
+# Un index commun à toute l'équipe (IntervalIndex) donne les employés
+# occupés sur une fenêtre sans parcourir tous les employés qualifiés :
+# avec une grande équipe, chaque essai ne coûte que les intervalles
+# proches de la fenêtre.
+
+from bisect import bisect_left, bisect_right
+
+from msrcpsp.calendars import FOREVER
+
+
+class Timeline:
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.owners = []    # tâche occupant chaque intervalle (-1 : absence)
+
+    def blocked_until(self, start, end, movable=None):
+        # Fin du dernier intervalle qui chevauche [start, end), ou None si
+        # l'employé est libre : il reste occupé au moins jusque-là pour
+        # toute fenêtre de même durée commençant après `start`. Les
+        # intervalles dont l'occupant vérifie movable(occupant) comptent
+        # comme libres (tâches que l'appelant accepte de déplacer).
+        if end <= start:
+            return None
+        j = bisect_left(self.starts, end) - 1
+        while j >= 0 and self.ends[j] > start:
+            if movable is None or not movable(self.owners[j]):
+                return self.ends[j]
+            j -= 1
+        return None
+
+    def next_free(self, start, duration, movable=None):
+        # Premier instant t >= start où l'employé est libre sur tout
+        # [t, t + duration) ; FOREVER s'il ne l'est plus jamais. Les
+        # intervalles étant disjoints, on les parcourt une seule fois vers
+        # l'avant : chacun qui bloque la fenêtre la repousse à sa fin.
+        starts, ends, owners = self.starts, self.ends, self.owners
+        t = start
+        n = len(starts)
+        j = bisect_right(ends, t)
+        while j < n and starts[j] < t + duration:
+            if movable is None or not movable(owners[j]):
+                t = ends[j]
+            j += 1
+        return t
+
+    def reserve(self, start, end, owner=-1):
+        # Place trouvée en O(log k), insertion en O(k) (voir l'en-tête)
+        if end > start:
+            j = bisect_left(self.starts, start)
+            self.starts.insert(j, start)
+            self.ends.insert(j, end)
+            self.owners.insert(j, owner)
+
+    def remove(self, start, end, owner):
+        j = bisect_left(self.starts, start)
+        while j < len(self.starts) and self.starts[j] == start:
+            if self.owners[j] == owner and self.ends[j] == end:
+                del self.starts[j], self.ends[j], self.owners[j]
+                return
+            j += 1
+
+    def overlapping(self, start, end):
+        # Occupants des intervalles qui chevauchent [start, end) ; les
+        # intervalles étant disjoints, leurs fins sont triées elles aussi
+        found = []
+        j = bisect_left(self.starts, end) - 1
+        while j >= 0 and self.ends[j] > start:
+            found.append(self.owners[j])
+            j -= 1
+        return found
+
+    def block(self, start, end, owner=-1):
+        # Occupe les trous de [start, end) sans toucher aux intervalles
+        # déjà présents (absence pendant une tâche déjà commencée) ;
+        # renvoie les intervalles ajoutés
+        busy = []
+        j = bisect_left(self.starts, end) - 1
+        while j >= 0 and self.ends[j] > start:
+            busy.append((self.starts[j], self.ends[j]))
+            j -= 1
+        added = []
+        t = start
+        for s, e in reversed(busy):
+            if s > t:
+                added.append((t, s))
+            t = max(t, e)
+        if t < end:
+            added.append((t, end))
+        for s, e in added:
+            self.reserve(s, e, owner)
+        return added
+
+
+class IntervalIndex:
+    # Intervalles de tous les employés, rangés par niveau de longueur : au
+    # niveau k, les longueurs de 2**(k-1) + 1 à 2**k, en paquets de largeur
+    # 2**k selon le début. Un intervalle du niveau k qui chevauche
+    # [start, end) commence dans (start - 2**k, end) : quelques paquets par
+    # niveau, et seulement les niveaux présents (durées des tâches, absences).
+
+    def __init__(self):
+        self.levels = {}    # niveau -> {paquet: [(début, fin, employé, occupant), ...]}
+
+    def add(self, start, end, employee, owner):
+        if end > start:
+            k = (end - start - 1).bit_length()
+            self.levels.setdefault(k, {}).setdefault(start >> k, []).append((start, end, employee, owner))
+
+    def discard(self, start, end, employee, owner):
+        k = (end - start - 1).bit_length()
+        buckets = self.levels.get(k, {})
+        bucket = buckets.get(start >> k)
+        if bucket is not None and (start, end, employee, owner) in bucket:
+            bucket.remove((start, end, employee, owner))
+            if not bucket:
+                del buckets[start >> k]
+
+    def overlapping(self, start, end):
+        # (début, fin, employé, occupant) des intervalles qui chevauchent [start, end)
+        for k, buckets in self.levels.items():
+            for b in range((start - (1 << k) + 1) >> k, ((end - 1) >> k) + 1):
+                for item in buckets.get(b, ()):
+                    if item[0] < end and item[1] > start:
+                        yield item
+
+
+class StaffProfile:
+    # Une Timeline par employé, l'index commun de leurs intervalles et les
+    # masques de compétences du réservoir. Les modifications passent par
+    # reserve / remove / block, qui tiennent les deux à jour.
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.timelines = [Timeline() for _ in pool.names]
+        self.index = IntervalIndex()
+        if pool.calendar is not None:
+            # Hors de leurs plages de disponibilité, les employés sont
+            # occupés par des absences (occupant -1)
+            for e, windows in enumerate(pool.calendar.windows):
+                if windows is not None:
+                    for start, end in windows.gaps():
+                        self.timelines[e].reserve(start, end)
+                        self.index.add(start, end, e, -1)
+
+    def earliest(self, demand, ready, duration, movable=None):
+        # Premier instant t >= ready où la demande peut être couverte par des
+        # employés libres sur tout [t, t + duration) ; renvoie (t, affectation).
+        # Si l'essai échoue en t, on saute au prochain instant où il peut
+        # réussir (voir _next_try). (None, None) si aucun créneau.
+        masks = self.pool.skill_masks
+        wanted = 0
+        for s, _ in demand:
+            if s >= 0:
+                wanted |= masks[s]
+        t = ready
+        known = {}      # premiers instants libres déjà calculés, valables tant que t ne les dépasse pas
+        while True:
+            later = self._busy(wanted, t, duration, movable, known)
+            free = wanted
+            for e in later:
+                free &= ~(1 << e)
+            matched = self.pool.match(demand, [free & masks[s] if s >= 0 else 0 for s, _ in demand])
+            if matched is not None:
+                return t, matched
+            t = self._next_try(demand, free, later)
+            if t is None or t >= FOREVER:
+                # Plus aucune plage de disponibilité à venir
+                return None, None
+
+    def _busy(self, wanted, start, duration, movable, known):
+        # Employés de `wanted` occupés sur [start, start + duration) -> premier
+        # instant où chacun est libre sur une fenêtre de cette durée
+        later = {}
+        if duration > 0:
+            for _, _, e, owner in self.index.overlapping(start, start + duration):
+                if wanted >> e & 1 and e not in later and (movable is None or not movable(owner)):
+                    later[e] = None
+            for e in later:
+                if known.get(e, start) <= start:
+                    known[e] = self.timelines[e].next_free(start, duration, movable)
+                later[e] = known[e]
+        return later
+
+    def _next_try(self, demand, free, later):
+        # Un employé occupé en t ne se libère pas avant later[e], les autres
+        # peuvent seulement se prendre. Pour une compétence servie par f
+        # employés libres sur les `needed` demandés, rien ne peut réussir
+        # avant le (needed - f)-ième de ces instants parmi ses employés
+        # occupés ; si aucune compétence ne manque d'employés (affectation
+        # impossible malgré les nombres), on essaie au premier.
+        masks = self.pool.skill_masks
+        bound = None
+        for s, needed in demand:
+            mask = masks[s] if s >= 0 else 0
+            missing = needed - (free & mask).bit_count()
+            if missing > 0:
+                times = sorted(t for e, t in later.items() if mask >> e & 1)
+                if len(times) < missing:
+                    return None
+                if bound is None or times[missing - 1] > bound:
+                    bound = times[missing - 1]
+        if bound is None:
+            return min(later.values(), default=None)
+        return bound
+
+    def reserve(self, matched, start, end, owner=-1):
+        for emps in matched:
+            for e in emps:
+                self.timelines[e].reserve(start, end, owner)
+                self.index.add(start, end, e, owner)
+
+    def remove(self, matched, start, end, owner):
+        for emps in matched:
+            for e in emps:
+                self.timelines[e].remove(start, end, owner)
+                self.index.discard(start, end, e, owner)
+
+    def block(self, e, start, end, owner=-1):
+        # Absence de l'employé e sur les trous de [start, end)
+        for s, t in self.timelines[e].block(start, end, owner):
+            self.index.add(s, t, e, owner)
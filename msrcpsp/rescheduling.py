@@ -0,0 +1,199 @@
+# ----------- REPLANIFICATION INCRÉMENTALE -------------
+# Un planning vivant : on le construit une fois (SGS série ou parallèle),
+# puis on lui signale les aléas du projet :
+#   - advance(instant)                 : l'horloge avance, les tâches déjà
+#                                        commencées sont figées ;
+#   - update_duration(tâche, durée)    : une durée glisse (tâche commencée
+#                                        ou non) ;
+#   - add_unavailability(employé, début, fin) : un employé est absent ;
+#   - add_task(nom, durée, compétences, prédécesseurs) : une tâche s'ajoute.
+# Seules les tâches touchées sont réparées : la tâche elle-même, les tâches
+# non commencées qui occupaient les mêmes employés sur la fenêtre en cause,
+# puis, de proche en proche, les successeurs dont la place ne tient plus
+# et les tâches repoussées sur les mêmes employés. Leurs réservations sont
+# retirées des profils d'occupation et elles sont replacées au plus tôt
+# (après l'instant courant et leurs prédécesseurs), dans l'ordre de leurs
+# anciens débuts ; le reste du planning ne bouge pas.
+#
+# Une tâche déjà commencée garde ses employés : une absence qui tombe
+# pendant une tâche en cours ne bloque que le temps restant libre.
+
+import heapq
+
+from msrcpsp.priorities import prio_latest_finish
+from msrcpsp.profile import StaffProfile
+from msrcpsp.schedulers import decoders
+
+
+class Rescheduler:
+
+    def __init__(self, inst, prio_func=prio_latest_finish, algo='series'):
+        order, starts, ends, assignments = decoders[algo](inst, inst.priority_rank(prio_func))
+        n = len(inst)
+        self.pool = inst.pool
+        self.skill_names = inst.skill_names
+        # Copies modifiables des colonnes de l'instance (tâches ajoutées)
+        self.names = list(inst.names)
+        self.index = dict(inst.index)
+        self.durations = list(inst.durations)
+        self.preds = [list(inst.predecessors(i)) for i in range(n)]
+        self.succs = [list(inst.successors(i)) for i in range(n)]
+        self.demands = [inst.demand(i) for i in range(n)]
+        self.starts = list(starts)
+        self.ends = list(ends)
+        self.assignments = list(assignments)
+        self.profile = StaffProfile(inst.pool)
+        for i in range(n):
+            self.profile.reserve(self.assignments[i], self.starts[i], self.ends[i], i)
+        self.now = 0
+
+    # ----------- ÉTAT -------------
+
+    def started(self, i):
+        return self.starts[i] < self.now
+
+    @property
+    def makespan(self):
+        return max(self.ends) if self.ends else 0
+
+    def schedule(self):
+        # Planning au format historique, trié par date de début
+        names = self.pool.names
+        order = sorted(range(len(self.names)), key=lambda i: (self.starts[i], i))
+        return [(self.names[i], self.starts[i], self.ends[i],
+                 {self.skill_names[s]: [names[e] for e in emps]
+                  for (s, _), emps in zip(self.demands[i], self.assignments[i])})
+                for i in order]
+
+    # ----------- ÉVÉNEMENTS -------------
+
+    def advance(self, time):
+        if time < self.now:
+            raise ValueError(f"L'horloge ne recule pas : {time} < {self.now}")
+        self.now = time
+
+    def update_duration(self, task, duration):
+        # Renvoie les noms des tâches déplacées
+        i = self.index[task]
+        if not self.started(i):
+            self.durations[i] = duration
+            return self._repair([i])
+        # Tâche en cours : même début, mêmes employés ; les tâches non
+        # commencées qui occupaient ces employés sur l'allongement bougent
+        old_end, new_end = self.ends[i], self.starts[i] + duration
+        conflicts = set()
+        for emps in self.assignments[i]:
+            for e in emps:
+                for owner in self.profile.timelines[e].overlapping(old_end, new_end):
+                    if owner < 0:
+                        raise ValueError(f"{self.pool.names[e]} est absent pendant l'allongement : "
+                                         f"impossible d'allonger {task}")
+                    if owner != i:
+                        if self.started(owner):
+                            raise ValueError(f"{self.pool.names[e]} est déjà engagé sur "
+                                             f"{self.names[owner]} : impossible d'allonger {task}")
+                        conflicts.add(owner)
+        for o in conflicts:
+            self._unplace(o)
+        self.profile.remove(self.assignments[i], self.starts[i], old_end, i)
+        self.durations[i] = duration
+        self.ends[i] = new_end
+        self.profile.reserve(self.assignments[i], self.starts[i], new_end, i)
+        return self._repair(conflicts | set(self._violated(i)))
+
+    def add_unavailability(self, employee, start, end):
+        e = self.pool.bit[employee]
+        start = max(start, self.now)
+        timeline = self.profile.timelines[e]
+        touched = {o for o in timeline.overlapping(start, end) if o >= 0 and not self.started(o)}
+        for o in touched:
+            self._unplace(o)
+        self.profile.block(e, start, end)
+        return self._repair(touched)
+
+    def add_task(self, name, duration, skills, predecessors=(), importance=0):
+        # importance : gardée pour l'interface d'InstanceBuilder.add_task
+        if name in self.index:
+            raise ValueError(f"Tâche définie deux fois : {name}")
+        missing = [p for p in predecessors if p not in self.index]
+        if missing:
+            raise ValueError(f"Prédécesseurs non définis : {missing}")
+        demand = self.pool.demand_of(skills)
+        if self.pool.assign(demand, self.pool.all) is None:
+            raise ValueError(f"Tâche {name} impossible : équipe insuffisante pour {skills}")
+        i = len(self.names)
+        self.names.append(name)
+        self.index[name] = i
+        self.durations.append(duration)
+        self.preds.append([self.index[p] for p in predecessors])
+        self.succs.append([])
+        for p in self.preds[i]:
+            self.succs[p].append(i)
+        self.demands.append(demand)
+        self.starts.append(None)
+        self.ends.append(None)
+        self.assignments.append(None)
+        return self._repair([i])
+
+    # ----------- RÉPARATION -------------
+
+    def _unplace(self, i):
+        if self.assignments[i] is not None:
+            self.profile.remove(self.assignments[i], self.starts[i], self.ends[i], i)
+            self.assignments[i] = None
+
+    def _violated(self, i):
+        # Successeurs placés qui commencent avant la fin de i
+        return [s for s in self.succs[i] if self.starts[s] is not None and self.starts[s] < self.ends[i]]
+
+    def _repair(self, seeds):
+        # Replace les tâches à réparer dans l'ordre de leurs anciens débuts
+        # (les nouvelles en dernier). Une tâche replacée peut repousser les
+        # tâches non commencées prévues après elle sur ses employés (l'ordre
+        # du planning est conservé, au lieu de sauter dans un trou lointain) ;
+        # un successeur n'est repris que si sa place ne tient plus.
+        heap = [(self._old_start(i), i) for i in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        placed = set()
+        moved = []
+
+        def push(k):
+            if k not in queued:
+                queued.add(k)
+                heapq.heappush(heap, (self._old_start(k), k))
+
+        while heap:
+            key, i = heapq.heappop(heap)
+            queued.discard(i)
+            self._unplace(i)
+
+            def movable(o):
+                return (o >= 0 and o not in placed and self.starts[o] > key
+                        and not self.started(o))
+
+            ready = max([self.now] + [self.ends[p] for p in self.preds[i]])
+            start, matched = self.profile.earliest(self.demands[i], ready, self.durations[i], movable)
+            if start is None:
+                raise RuntimeError(f"Aucun créneau pour {self.names[i]} après t={ready} "
+                                   f"dans les calendriers des employés")
+            end = start + self.durations[i]
+            for emps in matched:
+                for e in emps:
+                    for o in self.profile.timelines[e].overlapping(start, end):
+                        self._unplace(o)
+                        push(o)
+            if start != self.starts[i]:
+                moved.append(self.names[i])
+            self.starts[i] = start
+            self.ends[i] = end
+            self.assignments[i] = matched
+            self.profile.reserve(matched, start, end, i)
+            placed.add(i)
+            for s in self._violated(i):
+                push(s)
+        return list(dict.fromkeys(moved))
+
+    def _old_start(self, i):
+        start = self.starts[i]
+        return float('inf') if start is None else start
@@ -0,0 +1,161 @@
+# ----------- ÉCRITURE DES RÉSULTATS AU FIL DE L'EAU -------------
+# Deux tables, écrites au fur et à mesure que les plannings arrivent (rien
+# n'est gardé en mémoire d'un planning à l'autre) :
+#   - les lignes de résultats (FIELDS : instance, algo, priority, seed,
+#     makespan, duration_sec) ;
+#   - le détail de chaque planning, une ligne par tâche : instance, algo,
+#     priority, seed, task, start, end, assignment ("dev:Zeiny,Nezihe;test:Mli7a").
+# Pour "figures/results.parquet", les tâches vont dans
+# "figures/results_tasks.parquet".
+#
+# Relancer sur le même fichier ajoute toujours, quel que soit le format,
+# sans rien écraser : le CSV est complété en place ; un fichier Parquet
+# ou Arrow ne se complète pas, chaque nouveau lancement écrit donc une
+# partie numérotée à côté ("results.1.parquet" et "results_tasks.1.parquet",
+# puis .2, ...). result_files(path) donne le fichier et ses parties, dans
+# l'ordre des lancements (pandas.concat, pyarrow.dataset.dataset).
+#
+# Formats, choisis par l'extension :
+#   - .parquet : Parquet, un groupe de lignes par planning ;
+#   - .arrow   : Arrow IPC (fichier), un lot par planning ;
+#   - .csv     : CSV en ajout (append-only), en-tête si le fichier est nouveau.
+# Parquet et Arrow demandent pyarrow (facultatif) ; sans lui, on se
+# rabat sur le CSV de même nom. Relecture : pandas.read_parquet,
+# pyarrow.ipc.open_file, pandas.read_csv (par morceaux avec chunksize).
+
+import csv
+import glob
+import os
+import re
+import sys
+
+from msrcpsp.runner import FIELDS
+
+TASK_FIELDS = ['instance', 'algo', 'priority', 'seed', 'task', 'start', 'end', 'assignment']
+
+
+def tasks_path(path):
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_tasks{ext}"
+
+
+def part_path(path, k):
+    # k-ième partie d'un fichier de résultats : "results.parquet" -> "results.k.parquet"
+    stem, ext = os.path.splitext(path)
+    return path if k == 0 else f"{stem}.{k}{ext}"
+
+
+def result_files(path):
+    # Fichier de résultats et ses parties existantes, dans l'ordre des
+    # lancements ; tasks_path(path) pour le détail des plannings
+    stem, ext = os.path.splitext(path)
+    pattern = re.compile(re.escape(stem) + r'\.(\d+)' + re.escape(ext) + '$')
+    parts = []
+    for name in glob.glob(f"{glob.escape(stem)}.*{glob.escape(ext)}"):
+        match = pattern.match(name)
+        if match:
+            parts.append((int(match.group(1)), name))
+    return ([path] if os.path.exists(path) else []) + [name for _, name in sorted(parts)]
+
+
+def assignment_text(assigned):
+    # {'dev': ['Zeiny', 'Nezihe'], 'test': ['Mli7a']} -> "dev:Zeiny,Nezihe;test:Mli7a"
+    return ';'.join(f"{skill}:{','.join(emps)}" for skill, emps in assigned.items())
+
+
+def _task_columns(row, schedule):
+    key = [row['instance'], row['algo'], row['priority'], row['seed']]
+    n = len(schedule)
+    columns = {field: [value] * n for field, value in zip(TASK_FIELDS, key)}
+    columns['task'] = [t for t, _, _, _ in schedule]
+    columns['start'] = [start for _, start, _, _ in schedule]
+    columns['end'] = [end for _, _, end, _ in schedule]
+    columns['assignment'] = [assignment_text(assigned) for _, _, _, assigned in schedule]
+    return columns
+
+
+class CsvSink:
+
+    def __init__(self, path):
+        self.path = path
+        self.runs, self.run_writer = self._open(path, FIELDS)
+        self.tasks, self.task_writer = self._open(tasks_path(path), TASK_FIELDS)
+
+    @staticmethod
+    def _open(path, fields):
+        new_file = not os.path.exists(path)
+        f = open(path, 'a', newline='', encoding='utf-8')
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(fields)
+        return f, writer
+
+    def add(self, row, schedule=None):
+        self.run_writer.writerow([row[field] for field in FIELDS])
+        self.runs.flush()
+        if schedule is not None:
+            key = [row['instance'], row['algo'], row['priority'], row['seed']]
+            self.task_writer.writerows(key + [t, start, end, assignment_text(assigned)]
+                                       for t, start, end, assigned in schedule)
+            self.tasks.flush()
+
+    def close(self):
+        self.runs.close()
+        self.tasks.close()
+
+
+class ArrowSink:
+
+    def __init__(self, path):
+        import pyarrow as pa
+
+        self.pa = pa
+        key = [('instance', pa.string()), ('algo', pa.string()), ('priority', pa.string()),
+               ('seed', pa.int64())]
+        self.run_schema = pa.schema(key + [('makespan', pa.int64()), ('duration_sec', pa.float64())])
+        self.task_schema = pa.schema(key + [('task', pa.string()), ('start', pa.int64()),
+                                            ('end', pa.int64()), ('assignment', pa.string())])
+        # Première partie libre (résultats et tâches) : les lancements
+        # précédents restent intacts
+        k = 0
+        while os.path.exists(part_path(path, k)) or os.path.exists(part_path(tasks_path(path), k)):
+            k += 1
+        self.path = part_path(path, k)
+        self.runs = self._writer(self.path, self.run_schema)
+        self.tasks = self._writer(part_path(tasks_path(path), k), self.task_schema)
+
+    def _writer(self, path, schema):
+        if path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(path, schema)
+        return self.pa.ipc.new_file(path, schema)
+
+    def add(self, row, schedule=None):
+        pa = self.pa
+        self.runs.write_table(pa.Table.from_pydict({field: [row[field]] for field in FIELDS},
+                                                   schema=self.run_schema))
+        if schedule is not None:
+            self.tasks.write_table(pa.Table.from_pydict(_task_columns(row, schedule),
+                                                        schema=self.task_schema))
+
+    def close(self):
+        self.runs.close()
+        self.tasks.close()
+
+
+def open_sink(path):
+    # Table de résultats (et détail des plannings) selon l'extension ;
+    # Parquet / Arrow sans pyarrow -> CSV de même nom
+    ext = os.path.splitext(path)[1].lower()
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    if ext == '.csv':
+        return CsvSink(path)
+    if ext not in ('.parquet', '.arrow'):
+        raise ValueError(f"Format de résultats inconnu : {path} (attendu : .parquet, .arrow, .csv)")
+    try:
+        return ArrowSink(path)
+    except ImportError:
+        fallback = os.path.splitext(path)[0] + '.csv'
+        print(f"pyarrow absent : résultats écrits en CSV dans {fallback}", file=sys.stderr)
+        return CsvSink(fallback)
@@ -0,0 +1,172 @@
+# ----------- EXÉCUTION EN LOT (plusieurs processus) -------------
+# Chaque travail (instance, algorithme, priorité, graine) est planifié une
+# seule fois dans un processus du pool ; les lignes de résultats sont
+# écrites dans le CSV au fil de l'eau et les plannings sont renvoyés pour
+# les graphiques (Gantt, comparatifs) sans être recalculés. Avec un cache
+# (msrcpsp.cache), un planning déjà calculé pour le même contenu
+# d'instance, le même algorithme et la même règle est relu au lieu d'être
+# recalculé ; la durée rapportée est alors celle du calcul d'origine.
+
+import csv
+import functools
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from msrcpsp.cache import ScheduleCache
+from msrcpsp.justification import justify_schedule
+from msrcpsp.loaders import load_instance
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms
+from msrcpsp.trace import EventLog, replay
+
+FIELDS = ['instance', 'algo', 'priority', 'seed', 'makespan', 'duration_sec']
+JUSTIFY = 'fbi'     # suffixe des algorithmes suivis de la double justification
+# Algorithmes de chaque moteur : Python (msrcpsp.schedulers) et C++
+# (msrcpsp.native, compilé au premier appel)
+BACKENDS = {
+    'python': list(algorithms),
+    'native': ['native_parallel', 'native_series'],
+}
+BACKENDS['both'] = BACKENDS['python'] + BACKENDS['native']
+
+
+@functools.lru_cache(maxsize=8)
+def _load(path):
+    # Chaque processus garde les dernières instances lues : les travaux
+    # d'une même instance ne relisent pas le fichier
+    return load_instance(path)
+
+
+@functools.lru_cache(maxsize=4)
+def _cache(path):
+    # Un cache (connexion SQLite et niveau mémoire) par processus
+    return ScheduleCache(path)
+
+
+def make_jobs(instances, algos=None, prios=None, seeds=(0,), justify=False):
+    # instances : chemins de fichiers ou instances déjà compilées
+    # justify   : ajoute pour chaque algorithme sa variante suivie de la
+    #             double justification ("parallel+fbi", ...)
+    algos = list(algorithms) if algos is None else algos
+    if justify:
+        algos = [a for algo in algos for a in (algo, f"{algo}+{JUSTIFY}")]
+    prios = list(priorities) if prios is None else prios
+    return [(source, algo, prio, seed)
+            for source in instances for algo in algos for prio in prios for seed in seeds]
+
+
+def algorithm(name):
+    # Fonction d'ordonnancement d'après son nom ; le module natif n'est
+    # chargé que pour les algorithmes "native_..."
+    if name in algorithms:
+        return algorithms[name]
+    from msrcpsp.native import algorithms as native_algorithms
+    return native_algorithms[name]
+
+
+def compute_schedule(inst, algo, prio, trace=None):
+    # algo : nom d'algorithme, éventuellement suivi de "+fbi"
+    # Renvoie (planning, makespan)
+    base, _, post = algo.partition('+')
+    if post != JUSTIFY:
+        return algorithm(base)(inst, priorities[prio], trace=trace)
+    # Le journal suit le planning justifié, rejoué après coup, et non le
+    # passage de l'algorithme de base
+    sched, mksp = justify_schedule(inst, algorithm(base)(inst, priorities[prio])[0])
+    if trace is not None:
+        replay(trace, inst, sched)
+    return sched, mksp
+
+
+def run_job(job, keep_schedule=True, trace_dir=None, trace_format='jsonl', cache_path=None):
+    # trace_dir  : dossier où écrire le journal d'événements de chaque travail
+    #              (désactivé par défaut ; l'écriture se fait après la mesure)
+    # cache_path : fichier SQLite du cache des plannings (ignoré avec une
+    #              trace, qui demande un vrai calcul)
+    source, algo, prio, seed = job
+    inst = _load(source) if isinstance(source, str) else source
+    trace = EventLog() if trace_dir else None
+    if cache_path and trace is None:
+        sched, mksp, duration, _ = _cache(cache_path).schedule(
+            inst, algo, prio, functools.partial(compute_schedule, inst, algo, prio))
+    else:
+        start_time = time.perf_counter()
+        sched, mksp = compute_schedule(inst, algo, prio, trace)
+        duration = time.perf_counter() - start_time
+    if trace is not None:
+        trace.write(os.path.join(trace_dir, f"{inst.name}_{algo}_{prio}_{seed}.{trace_format}"), inst)
+    row = {
+        'instance': inst.name,
+        'algo': algo,
+        'priority': prio,
+        'seed': seed,
+        'makespan': mksp,
+        'duration_sec': duration,
+    }
+    return row, (sched if keep_schedule else None)
+
+
+def append_rows(csv_path, rows):
+    # Ajoute des lignes au format FIELDS (en-tête si le fichier est nouveau)
+    new_file = not os.path.exists(csv_path)
+    with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_batch(jobs, workers=None, csv_path=None, keep_schedules=True, trace_dir=None,
+              trace_format='jsonl', cache_path=None, sink=None):
+    # workers : nombre de processus (None = nombre de cœurs, 1 = sur place)
+    # sink    : table de résultats et de plannings écrite au fil de l'eau
+    #           (msrcpsp.results.open_sink) ; avec keep_schedules=False, les
+    #           plannings ne sont pas gardés une fois écrits
+    # Renvoie la liste des (ligne, planning) dans l'ordre des travaux
+    if workers is None:
+        workers = os.cpu_count() or 1
+    results = [None] * len(jobs)
+    options = (keep_schedules or sink is not None, trace_dir, trace_format, cache_path)
+    if trace_dir:
+        os.makedirs(trace_dir, exist_ok=True)
+    out = open(csv_path, 'w', newline='', encoding='utf-8') if csv_path else None
+    try:
+        writer = csv.DictWriter(out, fieldnames=FIELDS) if out else None
+        if writer:
+            writer.writeheader()
+
+        def done(k, result):
+            row, sched = result
+            results[k] = (row, sched if keep_schedules else None)
+            if writer:
+                writer.writerow(row)
+                out.flush()
+            if sink is not None:
+                sink.add(row, sched)
+
+        if workers == 1:
+            for k, job in enumerate(jobs):
+                done(k, run_job(job, *options))
+            return results
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Fenêtre de travaux en vol bornée : un balayage de milliers
+            # d'instances ne crée pas tous les futurs d'un coup
+            pending = {}
+            todo = iter(enumerate(jobs))
+            for k, job in todo:
+                pending[executor.submit(run_job, job, *options)] = k
+                if len(pending) >= 4 * workers:
+                    break
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done(pending.pop(future), future.result())
+                    for k, job in todo:
+                        pending[executor.submit(run_job, job, *options)] = k
+                        break
+        return results
+    finally:
+        if out:
+            out.close()
@@ -0,0 +1,271 @@
+# ----------- ÉCHANTILLONNAGE MULTI-PASSES -------------
+# Au lieu d'une seule passe déterministe par règle, on tire des milliers de
+# listes d'activités au hasard, biaisées par une règle de priorité
+# (échantillonnage biaisé par le regret) : parmi les tâches dont les
+# prédécesseurs sont déjà listés, la tâche j est tirée avec une
+# probabilité proportionnelle à (regret_j + 1) ** alpha, où
+# regret_j = plus mauvais rang des candidates - rang de j. Chaque liste est
+# décodée par l'algorithme parallèle ou série et on garde le meilleur
+# planning. La première passe est la règle elle-même : le résultat n'est
+# jamais moins bon que la passe déterministe.
+#
+# Les passes sont découpées en lots répartis sur un pool de processus ;
+# chaque lot a sa propre graine (graine de départ, numéro du lot), si bien
+# que le résultat ne dépend pas du nombre de processus. La recherche
+# s'arrête dès que la borne inférieure du chemin critique est atteinte.
+#
+# Lancement :
+#   python -m msrcpsp.sampling instances/assurance.json --rule latest_finish --passes 5000
+
+import argparse
+import math
+import os
+import random
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from msrcpsp.loaders import load_instance
+from msrcpsp.priorities import priorities
+from msrcpsp.runner import append_rows
+from msrcpsp.schedulers import decoders, makespan_of
+
+
+def sample_activity_list(inst, rank, rng, alpha=1.0):
+    # Renvoie la position de chaque tâche dans une liste d'activités tirée
+    # au hasard, compatible avec les précédences. Pour alpha entier, les
+    # poids sont tenus à jour dans des arbres de Fenwick indexés par rang :
+    # (worst - r + 1) ** alpha se développe en sommes des puissances
+    # (-r) ** k des rangs éligibles, k <= alpha, et un tirage coûte
+    # O(alpha log n) au lieu d'un passage sur toutes les éligibles.
+    # Sinon, les poids sont recalculés à chaque tirage.
+    if alpha < 0 or alpha != int(alpha):
+        return _sample_by_scan(inst, rank, rng, alpha)
+    a = int(alpha)
+    n = len(inst)
+    succ_ptr, succ_idx = inst.succ_ptr, inst.succ_idx
+    indegree = inst.indegrees()
+    task = array('i', bytes(4 * n))     # tâche de chaque rang
+    for i in range(n):
+        task[rank[i]] = i
+    binom = [math.comb(a, k) for k in range(a + 1)]
+    # sums[k][x] : somme des (-r) ** k des rangs éligibles du bloc x de Fenwick
+    sums = [[0] * (n + 1) for _ in range(a + 1)]
+    totals = [0] * (a + 1)      # mêmes sommes sur tous les rangs éligibles
+    top = 1 << n.bit_length()
+    randbelow = rng.randrange
+
+    def update(r, sign):
+        x = r + 1
+        values = [sign * (-r) ** k for k in range(a + 1)]
+        for k in range(a + 1):
+            totals[k] += values[k]
+        while x <= n:
+            for k in range(a + 1):
+                sums[k][x] += values[k]
+            x += x & -x
+
+    def descend(target, weight):
+        # Plus petit rang dont le préfixe de poids dépasse `target`
+        x = 0
+        step = top
+        while step:
+            y = x + step
+            if y <= n:
+                w = weight(y)
+                if w <= target:
+                    x = y
+                    target -= w
+            step >>= 1
+        return x
+
+    eligible = 0
+    worst = -1
+    for i, d in enumerate(indegree):
+        if d == 0:
+            update(rank[i], 1)
+            eligible += 1
+            worst = max(worst, rank[i])
+    counts = sums[0]
+    position = array('i', bytes(4 * n))
+    for p in range(n):
+        powers = [(worst + 1) ** (a - k) * binom[k] for k in range(a + 1)]
+
+        def weight(x):
+            return sum(powers[k] * sums[k][x] for k in range(a + 1))
+
+        total = sum(powers[k] * totals[k] for k in range(a + 1))
+        r = descend(randbelow(total), weight)
+        i = task[r]
+        update(r, -1)
+        eligible -= 1
+        if r == worst:
+            worst = descend(eligible - 1, counts.__getitem__) if eligible else -1
+        position[i] = p
+        for j in range(succ_ptr[i], succ_ptr[i + 1]):
+            s = succ_idx[j]
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                update(rank[s], 1)
+                eligible += 1
+                worst = max(worst, rank[s])
+    return position
+
+
+def _sample_by_scan(inst, rank, rng, alpha):
+    n = len(inst)
+    succ_ptr, succ_idx = inst.succ_ptr, inst.succ_idx
+    indegree = inst.indegrees()
+    eligible = [i for i, d in enumerate(indegree) if d == 0]
+    position = array('i', bytes(4 * n))
+    choices = rng.choices
+    for p in range(n):
+        worst = max(rank[i] for i in eligible)
+        weights = [(worst - rank[i] + 1) ** alpha for i in eligible]
+        k = choices(range(len(eligible)), weights)[0]
+        i = eligible[k]
+        eligible[k] = eligible[-1]
+        eligible.pop()
+        position[i] = p
+        for j in range(succ_ptr[i], succ_ptr[i + 1]):
+            s = succ_idx[j]
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                eligible.append(s)
+    return position
+
+# ----------- LOTS DE PASSES (un processus) -------------
+
+
+_instance = None
+
+
+def _init_worker(inst):
+    # L'instance n'est envoyée qu'une fois à chaque processus
+    global _instance
+    _instance = inst
+
+
+def run_passes(inst, algo, rule, alpha, seed, batch, passes, bound, deadline=None):
+    # Renvoie (meilleur makespan, liste d'activités correspondante, passes faites)
+    decode = decoders[algo]
+    rank = inst.priority_rank(priorities[rule])
+    rng = random.Random(seed * 1_000_003 + batch)
+    best, best_position = None, None
+    done = 0
+    for p in range(passes):
+        if batch == 0 and p == 0:
+            position = rank
+        else:
+            position = sample_activity_list(inst, rank, rng, alpha)
+        makespan = makespan_of(decode(inst, position)[2])
+        done += 1
+        if best is None or makespan < best:
+            best, best_position = makespan, position
+        if best <= bound or (deadline is not None and time.time() > deadline):
+            break
+    return best, best_position, done
+
+
+def _run_batch(args):
+    return run_passes(_instance, *args)
+
+# ----------- RECHERCHE -------------
+
+
+def sample(inst, rule='latest_finish', algo='parallel', passes=1000, workers=None, seed=0,
+           alpha=1.0, time_limit=None, batch_size=50):
+    # workers : nombre de processus (None = nombre de cœurs, 1 = sur place)
+    # Renvoie un dict : planning, makespan, borne, passes, durée, passes/s
+    if passes < 1:
+        raise ValueError(f"Nombre de passes invalide : {passes} (au moins 1)")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    bound = inst.critical_path_length
+    n_batches = math.ceil(passes / batch_size)
+    deadline = time.time() + time_limit if time_limit is not None else None
+    best, best_position, total = None, None, 0
+
+    def batch_args(b):
+        size = min(batch_size, passes - b * batch_size)
+        return (algo, rule, alpha, seed, b, size, bound, deadline)
+
+    def stop():
+        return (best is not None and best <= bound) or (deadline is not None and time.time() > deadline)
+
+    def keep(result):
+        nonlocal best, best_position, total
+        makespan, position, done = result
+        total += done
+        if best is None or makespan < best:
+            best, best_position = makespan, position
+
+    start_time = time.perf_counter()
+    if workers == 1:
+        for b in range(n_batches):
+            keep(run_passes(inst, *batch_args(b)))
+            if stop():
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(inst,)) as executor:
+            # Quelques lots d'avance par processus, pas plus : un arrêt
+            # anticipé n'attend que les lots déjà partis
+            pending = set()
+            todo = iter(range(n_batches))
+            for b in todo:
+                pending.add(executor.submit(_run_batch, batch_args(b)))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if not future.cancelled():
+                        keep(future.result())
+                if stop():
+                    for future in pending:
+                        future.cancel()
+                    continue
+                for b in todo:
+                    pending.add(executor.submit(_run_batch, batch_args(b)))
+                    if len(pending) >= 2 * workers:
+                        break
+    elapsed = time.perf_counter() - start_time
+
+    order, starts, ends, assignments = decoders[algo](inst, best_position)
+    return {
+        'schedule': inst.to_schedule(order, starts, ends, assignments),
+        'makespan': best,
+        'lower_bound': bound,
+        'passes': total,
+        'duration_sec': elapsed,
+        'passes_per_sec': total / elapsed if elapsed > 0 else float('inf'),
+    }
+
+# ----------- LANCEMENT -------------
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Échantillonnage biaisé multi-passes")
+    parser.add_argument('instance', help="fichier d'instance")
+    parser.add_argument('--rule', default='latest_finish', choices=list(priorities))
+    parser.add_argument('--algo', default='parallel', choices=list(decoders))
+    parser.add_argument('--passes', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--alpha', type=float, default=1.0, help="force du biais (0 = uniforme)")
+    parser.add_argument('--time-limit', type=float, default=None, help="secondes")
+    parser.add_argument('--csv', default=None, help="ajouter le résultat à ce CSV (format comparison_ms_rcpsp)")
+    args = parser.parse_args()
+
+    inst = load_instance(args.instance)
+    result = sample(inst, args.rule, args.algo, args.passes, args.workers, args.seed,
+                    args.alpha, args.time_limit)
+    print(f"[{inst.name} - {args.algo} - {args.rule}] meilleur makespan {result['makespan']} "
+          f"(borne {result['lower_bound']}), {result['passes']} passes en "
+          f"{result['duration_sec']:.2f}s, {result['passes_per_sec']:.0f} passes/s")
+    if args.csv:
+        append_rows(args.csv, [{'instance': inst.name, 'algo': f"sampling_{args.algo}",
+                                'priority': args.rule, 'seed': args.seed,
+                                'makespan': result['makespan'],
+                                'duration_sec': result['duration_sec']}])
@@ -0,0 +1,128 @@
+# ----------- ALGORITHMES D'ORDONNANCEMENT -------------
+# Chaque algorithme reçoit l'instance à planifier (msrcpsp.instance.Instance)
+# et une règle de priorité : plusieurs instances peuvent être planifiées
+# l'une après l'autre dans le même processus. Le calcul se fait sur les
+# numéros de tâches ; les noms ne reviennent que dans le planning renvoyé.
+# Le paramètre optionnel `trace` reçoit les démarrages et fins de tâches
+# (msrcpsp.trace.EventLog) : rien n'est affiché pendant le calcul.
+#
+# parallel_sgs / serial_sgs sont les décodeurs : ils prennent directement
+# un rang par tâche (règle de priorité, liste d'activités tirée au hasard
+# ou génome) et renvoient (ordre, débuts, fins, affectations) sans
+# repasser par les noms.
+
+import heapq
+from array import array
+
+from msrcpsp.engine import run_parallel
+from msrcpsp.profile import StaffProfile
+
+# ----------- ALGO PARALLÈLE -------------
+
+
+def parallel_sgs(inst, rank, trace=None, pool=None):
+    # Employés libres suivis par le réservoir, mis à jour au démarrage et
+    # à la fin de chaque tâche ; `pool` remplace le réservoir de l'instance
+    # (ordre de préférence des employés, voir EmployeePool.permuted).
+    # Avec des calendriers, seuls les employés disponibles sur toute la
+    # durée de la tâche sont candidats, et l'horloge s'arrête aussi aux
+    # changements de disponibilité.
+    inst.check_feasibility()
+    pool = (pool or inst.pool).copy()
+    kinds, kind = inst.demand_kinds
+    calendar = pool.calendar
+
+    def saturated():
+        # Plus aucun employé libre : seuls les jalons démarrent encore
+        return not pool.free
+
+    if calendar is None:
+        def acquire(i, time_now):
+            return pool.claim(kinds[kind[i]])
+
+        return run_parallel(inst, rank, acquire, pool.release, trace, saturated=saturated)
+
+    durations = inst.durations
+    sweep = calendar.sweep()
+
+    def acquire(i, time_now):
+        return pool.claim(kinds[kind[i]], sweep.available(pool.free, time_now, time_now + durations[i]))
+
+    # Les employés disponibles dépendent aussi de la durée de la tâche
+    return run_parallel(inst, rank, acquire, pool.release, trace, calendar.next_change,
+                        key=lambda i: (kind[i], durations[i]), saturated=saturated)
+
+
+def schedule_parallel(inst, prio_func, trace=None):
+    order, starts, ends, assignments = parallel_sgs(inst, inst.priority_rank(prio_func), trace)
+    return inst.to_schedule(order, starts, ends, assignments), makespan_of(ends)
+
+# ----------- ALGO SÉRIE (SGS série) -------------
+
+
+def serial_sgs(inst, rank, trace=None, pool=None):
+    # Schéma de génération série : les tâches sont prises une à une, par
+    # priorité parmi celles dont tous les prédécesseurs sont placés, et
+    # placées au plus tôt après leurs prédécesseurs là où des employés
+    # compétents sont libres sur toute leur durée (profils d'occupation,
+    # msrcpsp.profile). Une tâche peut ainsi se glisser avant une tâche
+    # placée plus tôt dans la liste. Les calendriers éventuels sont des
+    # absences dans les profils.
+    inst.check_feasibility()
+    n = len(inst)
+    durations = inst.durations
+    kinds, kind = inst.demand_kinds
+    succ_ptr, succ_idx = inst.succ_ptr, inst.succ_idx
+    indegree = inst.indegrees()
+    eligible = [(rank[i], i) for i, d in enumerate(indegree) if d == 0]
+    heapq.heapify(eligible)
+    profile = StaffProfile(pool or inst.pool)
+    release_time = array('q', bytes(8 * n))   # fin du dernier prédécesseur
+    starts = array('q', bytes(8 * n))
+    ends = array('q', bytes(8 * n))
+    assignments = [None] * n
+    order = array('i')
+
+    while eligible:
+        _, i = heapq.heappop(eligible)
+        start, matched = profile.earliest(kinds[kind[i]], release_time[i], durations[i])
+        if start is None:
+            raise RuntimeError(f"Aucun créneau pour {inst.names[i]} après t={release_time[i]} "
+                               f"dans les calendriers des employés")
+        end = start + durations[i]
+        profile.reserve(matched, start, end, i)
+        starts[i] = start
+        ends[i] = end
+        assignments[i] = matched
+        order.append(i)
+        if trace is not None:
+            trace.start(start, i, matched)
+            trace.finish(end, i)
+        for k in range(succ_ptr[i], succ_ptr[i + 1]):
+            s = succ_idx[k]
+            if end > release_time[s]:
+                release_time[s] = end
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                heapq.heappush(eligible, (rank[s], s))
+    return order, starts, ends, assignments
+
+
+def schedule_series(inst, prio_func, trace=None):
+    order, starts, ends, assignments = serial_sgs(inst, inst.priority_rank(prio_func), trace)
+    return inst.to_schedule(order, starts, ends, assignments), makespan_of(ends)
+
+
+def makespan_of(ends):
+    return max(ends) if len(ends) else 0
+
+
+decoders = {
+    'parallel': parallel_sgs,
+    'series': serial_sgs,
+}
+
+algorithms = {
+    'parallel': schedule_parallel,
+    'series': schedule_series,
+}
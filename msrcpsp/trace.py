@@ -0,0 +1,129 @@
+# ----------- JOURNAL D'ÉVÉNEMENTS -------------
+# Remplace l'affichage console pendant l'ordonnancement. Les algorithmes
+# acceptent un paramètre `trace` : tout objet qui a les méthodes
+#   start(instant, tâche, affectation)   et   finish(instant, tâche)
+# (numéros de tâches, affectation interne alignée sur la demande). Sans
+# trace, la boucle ne fait qu'un test par événement.
+#
+# EventLog garde les événements dans des colonnes en mémoire (avec une
+# capacité optionnelle : anneau qui ne garde que les derniers) et les écrit
+# après coup en JSONL lisible ou en binaire compact.
+
+import json
+import sys
+from array import array
+
+START, FINISH = 0, 1
+KINDS = ('start', 'finish')
+MAGIC = b'MSRT\x01\x00\x00\x00'
+
+
+class EventLog:
+
+    def __init__(self, capacity=None):
+        # capacity : nombre maximal d'événements gardés (None = tous)
+        self.capacity = capacity
+        self.kinds = bytearray()
+        self.times = array('q')
+        self.tasks = array('i')
+        self.assignments = []
+        self.count = 0      # événements reçus, y compris ceux écrasés
+
+    def start(self, time, task, assignment):
+        self._add(START, time, task, assignment)
+
+    def finish(self, time, task):
+        self._add(FINISH, time, task, None)
+
+    def _add(self, kind, time, task, assignment):
+        if self.capacity is None or len(self.tasks) < self.capacity:
+            self.kinds.append(kind)
+            self.times.append(time)
+            self.tasks.append(task)
+            self.assignments.append(assignment)
+        else:
+            k = self.count % self.capacity
+            self.kinds[k] = kind
+            self.times[k] = time
+            self.tasks[k] = task
+            self.assignments[k] = assignment
+        self.count += 1
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __iter__(self):
+        # (type, instant, tâche, affectation) dans l'ordre chronologique
+        n = len(self.tasks)
+        first = self.count % n if self.capacity is not None and self.count > n else 0
+        for j in range(n):
+            k = (first + j) % n
+            yield self.kinds[k], self.times[k], self.tasks[k], self.assignments[k]
+
+    def clear(self):
+        self.__init__(self.capacity)
+
+    # ----------- ÉCRITURE -------------
+
+    def write_jsonl(self, path, inst=None):
+        # Une ligne JSON par événement ; avec l'instance, tâches et
+        # employés sont écrits par leur nom
+        with open(path, 'w', encoding='utf-8') as f:
+            for kind, time, task, assignment in self:
+                event = {'event': KINDS[kind], 'time': time}
+                if inst is None:
+                    event['task'] = task
+                    if assignment is not None:
+                        event['assignment'] = assignment
+                else:
+                    event['task'] = inst.names[task]
+                    if assignment is not None:
+                        event['assignment'] = inst.assigned_names(task, assignment)
+                f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    def write_binary(self, path):
+        # MAGIC, nombre d'événements 'q', types 'b', instants 'q', tâches 'i',
+        # puis employés affectés : pointeurs 'q' + numéros d'employés 'i'
+        kinds, times, tasks = array('b'), array('q'), array('i')
+        emp_ptr, emp_idx = array('q', [0]), array('i')
+        for kind, time, task, assignment in self:
+            kinds.append(kind)
+            times.append(time)
+            tasks.append(task)
+            for emps in assignment or ():
+                emp_idx.extend(emps)
+            emp_ptr.append(len(emp_idx))
+        columns = [array('q', [len(tasks)]), kinds, times, tasks, emp_ptr, emp_idx]
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            for values in columns:
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                values.tofile(f)
+
+    def write(self, path, inst=None):
+        if path.endswith('.jsonl'):
+            self.write_jsonl(path, inst)
+        else:
+            self.write_binary(path)
+
+
+def replay(trace, inst, schedule):
+    # Journal d'un planning déjà calculé, au format historique (nom, début,
+    # fin, affectation) : par exemple le planning d'une double justification,
+    # que l'algorithme de base n'a pas produit. À chaque instant, les fins
+    # d'abord puis les démarrages, dans l'ordre du planning ; une tâche de
+    # durée nulle finit juste après son démarrage
+    index, bit = inst.index, inst.pool.bit
+    events = []
+    for k, (t, start, end, assigned) in enumerate(schedule):
+        i = index[t]
+        matched = [[bit[e] for e in assigned.get(inst.skill_names[s], ())] for s, _ in inst.demand(i)]
+        events.append((start, 1, k, i, matched))
+        events.append((end, 0 if end > start else 2, k, i, None))
+    events.sort(key=lambda event: event[:3])
+    for time, kind, _, i, matched in events:
+        if kind == 1:
+            trace.start(time, i, matched)
+        else:
+            trace.finish(time, i)
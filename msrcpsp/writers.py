@@ -0,0 +1,153 @@
+# ----------- ÉCRITURE DES INSTANCES -------------
+# Formats relus par msrcpsp.loaders :
+#   - JSON et CSV (mêmes schémas que le chargement, une tâche par ligne)
+#   - binaire .msrb : les colonnes de l'instance compilée écrites telles
+#     quelles (petit-boutiste), relues sans analyse de texte ; c'est le
+#     format conseillé au-delà de quelques centaines de milliers de tâches
+#
+# Disposition du fichier .msrb :
+#   MAGIC (8 octets)
+#   en-tête 'q' : tâches, précédences, demandes, compétences, employés,
+#                 compétences d'employés, longueur du nom
+#   nom de l'instance (UTF-8)
+#   durées 'i', importances 'i'
+#   précédences : prédécesseurs 'i', successeurs 'i'
+#   demandes    : tâches 'i', compétences 'i', nombres d'employés 'i'
+#   noms des tâches, des compétences, des employés : décalages 'q' + octets
+#   compétences des employés : pointeurs 'q' + numéros de compétence 'i'
+#   calendriers (facultatif, jusqu'à la fin du fichier) : nombre de plages
+#   'q', un drapeau 'b' par employé (1 = a un calendrier), pointeurs 'q'
+#   vers ses plages, débuts 'q', fins 'q' (-1 = sans fin)
+
+import csv
+import json
+import os
+import sys
+from array import array
+
+from msrcpsp.instance import NameTable
+
+MAGIC = b'MSRB\x01\x00\x00\x00'
+
+
+def _rows(ptr):
+    # Numéro de ligne de chaque élément d'un tableau CSR
+    return array('i', (r for r in range(len(ptr) - 1) for _ in range(ptr[r + 1] - ptr[r])))
+
+
+def _put(f, values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(f)
+
+
+def _put_names(f, table):
+    _put(f, table.offsets)
+    f.write(table.data)
+
+# ----------- JSON / CSV -------------
+
+
+def write_json(inst, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "name": %s,\n  "tasks": {' % json.dumps(inst.name, ensure_ascii=False))
+        for i, name in enumerate(inst.names):
+            task = {
+                'duration': inst.durations[i],
+                'skills': inst.skills(i),
+                'predecessors': [inst.names[p] for p in inst.predecessors(i)],
+                'importance': inst.importance[i],
+            }
+            f.write('%s\n    %s: %s' % (',' if i else '', json.dumps(name, ensure_ascii=False),
+                                         json.dumps(task, ensure_ascii=False)))
+        f.write('\n  },\n  "employees": [')
+        for k, emp in enumerate(inst.employees):
+            f.write('%s\n    %s' % (',' if k else '', json.dumps(emp, ensure_ascii=False)))
+        f.write('\n  ]\n}\n')
+
+
+def write_csv(inst, path):
+    # Tâches dans `path`, employés dans "<nom>_employees.csv"
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'duration', 'skills', 'predecessors', 'importance'])
+        for i, name in enumerate(inst.names):
+            writer.writerow([
+                name, inst.durations[i],
+                ';'.join(f"{s}:{c}" for s, c in inst.skills(i).items()),
+                ';'.join(inst.names[p] for p in inst.predecessors(i)),
+                inst.importance[i],
+            ])
+    with open(os.path.splitext(path)[0] + '_employees.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if inst.pool.calendar is None:
+            writer.writerow(['name', 'skills'])
+            for emp in inst.employees:
+                writer.writerow([emp['name'], ';'.join(emp['skills'])])
+        else:
+            writer.writerow(['name', 'skills', 'availability'])
+            for emp in inst.employees:
+                windows = emp.get('availability') or ()
+                writer.writerow([emp['name'], ';'.join(emp['skills']),
+                                 ';'.join(f"{s}-{'' if e is None else e}" for s, e in windows)])
+
+# ----------- BINAIRE -------------
+
+
+def write_binary(inst, path):
+    skill_index = inst.pool.skill_index
+    emp_ptr = array('q', [0])
+    emp_skills = array('i')
+    for emp in inst.employees:
+        emp_skills.extend(skill_index[s] for s in emp['skills'])
+        emp_ptr.append(len(emp_skills))
+    name = inst.name.encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        _put(f, array('q', [len(inst), len(inst.pred_idx), len(inst.demand_skill),
+                            len(inst.skill_names), len(inst.employees), len(emp_skills), len(name)]))
+        f.write(name)
+        _put(f, inst.durations)
+        _put(f, inst.importance)
+        _put(f, inst.pred_idx)
+        _put(f, _rows(inst.pred_ptr))
+        _put(f, _rows(inst.demand_ptr))
+        _put(f, inst.demand_skill)
+        _put(f, inst.demand_count)
+        _put_names(f, inst.names)
+        _put_names(f, NameTable(inst.skill_names))
+        _put_names(f, NameTable(emp['name'] for emp in inst.employees))
+        _put(f, emp_ptr)
+        _put(f, emp_skills)
+        if inst.pool.calendar is not None:
+            flags = array('b')
+            win_ptr = array('q', [0])
+            win_starts, win_ends = array('q'), array('q')
+            for emp in inst.employees:
+                windows = emp.get('availability')
+                flags.append(windows is not None)
+                for start, end in windows or ():
+                    win_starts.append(start)
+                    win_ends.append(-1 if end is None else end)
+                win_ptr.append(len(win_starts))
+            _put(f, array('q', [len(win_starts)]))
+            _put(f, flags)
+            _put(f, win_ptr)
+            _put(f, win_starts)
+            _put(f, win_ends)
+
+
+writers = {
+    '.json': write_json,
+    '.csv': write_csv,
+    '.msrb': write_binary,
+}
+
+
+def write_instance(inst, path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in writers:
+        raise ValueError(f"Format d'instance inconnu : {path} (attendu : {', '.join(writers)})")
+    writers[ext](inst, path)
@@ -0,0 +1,58 @@
+# Couplage employés / compétences
+import random
+from itertools import permutations
+
+from msrcpsp.assignment import assign_employees_greedy, iter_bits, match_skills
+
+
+def check(demand, candidates, assigned):
+    used = [e for group in assigned for e in group]
+    assert len(used) == len(set(used))
+    for (_, needed), mask, group in zip(demand, candidates, assigned):
+        assert len(group) == needed
+        assert all(mask >> e & 1 for e in group)
+
+
+def brute_force(demand, candidates, n):
+    # Existe-t-il une affectation ? (essai de tous les ordres d'employés)
+    slots = [j for j, (_, needed) in enumerate(demand) for _ in range(needed)]
+    if len(slots) > n:
+        return False
+    return any(all(candidates[j] >> e & 1 for j, e in zip(slots, order))
+               for order in permutations(range(n), len(slots)))
+
+
+def test_iter_bits():
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+
+
+def test_augmenting_path_where_greedy_fails():
+    # Employé 0 : dev + test, employé 1 : dev seulement. Le premier choix
+    # donne 0 au dev et bloque le test ; le couplage réaffecte
+    employees = [{'name': 'a', 'skills': ['dev', 'test']}, {'name': 'b', 'skills': ['dev']}]
+    assert assign_employees_greedy({'dev': 1, 'test': 1}, [], employees) is None
+    demand = [('dev', 1), ('test', 1)]
+    candidates = [0b11, 0b01]
+    assigned = match_skills(demand, candidates)
+    assert assigned == [[1], [0]]
+    check(demand, candidates, assigned)
+
+
+def test_infeasible_demand():
+    # Trop peu de candidats pour une compétence, ou pour l'ensemble
+    assert match_skills([('dev', 3)], [0b11]) is None
+    assert match_skills([('dev', 1), ('test', 1)], [0b1, 0b1]) is None
+
+
+def test_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(500):
+        n = rng.randint(1, 5)
+        k = rng.randint(1, 3)
+        demand = [(f"s{j}", rng.randint(1, 2)) for j in range(k)]
+        candidates = [rng.getrandbits(n) for _ in range(k)]
+        assigned = match_skills(demand, candidates)
+        assert (assigned is not None) == brute_force(demand, candidates, n)
+        if assigned is not None:
+            check(demand, candidates, assigned)
@@ -0,0 +1,57 @@
+# Cache des plannings : clé par contenu, taille sur disque bornée
+import sqlite3
+
+from main import instance
+from msrcpsp.cache import ScheduleCache, schedule_key
+from msrcpsp.instance import Instance
+from msrcpsp.runner import compute_schedule
+
+
+def test_key_follows_content():
+    key = schedule_key(instance, 'parallel', 'shortest')
+    assert key == schedule_key(instance, 'parallel', 'shortest')
+    assert key != schedule_key(instance, 'series', 'shortest')
+    team = [{'name': 'x', 'skills': ['dev']}]
+    a = Instance({'a': (2, {'dev': 1}, [], 1)}, team)
+    b = Instance({'a': (3, {'dev': 1}, [], 1)}, team)
+    assert schedule_key(a, 'parallel', 'shortest') != schedule_key(b, 'parallel', 'shortest')
+
+
+def test_disk_cache_reused_across_instances(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return compute_schedule(instance, 'parallel', 'shortest')
+
+    cache = ScheduleCache(path)
+    first = cache.schedule(instance, 'parallel', 'shortest', compute)
+    cache.close()
+    cache = ScheduleCache(path)
+    second = cache.schedule(instance, 'parallel', 'shortest', compute)
+    cache.close()
+    assert len(calls) == 1 and not first[3] and second[3]
+    assert second[:2] == first[:2]
+
+
+def test_size_bound_and_running_total(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = ScheduleCache(path, memory_items=0, max_bytes=3000)
+    for k in range(40):
+        cache.put(f"k{k}", ('x' * 500, k, 0.0))
+    cache.put('k39', ('x' * 200, 39, 0.0))      # remplacement
+    sizes, total = cache.db.execute("SELECT COALESCE(SUM(size), 0), "
+                                    "(SELECT value FROM meta WHERE name = 'bytes') "
+                                    "FROM schedules").fetchone()
+    assert sizes == total <= 3000
+    assert cache.get('k39')[1] == 39 and cache.get('k0') is None
+    cache.close()
+    # Base créée sans table meta : total recalculé à l'ouverture
+    db = sqlite3.connect(path)
+    db.execute("DROP TABLE meta")
+    db.commit()
+    db.close()
+    cache = ScheduleCache(path, max_bytes=3000)
+    assert cache.db.execute("SELECT value FROM meta").fetchone()[0] == sizes
+    cache.close()
@@ -0,0 +1,58 @@
+from msrcpsp.calendars import Availability
+from msrcpsp.instance import Instance
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms
+
+
+def starts(sched):
+    return {t: start for t, start, _, _ in sched}
+
+
+def test_availability_covers():
+    w = Availability([(0, 8), (8, 10), (24, None)])
+    assert w.covers(0, 10)
+    assert not w.covers(9, 12)
+    assert w.covers(30, 10 ** 9)
+    assert list(w.gaps())[0] == (10, 24)
+
+
+def test_tasks_wait_for_shift():
+    # L'unique employé n'arrive qu'à t=4 et part à t=10
+    team = [{'name': 'x', 'skills': ['dev'], 'availability': [(4, 10)]}]
+    inst = Instance({'a': (3, {'dev': 1}, [], 1), 'b': (3, {'dev': 1}, [], 1)}, team)
+    for algo in algorithms.values():
+        sched, makespan = algo(inst, priorities['shortest'])
+        assert sorted(starts(sched).values()) == [4, 7]
+        assert makespan == 10
+
+
+def test_milestone_starts_while_staff_busy():
+    # L'unique employé (avec calendrier) est pris par 'a' dès t=0 : le
+    # jalon et le nœud de précédence, sans demande, démarrent quand même
+    team = [{'name': 'x', 'skills': ['dev'], 'availability': [(0, 50)]}]
+    inst = Instance({
+        'a': (5, {'dev': 1}, [], 1),
+        'm': (0, {}, [], 1),
+        'p': (1, {}, [], 1),
+        'q': (2, {}, ['p'], 1),
+    }, team)
+    for algo in algorithms.values():
+        sched, makespan = algo(inst, priorities['longest'])
+        assert starts(sched) == {'a': 0, 'm': 0, 'p': 0, 'q': 1}
+        assert makespan == 5
+
+
+def test_zero_demand_chain_while_staff_busy():
+    # Toute l'équipe est occupée par une longue tâche : la chaîne de tâches
+    # sans demande se déroule sans attendre la fin de 'a'
+    team = [{'name': 'x', 'skills': ['dev'], 'availability': [(0, 8), (10, None)]}]
+    inst = Instance({
+        'a': (8, {'dev': 1}, [], 1),
+        'b': (2, {}, [], 1),
+        'c': (3, {}, ['b'], 1),
+        'd': (1, {'dev': 1}, ['c'], 1),
+    }, team)
+    for algo in algorithms.values():
+        sched, makespan = algo(inst, priorities['longest'])
+        assert starts(sched) == {'a': 0, 'b': 0, 'c': 2, 'd': 10}
+        assert makespan == 11
@@ -0,0 +1,52 @@
+# Rejet des instances impossibles et horloge sans attente à vide
+import pytest
+
+from msrcpsp.instance import Instance
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms
+
+TEAM = [
+    {'name': 'x', 'skills': ['dev', 'test']},
+    {'name': 'y', 'skills': ['dev']},
+]
+
+
+def test_missing_skill_reported():
+    inst = Instance({
+        'a': (1, {'dev': 1}, [], 1),
+        'b': (2, {'dev': 3}, ['a'], 1),
+        'c': (2, {'ops': 1}, [], 1),
+    }, TEAM)
+    assert [i for i, _ in inst.infeasible_tasks()] == [1, 2]
+    for algo in algorithms.values():
+        with pytest.raises(ValueError) as err:
+            algo(inst, priorities['shortest'])
+        message = str(err.value)
+        assert '2 tâche(s)' in message
+        assert 'b : dev 3 demandé(s) / 2 disponible(s)' in message
+        assert 'c : ops 1 demandé(s) / 0 disponible(s)' in message
+
+
+def test_distinct_employees_reported():
+    # Assez de dev et de test au total, mais x ne couvre qu'une compétence
+    # par tâche : 'a' demande 2 dev et 1 test à deux employés
+    inst = Instance({'a': (1, {'dev': 2, 'test': 1}, [], 1)}, TEAM)
+    with pytest.raises(ValueError, match="pas assez d'employés distincts pour dev:2, test:1"):
+        inst.check_feasibility()
+
+
+def test_feasible_instance_accepted():
+    inst = Instance({'a': (1, {'dev': 1, 'test': 1}, [], 1)}, TEAM)
+    inst.check_feasibility()
+    assert inst.infeasible_tasks() == []
+
+
+def test_no_idle_ticking_when_calendar_closes():
+    # L'employé part à t=10 : la troisième tâche ne peut jamais démarrer,
+    # l'ordonnancement s'arrête sur une erreur au lieu d'avancer d'une unité
+    # à la fois
+    team = [{'name': 'x', 'skills': ['dev'], 'availability': [(4, 10)]}]
+    inst = Instance({t: (3, {'dev': 1}, [], 1) for t in 'abc'}, team)
+    for algo in algorithms.values():
+        with pytest.raises(RuntimeError):
+            algo(inst, priorities['shortest'])
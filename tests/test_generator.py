@@ -0,0 +1,28 @@
+# Générateur d'instances : déterminisme et structure
+from msrcpsp.generator import generate
+
+
+def test_same_seed_same_instance():
+    a = generate(500, seed=7, shifts=(8, 16, 3))
+    b = generate(500, seed=7, shifts=(8, 16, 3))
+    assert a.fingerprint == b.fingerprint
+    assert a.employees == b.employees
+    assert generate(500, seed=8, shifts=(8, 16, 3)).fingerprint != a.fingerprint
+
+
+def test_layers_are_topological():
+    inst = generate(400, n_layers=10, avg_preds=2.5, span=2, seed=1)
+    for i in range(len(inst)):
+        assert all(p < i for p in inst.predecessors(i))
+    # Toutes les tâches hors première couche ont au moins un prédécesseur
+    assert all(len(inst.predecessors(i)) >= 1 for i in range(40, 400))
+    assert all(len(inst.predecessors(i)) == 0 for i in range(40))
+
+
+def test_default_team_covers_every_task():
+    inst = generate(300, n_skills=5, max_demand=3, seed=2)
+    assert inst.infeasible_tasks() == []
+    for i in range(len(inst)):
+        assert 1 <= len(inst.demand(i)) <= 2
+        assert all(1 <= c <= 3 for _, c in inst.demand(i))
+        assert 1 <= inst.durations[i] <= 10
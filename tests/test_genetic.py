@@ -0,0 +1,72 @@
+# Algorithme génétique : opérateurs compatibles avec les précédences,
+# décodage et budget de recherche
+import random
+
+from msrcpsp.generator import generate
+from msrcpsp.genetic import (crossover, decode, evolve, initial_population, mutate_employees,
+                             mutate_tasks, rule_list)
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms, makespan_of
+
+
+def respects_precedences(inst, tasks):
+    position = {i: p for p, i in enumerate(tasks)}
+    return (sorted(tasks) == list(range(len(inst)))
+            and all(position[p] < position[i] for i in range(len(inst)) for p in inst.predecessors(i)))
+
+
+def test_operators_keep_activity_lists_valid():
+    inst = generate(200, seed=4)
+    rng = random.Random(1)
+    population = initial_population(inst, 12, rng)
+    n_emp = len(inst.employees)
+    for tasks, employees in population:
+        assert respects_precedences(inst, tasks)
+        assert sorted(employees) == list(range(n_emp))
+    for _ in range(50):
+        (f_tasks, f_emps), (m_tasks, m_emps) = rng.sample(population, 2)
+        tasks = mutate_tasks(inst, crossover(f_tasks, m_tasks, rng), 0.3, rng)
+        employees = mutate_employees(crossover(f_emps, m_emps, rng), 0.3, rng)
+        assert respects_precedences(inst, tasks)
+        assert sorted(employees) == list(range(n_emp))
+
+
+def test_rule_genome_decodes_like_the_rule():
+    # Liste d'une règle, employés dans l'ordre de l'instance : même planning
+    # que l'algorithme série lancé avec la règle
+    from main import instance
+    for rule in priorities.values():
+        tasks = rule_list(instance, instance.priority_rank(rule))
+        assert respects_precedences(instance, tasks)
+        genome = (tasks, list(range(len(instance.employees))))
+        sched = instance.to_schedule(*decode(instance, genome, 'series'))
+        assert sched == algorithms['series'](instance, rule)[0]
+
+
+def test_permuted_employees_stay_valid():
+    from main import instance
+    employees = list(range(len(instance.employees)))[::-1]
+    tasks = list(instance.topo_order)
+    order, starts, ends, assignments = decode(instance, (tasks, employees))
+    for i, matched in enumerate(assignments):
+        emps = [e for group in matched for e in group]
+        assert len(emps) == len(set(emps))
+        for (s, _), group in zip(instance.demand(i), matched):
+            skill = instance.skill_names[s]
+            assert all(skill in instance.employees[e]['skills'] for e in group)
+
+
+def test_evolve_budget_and_seed():
+    inst = generate(60, seed=5)
+    best_rule = min(algorithms['parallel'](inst, rule)[1] for rule in priorities.values())
+    runs = [evolve(inst, population_size=10, max_evaluations=50, time_limit=None, workers=1, seed=3)
+            for _ in range(2)]
+    result = runs[0]
+    assert result['schedule'] == runs[1]['schedule']
+    assert result['evaluations'] <= 50 or result['makespan'] <= result['lower_bound']
+    assert result['lower_bound'] <= result['makespan'] <= best_rule
+    ends = {t: end for t, _, end, _ in result['schedule']}
+    assert makespan_of(ends.values()) == result['makespan']
+    starts = {t: start for t, start, _, _ in result['schedule']}
+    for i in range(len(inst)):
+        assert all(ends[inst.names[p]] <= starts[inst.names[i]] for p in inst.predecessors(i))
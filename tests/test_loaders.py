@@ -0,0 +1,96 @@
+# Lecture des formats d'instance et aller-retour par les écrivains
+import pytest
+
+from msrcpsp.loaders import load_instance
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms
+from msrcpsp.writers import write_instance
+
+IMOPSE = """\
+Project name:            test
+Tasks:                   3
+Resources:               2
+==========================================================
+ResourceID     Salary     Skills
+1              10.0       Q0: 2      Q1: 0
+2              12.0       Q1: 1
+==========================================================
+TaskID     Duration     Skill     Predecessor IDs
+1          4            Q0: 1
+2          3            Q1: 1     1
+3          2            Q1: 0     1 2
+"""
+
+PSPLIB = """\
+************************************************************************
+projects                      :  1
+jobs (incl. supersource/sink ):  4
+RESOURCES
+  - renewable                 :  2   R
+  - nonrenewable              :  1   N
+************************************************************************
+PRECEDENCE RELATIONS:
+jobnr.    #modes  #successors   successors
+   1        1          2           2   3
+   2        1          1           4
+   3        1          1           4
+   4        1          0
+************************************************************************
+REQUESTS/DURATIONS:
+jobnr. mode duration  R 1  R 2  N 1
+------------------------------------------------------------------------
+  1      1     0       0    0    0
+  2      1     5       2    0    3
+  3      1     3       1    1    0
+  4      1     0       0    0    0
+************************************************************************
+RESOURCEAVAILABILITIES:
+  R 1  R 2  N 1
+    2    1    9
+************************************************************************
+"""
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_imopse_skill_levels(tmp_path):
+    # Un employé de niveau m couvre les niveaux 0..m de la compétence
+    inst = load_instance(write(tmp_path, 'small.def', IMOPSE))
+    assert list(inst.names) == ['1', '2', '3']
+    assert [inst.skills(i) for i in range(3)] == [{'Q0:1': 1}, {'Q1:1': 1}, {'Q1:0': 1}]
+    assert [inst.names[p] for p in inst.predecessors(2)] == ['1', '2']
+    assert inst.employees[0] == {'name': 'R1', 'skills': ['Q0:0', 'Q0:1', 'Q0:2', 'Q1:0']}
+    assert inst.employees[1] == {'name': 'R2', 'skills': ['Q1:0', 'Q1:1']}
+    sched, makespan = algorithms['parallel'](inst, priorities['shortest'])
+    assert makespan == 9
+
+
+def test_psplib_renewable_resources(tmp_path):
+    # Capacité c -> c employés mono-compétence ; la ressource N est ignorée
+    inst = load_instance(write(tmp_path, 'small.sm', PSPLIB))
+    assert [e['name'] for e in inst.employees] == ['R1_1', 'R1_2', 'R2_1']
+    assert [inst.skills(i) for i in range(4)] == [{}, {'R1': 2}, {'R1': 1, 'R2': 1}, {}]
+    assert [inst.names[p] for p in inst.predecessors(3)] == ['2', '3']
+    sched, makespan = algorithms['parallel'](inst, priorities['shortest'])
+    assert makespan == 8
+
+
+@pytest.mark.parametrize('ext', ['.json', '.csv', '.msrb'])
+def test_round_trip(tmp_path, ext):
+    from main import instance
+    path = str(tmp_path / f"assurance{ext}")
+    write_instance(instance, path)
+    loaded = load_instance(path)
+    assert loaded.fingerprint == instance.fingerprint
+    assert loaded.employees == instance.employees
+    for rule in ('shortest', 'important'):
+        assert algorithms['parallel'](loaded, priorities[rule]) == algorithms['parallel'](instance, priorities[rule])
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        load_instance(write(tmp_path, 'small.txt', ''))
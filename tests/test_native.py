@@ -0,0 +1,78 @@
+# Parité des moteurs Python (msrcpsp.schedulers) et C++ (msrcpsp.native) :
+# mêmes plannings (tâche, début, fin, employés) et mêmes makespans
+import random
+
+import pytest
+
+from msrcpsp import native
+from msrcpsp.generator import generate
+from msrcpsp.instance import InstanceBuilder
+from msrcpsp.loaders import load_instance
+from msrcpsp.models import MODELS, with_model
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms, decoders
+
+pytestmark = pytest.mark.skipif(not native.available(), reason="moteur natif indisponible (compilateur C++)")
+
+
+def with_milestones(inst, every=4):
+    # Une tâche sur `every` sans demande (jalon ou nœud de précédence),
+    # une sur 2 * `every` de durée nulle
+    builder = InstanceBuilder(f"{inst.name}_milestones")
+    for i, name in enumerate(inst.names):
+        builder.add_task(name, 0 if i % (2 * every) == 0 else inst.durations[i],
+                         {} if i % every == 0 else inst.skills(i),
+                         [inst.names[p] for p in inst.predecessors(i)], inst.importance[i])
+    for emp in inst.employees:
+        builder.add_employee(emp['name'], emp['skills'])
+    return builder.build()
+
+
+INSTANCES = {
+    'assurance': load_instance('instances/assurance.json'),
+    'gen_300': generate(300, seed=1),
+    'gen_400_wide': generate(400, seed=2, n_employees=150),    # plusieurs mots de 64 bits
+    'gen_300_milestones': with_milestones(generate(300, seed=3)),
+}
+
+
+@pytest.mark.parametrize('name', list(INSTANCES))
+@pytest.mark.parametrize('model', MODELS)
+@pytest.mark.parametrize('algo', list(algorithms))
+def test_same_schedules(name, model, algo):
+    inst = with_model(INSTANCES[name], model)
+    for prio, rule in priorities.items():
+        sched, makespan = algorithms[algo](inst, rule)
+        native_sched, native_makespan = native.algorithms[f"native_{algo}"](inst, rule)
+        assert native_makespan == makespan, (prio, makespan, native_makespan)
+        assert native_sched == sched, prio
+
+
+@pytest.mark.parametrize('algo', list(decoders))
+def test_same_schedules_with_permuted_pool(algo):
+    # Ordre de préférence des employés tiré au hasard (décodeur génétique)
+    inst = INSTANCES['gen_400_wide']
+    rng = random.Random(0)
+    order = list(range(len(inst.pool.names)))
+    rng.shuffle(order)
+    pool = inst.pool.permuted(order)
+    rank = inst.priority_rank(priorities['latest_finish'])
+    expected = decoders[algo](inst, rank, pool=pool)
+    got = native.native_decoders[algo](inst, rank, pool=pool)
+    assert list(got[0]) == list(expected[0])
+    assert list(got[1]) == list(expected[1])
+    assert list(got[2]) == list(expected[2])
+    assert got[3] == expected[3]
+
+
+def test_zero_demand_tasks_start_while_staff_busy():
+    inst = InstanceBuilder('milestone')
+    inst.add_task('a', 5, {'dev': 1})
+    inst.add_task('m', 0, {})
+    inst.add_task('b', 1, {'dev': 1}, ['m'])
+    inst.add_employee('x', ['dev'])
+    inst = inst.build()
+    for algo in algorithms:
+        sched, makespan = native.algorithms[f"native_{algo}"](inst, priorities['longest'])
+        assert {t: s for t, s, _, _ in sched} == {'a': 0, 'm': 0, 'b': 5}
+        assert makespan == 6
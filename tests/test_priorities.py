@@ -0,0 +1,31 @@
+# Règles de priorité fondées sur le graphe de précédence
+from msrcpsp.instance import Instance
+from msrcpsp.priorities import priorities
+
+TEAM = [{'name': 'x', 'skills': ['dev']}]
+
+
+def test_total_successors_counts_paths():
+    # Arbre : compte exact ; losange : d atteint par deux chemins depuis a
+    inst = Instance({
+        'a': (1, {'dev': 1}, [], 1),
+        'b': (1, {'dev': 1}, ['a'], 1),
+        'c': (1, {'dev': 1}, ['a'], 1),
+        'd': (1, {'dev': 1}, ['b', 'c'], 1),
+        'e': (1, {'dev': 1}, [], 1),
+        'f': (1, {'dev': 1}, ['e'], 1),
+    }, TEAM)
+    counts = dict(zip(inst.names, inst.n_total_successors))
+    assert counts == {'a': 4, 'b': 1, 'c': 1, 'd': 0, 'e': 1, 'f': 0}
+    assert priorities['total_successors'](inst) == [-4, -1, -1, 0, -1, 0]
+
+
+def test_total_successors_capped():
+    # Échelle de losanges : le nombre de chemins double à chaque étage
+    tasks = {'t0': (1, {'dev': 1}, [], 1)}
+    for k in range(1, 40):
+        tasks[f"l{k}"] = (1, {'dev': 1}, [f"t{k - 1}"], 1)
+        tasks[f"r{k}"] = (1, {'dev': 1}, [f"t{k - 1}"], 1)
+        tasks[f"t{k}"] = (1, {'dev': 1}, [f"l{k}", f"r{k}"], 1)
+    inst = Instance(tasks, TEAM)
+    assert max(inst.n_total_successors) == len(inst)
@@ -0,0 +1,62 @@
+# StaffProfile.earliest (index commun et sauts) contre une recherche
+# exhaustive instant par instant
+import random
+
+from msrcpsp.calendars import FOREVER
+from msrcpsp.pool import EmployeePool
+from msrcpsp.profile import StaffProfile
+
+SKILLS = ['dev', 'test', 'ops']
+
+
+def brute_force(profile, demand, ready, duration, movable=None, horizon=400):
+    pool = profile.pool
+    for t in range(ready, horizon):
+        free = 0
+        for e, timeline in enumerate(profile.timelines):
+            if timeline.blocked_until(t, t + duration, movable) is None:
+                free |= 1 << e
+        matched = pool.assign(demand, free)
+        if matched is not None:
+            return t, matched
+    return None, None
+
+
+def random_profile(rng, n_employees):
+    team = [{'name': f"e{k}", 'skills': rng.sample(SKILLS, rng.randint(1, 2))} for k in range(n_employees)]
+    pool = EmployeePool(team, {s: k for k, s in enumerate(SKILLS)})
+    profile = StaffProfile(pool)
+    for owner in range(6 * n_employees):
+        e = rng.randrange(n_employees)
+        start = rng.randrange(200)
+        end = start + rng.choice([1, 2, 3, 5, 8, 30])
+        if profile.timelines[e].blocked_until(start, end) is None:
+            profile.reserve([[e]], start, end, owner)
+    for _ in range(n_employees):
+        start = rng.randrange(200)
+        profile.block(rng.randrange(n_employees), start, start + rng.randint(1, 60))
+    return profile
+
+
+def test_earliest_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(30):
+        profile = random_profile(rng, rng.choice([3, 8, 20]))
+        for _ in range(20):
+            demand = [(s, rng.randint(1, 2)) for s in rng.sample(range(len(SKILLS)), rng.randint(1, 2))]
+            ready, duration = rng.randrange(150), rng.choice([0, 1, 4, 9])
+            movable = rng.choice([None, lambda o: o >= 0 and o % 3 == 0])
+            assert profile.earliest(demand, ready, duration, movable) == \
+                brute_force(profile, demand, ready, duration, movable)
+
+
+def test_earliest_after_removal_and_without_slot():
+    pool = EmployeePool([{'name': 'x', 'skills': ['dev']}])
+    profile = StaffProfile(pool)
+    profile.reserve([[0]], 0, 10, 1)
+    assert profile.earliest([(0, 1)], 0, 5) == (10, [[0]])
+    profile.remove([[0]], 0, 10, 1)
+    assert profile.earliest([(0, 1)], 0, 5) == (0, [[0]])
+    profile.block(0, 3, FOREVER)
+    assert profile.earliest([(0, 1)], 0, 5) == (None, None)
+    assert profile.earliest([(0, 1)], 0, 3) == (0, [[0]])
@@ -0,0 +1,85 @@
+# Replanification : après chaque événement, précédences, employés et
+# absences sont respectés, et les tâches commencées ne bougent pas
+import random
+
+import pytest
+
+from msrcpsp.generator import generate
+from msrcpsp.instance import Instance
+from msrcpsp.rescheduling import Rescheduler
+
+TEAM = [{'name': 'X', 'skills': ['dev']}]
+
+
+def check(r, absences, frozen):
+    # absences : (employé, début, fin, instant de la déclaration)
+    # frozen   : tâche -> (début, fin, affectation) des tâches commencées
+    n = len(r.names)
+    for i in range(n):
+        assert r.starts[i] is not None and r.starts[i] >= 0
+        assert r.ends[i] == r.starts[i] + r.durations[i]
+        for p in r.preds[i]:
+            assert r.starts[i] >= r.ends[p], (r.names[p], r.names[i])
+        assert [len(emps) for emps in r.assignments[i]] == [c for _, c in r.demands[i]]
+        for (s, _), emps in zip(r.demands[i], r.assignments[i]):
+            assert all(r.pool.skill_masks[s] >> e & 1 for e in emps)
+    busy = {}
+    for i in range(n):
+        if r.ends[i] > r.starts[i]:
+            for e in {e for emps in r.assignments[i] for e in emps}:
+                busy.setdefault(e, []).append((r.starts[i], r.ends[i], i))
+    for e, intervals in busy.items():
+        intervals.sort()
+        for (_, end, i), (start, _, j) in zip(intervals, intervals[1:]):
+            assert end <= start, f"{r.pool.names[e]} : {r.names[i]} et {r.names[j]} se chevauchent"
+        for a_e, a_start, a_end, declared in absences:
+            if a_e == e:
+                for start, end, i in intervals:
+                    # Seule une tâche déjà commencée peut chevaucher l'absence
+                    assert end <= a_start or start >= a_end or start < declared, r.names[i]
+    for i, placed in frozen.items():
+        assert (r.starts[i], r.ends[i], r.assignments[i]) == placed or r.durations[i] != placed[1] - placed[0]
+    for timeline in r.profile.timelines:
+        assert all(a <= b for a, b in zip(timeline.ends, timeline.starts[1:]))
+
+
+def test_running_task_cannot_extend_into_absence():
+    inst = Instance({'a': (4, {'dev': 1}, [], 1), 'b': (3, {'dev': 1}, [], 1)}, TEAM)
+    r = Rescheduler(inst)
+    r.advance(1)
+    r.add_unavailability('X', 5, 8)
+    with pytest.raises(ValueError):
+        r.update_duration('a', 7)
+    timeline = r.profile.timelines[0]
+    assert all(a <= b for a, b in zip(timeline.ends, timeline.starts[1:]))
+    assert r.ends[0] == 4
+
+
+@pytest.mark.parametrize('algo', ['series', 'parallel'])
+def test_random_events_keep_schedule_valid(algo):
+    inst = generate(300, seed=7)
+    r = Rescheduler(inst, algo=algo)
+    rng = random.Random(1)
+    absences = []
+    check(r, absences, {})
+    for step in range(80):
+        r.advance(r.now + rng.randint(0, 8))
+        frozen = {i: (r.starts[i], r.ends[i], r.assignments[i])
+                  for i in range(len(r.names)) if r.started(i)}
+        event = rng.random()
+        try:
+            if event < 0.4:
+                task = r.names[rng.randrange(len(r.names))]
+                r.update_duration(task, rng.randint(1, 15))
+            elif event < 0.75:
+                e = rng.randrange(len(r.pool.names))
+                start = r.now + rng.randint(0, 40)
+                end = start + rng.randint(1, 20)
+                r.add_unavailability(r.pool.names[e], start, end)
+                absences.append((e, max(start, r.now), end, r.now))
+            else:
+                preds = rng.sample(r.names, 2)
+                r.add_task(f"new{step}", rng.randint(1, 9), {inst.skill_names[step % 3]: 1}, preds)
+        except ValueError:
+            pass
+        check(r, absences, frozen)
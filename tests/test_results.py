@@ -0,0 +1,45 @@
+# Relancer sur le même fichier de résultats ajoute, quel que soit le format
+import csv
+
+import pytest
+
+from msrcpsp.results import open_sink, result_files, tasks_path
+
+ROW = {'instance': 'demo', 'algo': 'parallel', 'priority': 'shortest', 'seed': 0,
+       'makespan': 6, 'duration_sec': 0.001}
+SCHEDULE = [('a', 0, 5, {'dev': ['x']}), ('b', 5, 6, {})]
+
+
+def write_run(path):
+    sink = open_sink(path)
+    sink.add(ROW, SCHEDULE)
+    sink.close()
+
+
+def test_csv_rerun_appends(tmp_path):
+    path = str(tmp_path / 'results.csv')
+    write_run(path)
+    write_run(path)
+    with open(path, newline='', encoding='utf-8') as f:
+        assert len(list(csv.reader(f))) == 1 + 2
+    with open(tasks_path(path), newline='', encoding='utf-8') as f:
+        assert len(list(csv.reader(f))) == 1 + 4
+    assert result_files(path) == [path]
+
+
+def test_result_files_in_run_order(tmp_path):
+    path = str(tmp_path / 'results.parquet')
+    for name in ['results.parquet', 'results.10.parquet', 'results.2.parquet', 'results.1.parquet',
+                 'results_tasks.parquet', 'results.old.parquet']:
+        (tmp_path / name).touch()
+    assert result_files(path) == [path] + [str(tmp_path / f"results.{k}.parquet") for k in (1, 2, 10)]
+
+
+@pytest.mark.parametrize('ext', ['.parquet', '.arrow'])
+def test_arrow_rerun_adds_part(tmp_path, ext):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / f"results{ext}")
+    write_run(path)
+    write_run(path)
+    assert result_files(path) == [path, str(tmp_path / f"results.1{ext}")]
+    assert result_files(tasks_path(path)) == [tasks_path(path), str(tmp_path / f"results_tasks.1{ext}")]
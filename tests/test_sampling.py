@@ -0,0 +1,44 @@
+# Échantillonnage biaisé : listes compatibles avec les précédences, tirage
+# reproductible et loi (worst - rang + 1) ** alpha parmi les éligibles
+import random
+
+import pytest
+
+from msrcpsp.generator import generate
+from msrcpsp.priorities import priorities
+from msrcpsp.sampling import _sample_by_scan, sample, sample_activity_list
+
+
+@pytest.mark.parametrize('alpha', [0, 1, 2, 0.5])
+def test_activity_list_respects_precedences(alpha):
+    inst = generate(500, seed=1)
+    rank = inst.priority_rank(priorities['latest_finish'])
+    position = sample_activity_list(inst, rank, random.Random(3), alpha)
+    assert sorted(position) == list(range(len(inst)))
+    for i in range(len(inst)):
+        assert all(position[p] < position[i] for p in inst.predecessors(i))
+    assert position == sample_activity_list(inst, rank, random.Random(3), alpha)
+
+
+def test_draws_follow_regret_weights():
+    # Position moyenne de chaque tâche : la même qu'avec le calcul direct
+    # des poids sur la liste des éligibles
+    inst = generate(20, seed=2)
+    rank = inst.priority_rank(priorities['shortest'])
+    n_draws = 4000
+    means = []
+    for sampler in (sample_activity_list, _sample_by_scan):
+        rng = random.Random(0)
+        totals = [0] * len(inst)
+        for _ in range(n_draws):
+            for i, p in enumerate(sampler(inst, rank, rng, 2)):
+                totals[i] += p
+        means.append([t / n_draws for t in totals])
+    assert max(abs(a - b) for a, b in zip(*means)) < 0.3
+
+
+def test_sample_needs_a_pass():
+    inst = generate(20, seed=0)
+    with pytest.raises(ValueError):
+        sample(inst, passes=0, workers=1)
+    assert sample(inst, passes=3, workers=1)['passes'] >= 1
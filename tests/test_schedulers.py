@@ -0,0 +1,195 @@
+from msrcpsp.engine import run_parallel
+from msrcpsp.instance import Instance
+from msrcpsp.priorities import priorities
+from msrcpsp.schedulers import algorithms, makespan_of
+
+TEAM = [{'name': 'x', 'skills': ['dev']}]
+
+
+EXPECTED = {
+    ('parallel', 'shortest'): {
+        'users': (0, 3, {'dev': ('Nezihe',)}),
+        'assureurs': (0, 2, {'dev': ('Zeiny',)}),
+        'client': (3, 6, {'dev': ('Nezihe',)}),
+        'message': (3, 5, {'dev': ('Zeiny',)}),
+        'document': (6, 9, {'dev': ('Zeiny', 'Nezihe')}),
+        'offres': (9, 13, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (13, 18, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'paiement': (18, 21, {'dev': ('Nezihe',), 'test': ('Mli7a',)}),
+        'echange': (18, 20, {'dev': ('Zeiny',)}),
+        'reclamation': (20, 24, {'dev': ('Zeiny',)}),
+        'notification': (21, 23, {'dev': ('Nezihe',)}),
+        'renouvellement': (24, 28, {'dev': ('Zeiny', 'Nezihe')}),
+    },
+    ('parallel', 'longest'): {
+        'users': (0, 3, {'dev': ('Zeiny',)}),
+        'assureurs': (0, 2, {'dev': ('Nezihe',)}),
+        'offres': (3, 7, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (7, 12, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'paiement': (12, 15, {'dev': ('Nezihe',), 'test': ('Mli7a',)}),
+        'reclamation': (12, 16, {'dev': ('Zeiny',)}),
+        'client': (15, 18, {'dev': ('Nezihe',)}),
+        'notification': (16, 18, {'dev': ('Zeiny',)}),
+        'renouvellement': (18, 22, {'dev': ('Zeiny', 'Nezihe')}),
+        'document': (22, 25, {'dev': ('Zeiny', 'Nezihe')}),
+        'echange': (25, 27, {'dev': ('Zeiny',)}),
+        'message': (25, 27, {'dev': ('Nezihe',)}),
+    },
+    ('parallel', 'most_successors'): {
+        'users': (0, 3, {'dev': ('Zeiny',)}),
+        'assureurs': (0, 2, {'dev': ('Nezihe',)}),
+        'offres': (3, 7, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (7, 12, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'paiement': (12, 15, {'dev': ('Zeiny',), 'test': ('Mli7a',)}),
+        'reclamation': (12, 16, {'dev': ('Nezihe',)}),
+        'notification': (15, 17, {'dev': ('Zeiny',)}),
+        'client': (16, 19, {'dev': ('Nezihe',)}),
+        'echange': (17, 19, {'dev': ('Zeiny',)}),
+        'document': (19, 22, {'dev': ('Zeiny', 'Nezihe')}),
+        'message': (22, 24, {'dev': ('Zeiny',)}),
+        'renouvellement': (24, 28, {'dev': ('Zeiny', 'Nezihe')}),
+    },
+    ('parallel', 'important'): {
+        'users': (0, 3, {'dev': ('Zeiny',)}),
+        'assureurs': (0, 2, {'dev': ('Nezihe',)}),
+        'document': (3, 6, {'dev': ('Zeiny', 'Nezihe')}),
+        'client': (6, 9, {'dev': ('Nezihe',)}),
+        'message': (6, 8, {'dev': ('Zeiny',)}),
+        'offres': (9, 13, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (13, 18, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'renouvellement': (18, 22, {'dev': ('Zeiny', 'Nezihe')}),
+        'paiement': (22, 25, {'dev': ('Nezihe',), 'test': ('Mli7a',)}),
+        'reclamation': (22, 26, {'dev': ('Zeiny',)}),
+        'notification': (25, 27, {'dev': ('Nezihe',)}),
+        'echange': (26, 28, {'dev': ('Zeiny',)}),
+    },
+    ('series', 'shortest'): {
+        'users': (0, 3, {'dev': ('Nezihe',)}),
+        'assureurs': (0, 2, {'dev': ('Zeiny',)}),
+        'client': (3, 6, {'dev': ('Nezihe',)}),
+        'message': (3, 5, {'dev': ('Zeiny',)}),
+        'document': (6, 9, {'dev': ('Zeiny', 'Nezihe')}),
+        'offres': (9, 13, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (13, 18, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'paiement': (18, 21, {'dev': ('Nezihe',), 'test': ('Mli7a',)}),
+        'echange': (18, 20, {'dev': ('Zeiny',)}),
+        'notification': (21, 23, {'dev': ('Zeiny',)}),
+        'reclamation': (21, 25, {'dev': ('Nezihe',)}),
+        'renouvellement': (25, 29, {'dev': ('Zeiny', 'Nezihe')}),
+    },
+    ('series', 'longest'): {
+        'users': (0, 3, {'dev': ('Zeiny',)}),
+        'assureurs': (0, 2, {'dev': ('Nezihe',)}),
+        'client': (3, 6, {'dev': ('Zeiny',)}),
+        'message': (3, 5, {'dev': ('Nezihe',)}),
+        'offres': (6, 10, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (10, 15, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'paiement': (15, 18, {'dev': ('Nezihe',), 'test': ('Mli7a',)}),
+        'reclamation': (15, 19, {'dev': ('Zeiny',)}),
+        'renouvellement': (19, 23, {'dev': ('Zeiny', 'Nezihe')}),
+        'document': (23, 26, {'dev': ('Zeiny', 'Nezihe')}),
+        'notification': (26, 28, {'dev': ('Zeiny',)}),
+        'echange': (26, 28, {'dev': ('Nezihe',)}),
+    },
+    ('series', 'most_successors'): {
+        'users': (0, 3, {'dev': ('Zeiny',)}),
+        'assureurs': (0, 2, {'dev': ('Nezihe',)}),
+        'offres': (3, 7, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (7, 12, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'paiement': (12, 15, {'dev': ('Zeiny',), 'test': ('Mli7a',)}),
+        'reclamation': (12, 16, {'dev': ('Nezihe',)}),
+        'notification': (15, 17, {'dev': ('Zeiny',)}),
+        'client': (16, 19, {'dev': ('Nezihe',)}),
+        'echange': (17, 19, {'dev': ('Zeiny',)}),
+        'document': (19, 22, {'dev': ('Zeiny', 'Nezihe')}),
+        'message': (22, 24, {'dev': ('Zeiny',)}),
+        'renouvellement': (24, 28, {'dev': ('Zeiny', 'Nezihe')}),
+    },
+    ('series', 'important'): {
+        'users': (0, 3, {'dev': ('Zeiny',)}),
+        'assureurs': (0, 2, {'dev': ('Nezihe',)}),
+        'document': (3, 6, {'dev': ('Zeiny', 'Nezihe')}),
+        'message': (6, 8, {'dev': ('Zeiny',)}),
+        'offres': (8, 12, {'dev': ('Zeiny', 'Nezihe')}),
+        'contrats': (12, 17, {'dev': ('Zeiny', 'Nezihe'), 'test': ('Mli7a',)}),
+        'renouvellement': (17, 21, {'dev': ('Zeiny', 'Nezihe')}),
+        'paiement': (21, 24, {'dev': ('Nezihe',), 'test': ('Mli7a',)}),
+        'reclamation': (21, 25, {'dev': ('Zeiny',)}),
+        'notification': (24, 26, {'dev': ('Nezihe',)}),
+        'client': (25, 28, {'dev': ('Zeiny',)}),
+        'echange': (26, 28, {'dev': ('Nezihe',)}),
+    },
+}
+
+
+def starts(sched):
+    return {t: start for t, start, _, _ in sched}
+
+
+def test_milestone_starts_while_staff_busy():
+    # 'a' (priorité longest) occupe le seul employé ; le jalon 'm' et le
+    # nœud de précédence 'p' ne demandent personne et démarrent à t=0
+    inst = Instance({
+        'a': (5, {'dev': 1}, [], 1),
+        'm': (0, {}, [], 1),
+        'p': (2, {}, [], 1),
+        'b': (1, {'dev': 1}, ['m', 'p'], 1),
+    }, TEAM)
+    for algo in algorithms.values():
+        sched, makespan = algo(inst, priorities['longest'])
+        assert starts(sched)['m'] == 0
+        assert starts(sched)['p'] == 0
+        assert starts(sched)['b'] == 5
+        assert makespan == 6
+
+
+def test_instance_without_employees():
+    inst = Instance({
+        'a': (2, {}, [], 1),
+        'b': (3, {}, ['a'], 1),
+        'c': (1, {}, [], 1),
+    }, [])
+    for algo in algorithms.values():
+        sched, makespan = algo(inst, priorities['shortest'])
+        assert starts(sched) == {'a': 0, 'b': 2, 'c': 0}
+        assert makespan == 5
+
+
+def as_table(sched):
+    return {t: (start, end, {skill: tuple(emps) for skill, emps in assigned.items()})
+            for t, start, end, assigned in sched}
+
+
+def test_bundled_instance_unchanged():
+    # Plannings complets (début, fin, affectation) de l'instance livrée pour
+    # les 4 règles d'origine : en parallèle, ceux de la version de départ,
+    # égalités départagées dans l'ordre de déclaration ; en série, ceux du
+    # SGS série avec profils d'occupation
+    from main import instance
+    for (algo, rule), expected in EXPECTED.items():
+        sched, makespan = algorithms[algo](instance, priorities[rule])
+        assert as_table(sched) == expected, (algo, rule)
+        assert makespan == max(end for _, end, _ in expected.values())
+
+
+def test_blocked_demand_not_retried():
+    # Un seul développeur, pris par `a` : les 100 tâches dev en attente ne
+    # coûtent qu'un essai par événement, pas un par tâche
+    tasks = {'a': (10, {'dev': 1}, [], 1)}
+    for k in range(100):
+        tasks[f"d{k}"] = (1, {'dev': 1}, [], 1)
+        tasks[f"o{k}"] = (1, {'ops': 1}, [], 1)
+    inst = Instance(tasks, TEAM + [{'name': 'y', 'skills': ['ops']}])
+    pool = inst.pool.copy()
+    calls = []
+
+    def acquire(i, time_now):
+        calls.append(i)
+        return pool.claim(inst.demand(i))
+
+    order, starts, ends, _ = run_parallel(inst, inst.priority_rank(priorities['longest']), acquire,
+                                          pool.release, saturated=lambda: not pool.free)
+    assert makespan_of(ends) == 110
+    assert len(calls) < 3 * len(inst)
+    sched, makespan = algorithms['parallel'](inst, priorities['longest'])
+    assert makespan == 110 and [t for t, _, _, _ in sched] == [inst.names[i] for i in order]
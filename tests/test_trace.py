@@ -0,0 +1,37 @@
+# Journal d'événements : un planning justifié (algo+fbi) est rejoué tel quel
+from main import instance
+from msrcpsp.runner import compute_schedule
+from msrcpsp.trace import FINISH, START, EventLog
+
+
+def events_by_task(trace, inst):
+    starts, finishes = {}, {}
+    for kind, time, task, assignment in trace:
+        name = inst.names[task]
+        if kind == START:
+            assert name not in starts
+            starts[name] = (time, inst.assigned_names(task, assignment))
+        else:
+            assert kind == FINISH and name in starts and name not in finishes
+            finishes[name] = time
+    return starts, finishes
+
+
+def test_justified_trace_matches_schedule():
+    for algo in ('parallel', 'series'):
+        trace = EventLog()
+        sched, makespan = compute_schedule(instance, f"{algo}+fbi", 'shortest', trace)
+        assert len(trace) == 2 * len(sched)
+        starts, finishes = events_by_task(trace, instance)
+        assert starts == {t: (start, assigned) for t, start, _, assigned in sched}
+        assert finishes == {t: end for t, _, end, _ in sched}
+        assert max(finishes.values()) == makespan
+        times = [time for _, time, _, _ in trace]
+        assert times == sorted(times)
+
+
+def test_trace_without_justification_unchanged():
+    trace = EventLog()
+    sched, _ = compute_schedule(instance, 'parallel', 'shortest', trace)
+    starts, finishes = events_by_task(trace, instance)
+    assert starts == {t: (start, assigned) for t, start, _, assigned in sched}